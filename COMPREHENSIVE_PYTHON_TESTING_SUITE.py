@@ -24,13 +24,140 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import threading
+import queue
+import argparse
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 import psutil
 import pymongo
 import redis
+from suite_helpers import NDJSONResultSink, timed_request
+
+# Collects Navigation Timing, paint, Web Vitals and resource totals for the
+# current page once its load event has finished. LCP and layout shifts are
+# only exposed to buffered PerformanceObservers, so the script is asynchronous.
+PAGE_METRICS_SCRIPT = """
+const done = arguments[arguments.length - 1];
+// loadEventEnd stays 0 until the load handlers return, which can be after
+// readyState is already complete; poll for it for up to 5s (load is null after that)
+const deadline = Date.now() + 5000;
+const loadEnded = () => {
+    const entry = performance.getEntriesByType('navigation')[0];
+    return (entry ? entry.loadEventEnd : performance.timing.loadEventEnd) > 0;
+};
+const collect = () => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const legacy = performance.timing;
+    const start = nav ? nav.startTime : legacy.navigationStart;
+    const rel = (value) => (value ? value - (nav ? 0 : legacy.navigationStart) : null);
+    const metrics = {
+        ttfb: nav ? nav.responseStart - start : legacy.responseStart - legacy.navigationStart,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd : rel(legacy.domContentLoadedEventEnd),
+        load: nav ? nav.loadEventEnd || null : rel(legacy.loadEventEnd),
+        document_bytes: nav ? nav.transferSize : null,
+        fcp: null,
+        lcp: null,
+        cls: 0
+    };
+    const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    if (fcp) metrics.fcp = fcp.startTime;
+    const resources = performance.getEntriesByType('resource');
+    metrics.resource_count = resources.length;
+    metrics.resource_transfer_bytes = resources.reduce((sum, r) => sum + (r.transferSize || 0), 0);
+    metrics.resource_decoded_bytes = resources.reduce((sum, r) => sum + (r.decodedBodySize || 0), 0);
+    try {
+        new PerformanceObserver((list) => {
+            const entries = list.getEntries();
+            if (entries.length) metrics.lcp = entries[entries.length - 1].startTime;
+        }).observe({type: 'largest-contentful-paint', buffered: true});
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) {
+                if (!entry.hadRecentInput) metrics.cls += entry.value;
+            }
+        }).observe({type: 'layout-shift', buffered: true});
+    } catch (e) {}
+    setTimeout(() => done(metrics), 100);
+};
+const waitForLoad = () => (loadEnded() || Date.now() > deadline ? collect() : setTimeout(waitForLoad, 50));
+waitForLoad();
+"""
+
+# Page metrics summarized per route
+PAGE_METRIC_NAMES = ["ttfb", "fcp", "lcp", "dom_content_loaded", "load", "cls",
+                     "resource_count", "resource_transfer_bytes", "document_bytes"]
+
+def create_pooled_session(pool_size):
+    """requests.Session whose connection pool can serve pool_size threads at once"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    rank = max(1, -(-len(values) * pct // 100))
+    return values[int(rank) - 1]
+
+def summarize_page_metrics(visits):
+    """p50/p90/max of each page metric over repeated visits"""
+    summary = {}
+    for name in PAGE_METRIC_NAMES:
+        values = [visit.get(name) for visit in visits]
+        if any(v is not None for v in values):
+            summary[name] = {
+                "p50": percentile(values, 50),
+                "p90": percentile(values, 90),
+                "max": percentile(values, 100)
+            }
+    return summary
+
+def page_bytes(metrics):
+    """Bytes transferred for the document plus its subresources"""
+    return (metrics.get("document_bytes") or 0) + (metrics.get("resource_transfer_bytes") or 0)
+
+def cache_delta(cold, warm_summary):
+    """Compare a cold visit against the median warm revisit"""
+    warm_load = warm_summary.get("load", {}).get("p50")
+    warm_bytes = ((warm_summary.get("resource_transfer_bytes", {}).get("p50") or 0)
+                  + (warm_summary.get("document_bytes", {}).get("p50") or 0))
+    return {
+        "cold_load": cold.get("load"),
+        "warm_load": warm_load,
+        "delta_ms": cold["load"] - warm_load if cold.get("load") is not None and warm_load is not None else None,
+        "cold_bytes": page_bytes(cold),
+        "warm_bytes": warm_bytes
+    }
+
+class SinkCategory:
+    """List-like view of one result category backed by an NDJSONResultSink"""
+    
+    def __init__(self, sink, category):
+        self.sink = sink
+        self.category = category
+        self.count = 0
+    
+    def append(self, record):
+        self.sink.write({"category": self.category, "record": record})
+        self.count += 1
+    
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+    
+    def __iter__(self):
+        """Yield the records of this category by re-reading the sink"""
+        return (entry["record"] for entry in self.sink if entry["category"] == self.category)
+    
+    def __len__(self):
+        return self.count
 
 class MewayzComprehensiveTester:
-    def __init__(self):
+    def __init__(self, results_file=None, browser_pool_size=4, page_visits=1, http_workers=16):
         self.base_url = "http://localhost:3000"
         self.api_url = "http://localhost:5000"
         self.test_results = {
@@ -43,27 +170,109 @@ class MewayzComprehensiveTester:
             "errors": [],
             "summary": {}
         }
+        # Optionally stream every record to disk to keep memory bounded
+        self.sink = NDJSONResultSink(results_file) if results_file else None
+        if self.sink:
+            for category, records in self.test_results.items():
+                if isinstance(records, list):
+                    self.test_results[category] = SinkCategory(self.sink, category)
         self.driver = None
-        self.start_time = time.time()
+        self.browser_pool_size = max(1, browser_pool_size)
+        self.page_visits = max(1, page_visits)
+        # Endpoint sweeps run on a bounded thread pool sharing one pooled session
+        self.http_workers = max(1, http_workers)
+        self.session = create_pooled_session(self.http_workers)
+        self.start_time = time.perf_counter()
         
-    def setup_browser(self):
-        """Setup Chrome browser for testing"""
-        print("🔧 Setting up Chrome browser for testing...")
+    def create_driver(self):
+        """Create a headless Chrome driver"""
         chrome_options = Options()
         chrome_options.add_argument("--headless")  # Run in background
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--window-size=1920,1080")
         
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.implicitly_wait(10)
+        driver.set_script_timeout(10)
+        return driver
+    
+    def setup_browser(self):
+        """Setup Chrome browser for testing"""
+        print("🔧 Setting up Chrome browser for testing...")
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.implicitly_wait(10)
+            self.driver = self.create_driver()
             print("✅ Browser setup successful")
             return True
         except Exception as e:
             print(f"❌ Browser setup failed: {e}")
             return False
     
+    def wait_for_page_ready(self, driver, timeout=15):
+        """Wait until the document has finished loading instead of sleeping"""
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+    
+    def clear_browser_cache(self, driver):
+        """Drop the HTTP cache, Cache Storage and service workers for a cold load"""
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": self.base_url,
+            "storageTypes": "service_workers,cache_storage"
+        })
+    
+    def run_concurrently(self, task, items):
+        """Run task(item) for every item on the HTTP thread pool, results in item order"""
+        with ThreadPoolExecutor(max_workers=min(self.http_workers, max(1, len(items)))) as executor:
+            return list(executor.map(task, items))
+    
+    def run_on_browser_pool(self, task, items):
+        """Run task(driver, item) for every item on a pool of browsers
+        
+        The main driver plus browser_pool_size - 1 extra headless drivers pull
+        items from a shared work queue. Results come back in item order.
+        """
+        extra_drivers = []
+        
+        def start_driver():
+            try:
+                extra_drivers.append(self.create_driver())
+            except Exception as e:
+                print(f"⚠️ Could not start pooled browser: {e}")
+        
+        starters = [threading.Thread(target=start_driver)
+                    for _ in range(min(self.browser_pool_size, len(items)) - 1)]
+        for starter in starters:
+            starter.start()
+        for starter in starters:
+            starter.join()
+        
+        work = queue.Queue()
+        for index, item in enumerate(items):
+            work.put((index, item))
+        results = [None] * len(items)
+        
+        def worker(driver):
+            while True:
+                try:
+                    index, item = work.get_nowait()
+                except queue.Empty:
+                    return
+                results[index] = task(driver, item)
+        
+        workers = [threading.Thread(target=worker, args=(driver,)) for driver in [self.driver] + extra_drivers]
+        try:
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+        finally:
+            for driver in extra_drivers:
+                driver.quit()
+        return results
+    
     def test_database_connectivity(self):
         """Test database connections"""
         print("\n🗄️ TESTING DATABASE CONNECTIVITY")
@@ -139,27 +348,31 @@ class MewayzComprehensiveTester:
             "/api/financial-services"
         ]
         
-        for endpoint in api_endpoints:
+        def check(endpoint):
             try:
-                response = requests.get(f"{self.api_url}{endpoint}", timeout=10)
+                response, phases = timed_request("GET", f"{self.api_url}{endpoint}", session=self.session, timeout=10)
                 status = "✅ Reachable" if response.status_code in [200, 401, 403] else f"❌ Error {response.status_code}"
-                
-                self.test_results["api_endpoints"].append({
+                return {
                     "endpoint": endpoint,
                     "status_code": response.status_code,
                     "response_time": response.elapsed.total_seconds(),
+                    "phases": phases,
                     "status": status
-                })
-                print(f"{status} {endpoint} ({response.status_code}) - {response.elapsed.total_seconds():.3f}s")
-                
+                }
             except Exception as e:
-                self.test_results["api_endpoints"].append({
+                return {
                     "endpoint": endpoint,
                     "status_code": None,
                     "response_time": None,
                     "status": f"❌ Connection failed: {e}"
-                })
-                print(f"❌ Failed {endpoint}: {e}")
+                }
+        
+        for result in self.run_concurrently(check, api_endpoints):
+            self.test_results["api_endpoints"].append(result)
+            if result["status_code"] is not None:
+                print(f"{result['status']} {result['endpoint']} ({result['status_code']}) - {result['response_time']:.3f}s")
+            else:
+                print(f"❌ Failed {result['endpoint']}: {result['status'].split(': ', 1)[-1]}")
     
     def test_frontend_pages(self):
         """Test all frontend pages"""
@@ -216,35 +429,57 @@ class MewayzComprehensiveTester:
             "/compliance"
         ]
         
-        for route in frontend_routes:
+        def visit(driver, route):
             try:
-                self.driver.get(f"{self.base_url}{route}")
-                time.sleep(2)  # Wait for page load
+                # Cold visit with an empty cache, then warm revisits
+                self.clear_browser_cache(driver)
+                driver.get(f"{self.base_url}{route}")
+                self.wait_for_page_ready(driver)
+                cold = driver.execute_async_script(PAGE_METRICS_SCRIPT)
+                
+                visits = []
+                for _ in range(self.page_visits):
+                    driver.get(f"{self.base_url}{route}")
+                    self.wait_for_page_ready(driver)
+                    visits.append(driver.execute_async_script(PAGE_METRICS_SCRIPT))
+                
+                summary = summarize_page_metrics(visits)
+                cache = cache_delta(cold, summary)
+                load_p50 = summary.get("load", {}).get("p50")
                 
                 # Check if page loaded successfully
-                if "error" not in self.driver.title.lower() and self.driver.title != "":
+                if "error" not in driver.title.lower() and driver.title != "":
                     status = "✅ Loaded"
-                    load_time = time.time() - time.time()  # Simplified for demo
+                    load_time = load_p50 / 1000 if load_p50 is not None else None
                 else:
                     status = "⚠️ Warning: Error in title"
                     load_time = None
                 
-                self.test_results["frontend_pages"].append({
+                lcp_p50 = summary.get("lcp", {}).get("p50")
+                lcp_text = f", LCP {lcp_p50:.0f}ms" if lcp_p50 is not None else ""
+                load_text = f" ({load_p50:.0f}ms load{lcp_text})" if load_p50 is not None else ""
+                print(f"{status} {route} - {driver.title}{load_text}")
+                return {
                     "route": route,
-                    "title": self.driver.title,
+                    "title": driver.title,
                     "status": status,
-                    "load_time": load_time
-                })
-                print(f"{status} {route} - {self.driver.title}")
+                    "load_time": load_time,
+                    "metrics": visits,
+                    "metrics_summary": summary,
+                    "cold_metrics": cold,
+                    "cache": cache
+                }
                 
             except Exception as e:
-                self.test_results["frontend_pages"].append({
+                print(f"❌ Failed {route}: {e}")
+                return {
                     "route": route,
                     "title": None,
                     "status": f"❌ Failed: {e}",
                     "load_time": None
-                })
-                print(f"❌ Failed {route}: {e}")
+                }
+        
+        self.test_results["frontend_pages"].extend(self.run_on_browser_pool(visit, frontend_routes))
     
     def test_button_clicks(self):
         """Test button clicks and interactions"""
@@ -259,12 +494,12 @@ class MewayzComprehensiveTester:
             {"page": "/admin", "selector": "button", "description": "Admin buttons"}
         ]
         
-        for test in button_tests:
+        def check_buttons(driver, test):
             try:
-                self.driver.get(f"{self.base_url}{test['page']}")
-                time.sleep(3)
+                driver.get(f"{self.base_url}{test['page']}")
+                self.wait_for_page_ready(driver)
                 
-                buttons = self.driver.find_elements(By.TAG_NAME, "button")
+                buttons = driver.find_elements(By.TAG_NAME, "button")
                 clickable_buttons = []
                 
                 for i, button in enumerate(buttons[:5]):  # Test first 5 buttons per page
@@ -272,56 +507,61 @@ class MewayzComprehensiveTester:
                         if button.is_displayed() and button.is_enabled():
                             button_text = button.text or f"Button {i+1}"
                             # Simulate click (be careful not to navigate away)
-                            self.driver.execute_script("arguments[0].scrollIntoView();", button)
+                            driver.execute_script("arguments[0].scrollIntoView();", button)
                             clickable_buttons.append(button_text)
                     except Exception:
                         pass
                 
-                self.test_results["button_clicks"].append({
+                print(f"✅ {test['page']}: {len(clickable_buttons)} clickable buttons")
+                return {
                     "page": test["page"],
                     "description": test["description"],
                     "buttons_found": len(buttons),
                     "clickable_buttons": len(clickable_buttons),
                     "status": f"✅ Found {len(clickable_buttons)} clickable buttons"
-                })
-                print(f"✅ {test['page']}: {len(clickable_buttons)} clickable buttons")
+                }
                 
             except Exception as e:
-                self.test_results["button_clicks"].append({
+                print(f"❌ Failed {test['page']}: {e}")
+                return {
                     "page": test["page"],
                     "description": test["description"],
                     "status": f"❌ Failed: {e}"
-                })
-                print(f"❌ Failed {test['page']}: {e}")
+                }
+        
+        self.test_results["button_clicks"].extend(self.run_on_browser_pool(check_buttons, button_tests))
     
     def test_performance_metrics(self):
         """Test performance metrics"""
         print("\n⚡ TESTING PERFORMANCE METRICS")
         
         # Test API response times
-        api_performance = []
-        for endpoint in ["/api/users", "/api/products", "/api/customers"]:
+        def measure(endpoint):
             try:
-                start_time = time.time()
-                response = requests.get(f"{self.api_url}{endpoint}", timeout=10)
-                response_time = time.time() - start_time
+                response, phases = timed_request("GET", f"{self.api_url}{endpoint}", session=self.session, timeout=10)
+                response_time = phases["ttfb"]
                 
                 status = "✅ Fast" if response_time < 0.5 else "⚠️ Slow" if response_time < 2 else "❌ Very Slow"
-                api_performance.append({
+                return {
                     "endpoint": endpoint,
                     "response_time": response_time,
+                    "phases": phases,
                     "status": status
-                })
-                print(f"{status} {endpoint}: {response_time:.3f}s")
-                
+                }
             except Exception as e:
-                api_performance.append({
+                return {
                     "endpoint": endpoint,
                     "response_time": None,
                     "status": f"❌ Failed: {e}"
-                })
+                }
+        
+        api_performance = self.run_concurrently(measure, ["/api/users", "/api/products", "/api/customers"])
+        for result in api_performance:
+            if result["response_time"] is not None:
+                print(f"{result['status']} {result['endpoint']}: {result['response_time']:.3f}s "
+                      f"(body {result['phases']['body'] * 1000:.1f}ms)")
         
-        self.test_results["performance_tests"] = api_performance
+        self.test_results["performance_tests"].extend(api_performance)
         
         # Test system resources
         cpu_percent = psutil.cpu_percent(interval=1)
@@ -377,7 +617,7 @@ class MewayzComprehensiveTester:
                 "details": None
             })
         
-        self.test_results["security_tests"] = security_tests
+        self.test_results["security_tests"].extend(security_tests)
         
         for test in security_tests:
             print(f"{test['status']} {test['test']}")
@@ -397,12 +637,12 @@ class MewayzComprehensiveTester:
         )
         
         # Count successful tests
-        successful_pages = len([p for p in self.test_results["frontend_pages"] if "✅" in p["status"]])
-        successful_apis = len([a for a in self.test_results["api_endpoints"] if "✅" in a["status"]])
+        successful_pages = sum(1 for p in self.test_results["frontend_pages"] if "✅" in p["status"])
+        successful_apis = sum(1 for a in self.test_results["api_endpoints"] if "✅" in a["status"])
         
         self.test_results["summary"] = {
             "total_tests": total_tests,
-            "test_duration": f"{time.time() - self.start_time:.2f} seconds",
+            "test_duration": f"{time.perf_counter() - self.start_time:.2f} seconds",
             "frontend_pages_tested": len(self.test_results["frontend_pages"]),
             "frontend_pages_successful": successful_pages,
             "api_endpoints_tested": len(self.test_results["api_endpoints"]),
@@ -413,7 +653,10 @@ class MewayzComprehensiveTester:
         # Write detailed report to file
         report_file = "MEWAYZ_COMPREHENSIVE_TEST_REPORT.json"
         with open(report_file, 'w') as f:
-            json.dump(self.test_results, f, indent=2)
+            if self.sink:
+                self._stream_report(f)
+            else:
+                json.dump(self.test_results, f, indent=2)
         
         print(f"\n📋 COMPREHENSIVE TEST REPORT SUMMARY")
         print(f"=" * 50)
@@ -425,8 +668,68 @@ class MewayzComprehensiveTester:
         print(f"Detailed Report: {report_file}")
         print(f"=" * 50)
         
+        self.print_page_timing()
+        self.print_cache_report()
+        
         return self.test_results
     
+    def print_page_timing(self, limit=15):
+        """Print the slowest routes by p90 LCP (or load time when LCP is missing)"""
+        def key_metric(page):
+            summary = page.get("metrics_summary") or {}
+            metric = summary.get("lcp") or summary.get("load") or {}
+            return metric.get("p90") or 0
+        
+        pages = sorted((p for p in self.test_results["frontend_pages"] if p.get("metrics_summary")),
+                       key=key_metric, reverse=True)[:limit]
+        if not pages:
+            return
+        
+        def fmt(summary, name, pct):
+            value = summary.get(name, {}).get(pct)
+            return f"{value:>8.0f}" if value is not None else f"{'-':>8}"
+        
+        print(f"\n⏱️ PAGE TIMING (ms, p50/p90 over {self.page_visits} visits)")
+        print(f"{'Route':<30} {'TTFB':>8} {'FCP':>8} {'LCP p50':>8} {'LCP p90':>8} {'Load p90':>8} {'CLS':>6} {'KB':>8}")
+        for page in pages:
+            summary = page["metrics_summary"]
+            cls = summary.get("cls", {}).get("p50")
+            kb = summary.get("resource_transfer_bytes", {}).get("p50")
+            print(f"{page['route'][:30]:<30} {fmt(summary, 'ttfb', 'p50')} {fmt(summary, 'fcp', 'p50')} "
+                  f"{fmt(summary, 'lcp', 'p50')} {fmt(summary, 'lcp', 'p90')} {fmt(summary, 'load', 'p90')} "
+                  f"{cls if cls is not None else 0:>6.3f} {(kb or 0) / 1024:>8.1f}")
+    
+    def print_cache_report(self, limit=15):
+        """Print cold vs warm load time and bytes, worst warm transfer first"""
+        pages = sorted((p for p in self.test_results["frontend_pages"] if p.get("cache")),
+                       key=lambda p: p["cache"]["warm_bytes"], reverse=True)[:limit]
+        if not pages:
+            return
+        
+        def ms(value):
+            return f"{value:>9.0f}" if value is not None else f"{'-':>9}"
+        
+        print(f"\n🗄️ COLD VS WARM PAGE LOADS (ms, KB transferred)")
+        print(f"{'Route':<30} {'cold':>9} {'warm':>9} {'delta':>9} {'cold KB':>9} {'warm KB':>9}")
+        for page in pages:
+            cache = page["cache"]
+            print(f"{page['route'][:30]:<30} {ms(cache['cold_load'])} {ms(cache['warm_load'])} {ms(cache['delta_ms'])} "
+                  f"{cache['cold_bytes'] / 1024:>9.1f} {cache['warm_bytes'] / 1024:>9.1f}")
+    
+    def _stream_report(self, f):
+        """Write the JSON report category by category from the sink"""
+        f.write("{")
+        for index, (category, records) in enumerate(self.test_results.items()):
+            f.write(("," if index else "") + f"\n  {json.dumps(category)}: ")
+            if isinstance(records, SinkCategory):
+                f.write("[")
+                for position, record in enumerate(records):
+                    f.write(("," if position else "") + "\n    " + json.dumps(record))
+                f.write("\n  ]")
+            else:
+                f.write(json.dumps(records, indent=2).replace("\n", "\n  "))
+        f.write("\n}\n")
+    
     def run_all_tests(self):
         """Run complete test suite"""
         print("🚀 STARTING COMPREHENSIVE MEWAYZ PLATFORM TESTING")
@@ -458,9 +761,23 @@ class MewayzComprehensiveTester:
         finally:
             if self.driver:
                 self.driver.quit()
+            if self.sink:
+                self.sink.close()
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description="MEWAYZ comprehensive testing suite")
+    parser.add_argument("results_file", nargs="?", default=None,
+                        help="Stream results to this NDJSON file instead of holding them in memory")
+    parser.add_argument("--browsers", type=int, default=4,
+                        help="Number of headless browsers crawling pages in parallel")
+    parser.add_argument("--http-workers", type=int, default=16,
+                        help="Threads sweeping API endpoints concurrently")
+    parser.add_argument("--visits", type=int, default=1,
+                        help="Warm visits per route after the cold one; raise it for steadier "
+                             "timing percentiles at one extra page load per route each")
+    args = parser.parse_args()
+    
     print("🎯 MEWAYZ ENTERPRISE PLATFORM - COMPREHENSIVE TESTING SUITE")
     print("Following Enterprise Testing Standards for Production Readiness")
     print("=" * 60)
@@ -479,7 +796,7 @@ def main():
         return
     
     # Run comprehensive tests
-    tester = MewayzComprehensiveTester()
+    tester = MewayzComprehensiveTester(args.results_file, args.browsers, args.visits, args.http_workers)
     results = tester.run_all_tests()
     
     # Exit with appropriate code
@@ -15,24 +15,77 @@ Enterprise-grade testing system that validates every aspect of the MEWAYZ platfo
 Following enterprise testing standards and best practices.
 """
 
+import argparse
 import asyncio
 import aiohttp
 import json
 import time
 import logging
+import math
+import multiprocessing
 import random
 import string
 import websockets
 import concurrent.futures
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
-from urllib.parse import urljoin
+import gzip
+import re
+from collections import deque
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict, field, replace
+from urllib.parse import urljoin, urlparse, urlencode
 import sys
 import os
 import signal
+import socket
 import traceback
+from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
+from array import array
+
+from suite_helpers import NDJSONResultSink, ResultSink
+
+try:
+    import psutil
+except ImportError:  # Backend memory sampling in soak mode is skipped without psutil
+    psutil = None
+
+try:
+    import yaml
+except ImportError:  # Scenario files must be JSON without PyYAML
+    yaml = None
+
+try:
+    import orjson
+except ImportError:  # Response bodies are parsed with the stdlib json module without orjson
+    orjson = None
+
+try:
+    import pymongo
+    from bson import ObjectId
+except ImportError:  # Seeding straight into MongoDB needs pymongo; API seeding does not
+    pymongo = None
+    ObjectId = None
+
+try:
+    import resource
+except ImportError:  # Windows: the open file limit is left as it is
+    resource = None
+
+try:
+    import httpx
+except ImportError:  # The HTTP/2 connection benchmark is skipped without httpx[http2]
+    httpx = None
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:  # aiohttp cannot decode br responses, so assets are requested without br
+        brotli = None
 
 # Configure logging
 logging.basicConfig(
@@ -45,6 +98,116 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram (HDR-style)
+    
+    Latencies are stored in microseconds. Each power-of-two range is split into
+    2**(significant_bits - 1) linear sub-buckets, so every recorded value is
+    kept within ~1/2**(significant_bits - 1) relative error while the whole
+    histogram stays a small sparse dict. Histograms with the same precision
+    merge by adding counts, which makes them safe to combine across tasks,
+    processes and hosts.
+    """
+    
+    def __init__(self, significant_bits: int = 7):
+        self.significant_bits = significant_bits
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+    
+    def _bucket(self, value_us: int) -> int:
+        shift = max(0, value_us.bit_length() - self.significant_bits)
+        return (shift << self.significant_bits) | (value_us >> shift)
+    
+    def _bucket_value(self, bucket: int) -> int:
+        shift = bucket >> self.significant_bits
+        lower = (bucket & ((1 << self.significant_bits) - 1)) << shift
+        return lower + ((1 << shift) >> 1)
+    
+    def record(self, seconds: float, count: int = 1):
+        """Record a latency given in seconds"""
+        value_us = max(0, int(seconds * 1_000_000))
+        bucket = self._bucket(value_us)
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += count
+        self.total_us += value_us * count
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+        if self.max_us is None or value_us > self.max_us:
+            self.max_us = value_us
+    
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add another histogram's samples into this one"""
+        if other.significant_bits != self.significant_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        if other.max_us is not None and (self.max_us is None or other.max_us > self.max_us):
+            self.max_us = other.max_us
+        return self
+    
+    def percentile(self, pct: float) -> float:
+        """Return the latency in seconds at the given percentile"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * self.count))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                value_us = min(max(self._bucket_value(bucket), self.min_us), self.max_us)
+                return value_us / 1_000_000
+        return self.max_us / 1_000_000
+    
+    @property
+    def mean(self) -> float:
+        return (self.total_us / self.count / 1_000_000) if self.count else 0.0
+    
+    @property
+    def max(self) -> float:
+        return (self.max_us or 0) / 1_000_000
+    
+    def summary(self) -> Dict[str, float]:
+        """Percentile summary in seconds"""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p99.9": self.percentile(99.9),
+            "max": self.max
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for JSON reports and inter-process transfer"""
+        return {
+            "significant_bits": self.significant_bits,
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "counts": {str(bucket): count for bucket, count in self.counts.items()},
+            "summary": self.summary()
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls(data.get("significant_bits", 7))
+        histogram.counts = {int(bucket): count for bucket, count in data.get("counts", {}).items()}
+        histogram.count = data.get("count", sum(histogram.counts.values()))
+        histogram.total_us = data.get("total_us", 0)
+        histogram.min_us = data.get("min_us")
+        histogram.max_us = data.get("max_us")
+        return histogram
+
 @dataclass
 class TestResult:
     """Test result data structure"""
@@ -57,6 +220,1018 @@ class TestResult:
     expected: Optional[Any] = None
     actual: Optional[Any] = None
     error: Optional[str] = None
+    histogram: Optional[LatencyHistogram] = None
+    # Mean seconds spent in network, app, mongo and redis (from Server-Timing)
+    timing: Optional[Dict[str, float]] = None
+    # Mean seconds per client-side request phase (queue, dns, connect, send, ttfb, body)
+    phases: Optional[Dict[str, float]] = None
+
+def result_to_dict(result: TestResult) -> Dict[str, Any]:
+    """Convert a TestResult into a JSON-serializable dict"""
+    data = asdict(result)
+    data["histogram"] = result.histogram.to_dict() if result.histogram else None
+    return data
+
+def result_from_dict(data: Dict[str, Any]) -> TestResult:
+    """Rebuild a TestResult produced by result_to_dict"""
+    data = dict(data)
+    if data.get("histogram"):
+        data["histogram"] = LatencyHistogram.from_dict(data["histogram"])
+    return TestResult(**data)
+
+class SampleStore:
+    """
+    Columnar storage for high-volume per-request samples
+    
+    One request costs five typed array slots (~22 bytes) instead of a
+    TestResult with its own dict and strings. Endpoints and error messages
+    are interned into side tables and referenced by 32-bit ids (a replayed
+    log can hold far more than 65,535 distinct paths); error id 0 means
+    "no error". Timestamps are event loop clock (loop.time()) readings, so
+    samples from different phases can be ordered and windowed together.
+    """
+    
+    __slots__ = ("timestamps", "endpoint_ids", "status_codes", "latencies", "error_ids",
+                 "endpoints", "errors", "_endpoint_ids", "_error_ids")
+    
+    def __init__(self):
+        self.timestamps = array("d")
+        self.endpoint_ids = array("I")
+        self.status_codes = array("H")
+        self.latencies = array("f")
+        self.error_ids = array("I")
+        self.endpoints: List[str] = []
+        self.errors: List[str] = [""]
+        self._endpoint_ids: Dict[str, int] = {}
+        self._error_ids: Dict[str, int] = {"": 0}
+    
+    def _intern(self, table: List[str], index: Dict[str, int], value: str) -> int:
+        if value not in index:
+            index[value] = len(table)
+            table.append(value)
+        return index[value]
+    
+    def append(self, timestamp: float, endpoint: str, status: int, latency: float,
+               error: Optional[str] = None):
+        self.timestamps.append(timestamp)
+        self.endpoint_ids.append(self._intern(self.endpoints, self._endpoint_ids, endpoint))
+        self.status_codes.append(status)
+        self.latencies.append(latency)
+        self.error_ids.append(self._intern(self.errors, self._error_ids, error[:200]) if error else 0)
+    
+    def __len__(self) -> int:
+        return len(self.latencies)
+    
+    def __iter__(self) -> Iterator[Tuple[float, str, int, float, Optional[str]]]:
+        for i in range(len(self.latencies)):
+            error_id = self.error_ids[i]
+            yield (self.timestamps[i], self.endpoints[self.endpoint_ids[i]], self.status_codes[i],
+                   self.latencies[i], self.errors[error_id] if error_id else None)
+    
+    @property
+    def nbytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in (self.timestamps, self.endpoint_ids, self.status_codes,
+                                                 self.latencies, self.error_ids))
+    
+    @staticmethod
+    def is_error(status: int) -> bool:
+        """Anything but a 2xx/3xx response is an error (0 means the request itself failed)"""
+        return not 200 <= status < 400
+    
+    def histograms(self, start: int = 0) -> Dict[str, LatencyHistogram]:
+        """Per-endpoint latency histograms for samples from index `start` on"""
+        histograms = {}
+        for i in range(start, len(self.latencies)):
+            endpoint = self.endpoints[self.endpoint_ids[i]]
+            if endpoint not in histograms:
+                histograms[endpoint] = LatencyHistogram()
+            histograms[endpoint].record(self.latencies[i])
+        return histograms
+    
+    def error_counts(self, start: int = 0) -> Dict[str, int]:
+        """Per-endpoint count of failed requests from index `start` on"""
+        counts = {endpoint: 0 for endpoint in self.endpoints}
+        for i in range(start, len(self.latencies)):
+            if self.is_error(self.status_codes[i]):
+                counts[self.endpoints[self.endpoint_ids[i]]] += 1
+        return counts
+    
+    def rate_limited_counts(self, start: int = 0) -> Dict[str, int]:
+        """Per-endpoint count of 429 responses from index `start` on (also counted as errors)"""
+        counts = {endpoint: 0 for endpoint in self.endpoints}
+        for i in range(start, len(self.latencies)):
+            if self.status_codes[i] == 429:
+                counts[self.endpoints[self.endpoint_ids[i]]] += 1
+        return counts
+    
+    def client_error_counts(self, start: int = 0) -> Dict[str, int]:
+        """Per-endpoint count of 4xx responses (429 included) from index `start` on"""
+        counts = {endpoint: 0 for endpoint in self.endpoints}
+        for i in range(start, len(self.latencies)):
+            if 400 <= self.status_codes[i] < 500:
+                counts[self.endpoints[self.endpoint_ids[i]]] += 1
+        return counts
+
+class MemoryResultSink(ResultSink):
+    """
+    Keeps every TestResult in a list (default, fine for functional runs)
+    
+    suite_helpers.NDJSONResultSink, given result_to_dict/result_from_dict as
+    its encode/decode, is the ResultSink that streams them to disk instead.
+    """
+    
+    def __init__(self):
+        self._results: List[TestResult] = []
+    
+    def write(self, result: TestResult):
+        self._results.append(result)
+    
+    def __iter__(self) -> Iterator[TestResult]:
+        return iter(self._results)
+
+# =============================================================================
+# REQUEST TRACING
+# =============================================================================
+
+# Server-Timing metric names counted towards each backend segment
+TIMING_SEGMENTS = {
+    "mongo": ("db", "mongo", "mongodb", "database"),
+    "redis": ("cache", "redis"),
+}
+TIMING_TOTAL_METRICS = ("total", "app")
+_SERVER_TIMING_DUR = re.compile(r";\s*dur=([0-9.]+)")
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    """Parse 'db;dur=12.3, cache;desc="x";dur=1' into {name: milliseconds}"""
+    metrics: Dict[str, float] = {}
+    for entry in header.split(","):
+        name = entry.split(";", 1)[0].strip().lower()
+        if not name:
+            continue
+        match = _SERVER_TIMING_DUR.search(entry)
+        metrics[name] = metrics.get(name, 0.0) + (float(match.group(1)) if match else 0.0)
+    return metrics
+
+@dataclass
+class RequestTrace:
+    """
+    Correlation ids sent with a request and the timing it came back with
+    
+    make_request sends the ids as X-Request-ID and a W3C traceparent header,
+    and fills in the client-side total and any Server-Timing metrics.
+    """
+    request_id: str = field(default_factory=lambda: f"{random.getrandbits(128):032x}")
+    span_id: str = field(default_factory=lambda: f"{random.getrandbits(64):016x}")
+    total: Optional[float] = None
+    server_timing: Dict[str, float] = field(default_factory=dict)
+    marks: Dict[str, int] = field(default_factory=dict)
+    
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.request_id}-{self.span_id}-01"
+    
+    def headers(self) -> Dict[str, str]:
+        return {"X-Request-ID": self.request_id, "traceparent": self.traceparent}
+    
+    def mark(self, name: str):
+        """Timestamp a request phase boundary with perf_counter_ns"""
+        self.marks[name] = time.perf_counter_ns()
+    
+    def phases(self) -> Optional[Dict[str, float]]:
+        """Seconds spent queued for a connection, resolving, connecting
+        (TCP plus TLS for https), sending, waiting for the first response
+        byte and reading the body. Reused connections have no dns/connect."""
+        marks = self.marks
+        if "start" not in marks or "headers_received" not in marks:
+            return None
+        
+        def span(first: str, last: str) -> float:
+            if first in marks and last in marks:
+                return max(marks[last] - marks[first], 0) / 1e9
+            return 0.0
+        
+        dns = span("dns_start", "dns_end")
+        ready = max(marks.get(name, marks["start"]) for name in ("queue_end", "connect_end"))
+        sent = marks.get("headers_sent", ready)
+        return {
+            "queue": span("queue_start", "queue_end"),
+            "dns": dns,
+            "connect": max(span("connect_start", "connect_end") - dns, 0.0),
+            "send": max(sent - ready, 0) / 1e9,
+            "ttfb": max(marks["headers_received"] - sent, 0) / 1e9,
+            "body": span("headers_received", "body_end"),
+        }
+    
+    def record_response(self, headers):
+        header = headers.get("Server-Timing") or headers.get("server-timing")
+        if header:
+            self.server_timing = parse_server_timing(header)
+    
+    def breakdown(self) -> Optional[Dict[str, float]]:
+        """Split the total into network/app/mongo/redis seconds
+        
+        Without Server-Timing everything is attributed to the network hop
+        plus server as a whole, so None is returned instead.
+        """
+        if self.total is None or not self.server_timing:
+            return None
+        segments = {name: sum(self.server_timing.get(metric, 0.0) for metric in metrics) / 1000
+                    for name, metrics in TIMING_SEGMENTS.items()}
+        totals = [self.server_timing[m] for m in TIMING_TOTAL_METRICS if m in self.server_timing]
+        server = totals[0] / 1000 if totals else sum(self.server_timing.values()) / 1000
+        segments["app"] = max(server - sum(segments.values()), 0.0)
+        segments["network"] = max(self.total - server, 0.0)
+        return segments
+
+def mean_breakdown(traces: List[RequestTrace]) -> Optional[Dict[str, float]]:
+    """Average the breakdowns of the traces that have one"""
+    breakdowns = [b for b in (trace.breakdown() for trace in traces) if b]
+    if not breakdowns:
+        return None
+    return {name: sum(b[name] for b in breakdowns) / len(breakdowns) for name in breakdowns[0]}
+
+def mean_phases(traces: List[RequestTrace]) -> Optional[Dict[str, float]]:
+    """Average the request phases of the traces that have them"""
+    phases = [p for p in (trace.phases() for trace in traces) if p]
+    if not phases:
+        return None
+    return {name: sum(p[name] for p in phases) / len(phases) for name in phases[0]}
+
+REQUEST_PHASES = ("queue", "dns", "connect", "send", "ttfb", "body")
+
+def create_phase_trace_config() -> aiohttp.TraceConfig:
+    """aiohttp hooks that mark request phases on the RequestTrace passed as trace_request_ctx"""
+    def marker(name: str):
+        async def hook(session, context, params):
+            trace = context.trace_request_ctx
+            if isinstance(trace, RequestTrace):
+                trace.mark(name)
+        return hook
+    
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_queued_start.append(marker("queue_start"))
+    trace_config.on_connection_queued_end.append(marker("queue_end"))
+    trace_config.on_dns_resolvehost_start.append(marker("dns_start"))
+    trace_config.on_dns_resolvehost_end.append(marker("dns_end"))
+    trace_config.on_connection_create_start.append(marker("connect_start"))
+    trace_config.on_connection_create_end.append(marker("connect_end"))
+    trace_config.on_request_headers_sent.append(marker("headers_sent"))
+    trace_config.on_request_end.append(marker("headers_received"))
+    return trace_config
+
+# httpx/httpcore trace events and the phase boundaries they mark
+_HTTPX_PHASE_EVENTS = {
+    "connection.connect_tcp.started": "connect_start",
+    "connection.connect_tcp.complete": "connect_end",
+    "connection.start_tls.complete": "connect_end",
+    "http11.send_request_headers.complete": "headers_sent",
+    "http2.send_request_headers.complete": "headers_sent",
+    "http11.receive_response_headers.complete": "headers_received",
+    "http2.receive_response_headers.complete": "headers_received",
+}
+
+def format_breakdown(timing: Dict[str, float]) -> str:
+    return ", ".join(f"{name} {timing[name] * 1000:.1f}ms" for name in ("network", "app", "mongo", "redis"))
+
+# =============================================================================
+# HTTP TRANSPORTS
+# =============================================================================
+
+# Response body modes of make_request
+BODY_MODES = ("json", "raw", "none")
+STREAM_CHUNK_SIZE = 64 * 1024
+
+json_loads = orjson.loads if orjson else json.loads
+
+def _decode_body(body: bytes, content_type: str) -> Dict[str, Any]:
+    """Parse a JSON body, falling back to {"text": ...} like aiohttp's json()"""
+    if "json" in (content_type or ""):
+        try:
+            return json_loads(body)
+        except ValueError:
+            pass
+    return {"text": body.decode("utf-8", errors="replace")}
+
+def _encode_json(value: Any) -> bytes:
+    return orjson.dumps(value) if orjson else json.dumps(value).encode()
+
+class JSONArrayStream:
+    """
+    Incrementally parse the items of a JSON array from response chunks
+    
+    The array is either the whole document or the value of `key` in the
+    top-level object (``{"success": true, "data": [...]}``). Each item is
+    decoded on its own as soon as it is complete, so a large listing is
+    validated without ever holding the full object tree.
+    """
+    
+    def __init__(self, key: str = "data"):
+        self.key = key.encode()
+        self.buffer = bytearray()
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.string_start = 0
+        self.last_string = None
+        self.array_depth: Optional[int] = None
+        self.item_start: Optional[int] = None
+        self.done = False
+    
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume a chunk and return the items it completed"""
+        items = []
+        buffer = self.buffer
+        buffer += chunk
+        i = self.pos
+        while i < len(buffer) and not self.done:
+            c = buffer[i]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif c == 0x5C:  # backslash
+                    self.escape = True
+                elif c == 0x22:  # closing quote
+                    self.in_string = False
+                    if self.depth == 1 and self.array_depth is None:
+                        self.last_string = bytes(buffer[self.string_start:i])
+            elif c in b" \t\r\n:":
+                pass
+            elif c == 0x2C:  # comma
+                if self.depth == self.array_depth and self.item_start is not None:
+                    items.append(json_loads(bytes(buffer[self.item_start:i])))
+                    self.item_start = None
+            elif c in b"[{":
+                if self.depth == self.array_depth and self.item_start is None:
+                    self.item_start = i
+                self.depth += 1
+                if c == 0x5B and self.array_depth is None and (
+                        self.depth == 1 or (self.depth == 2 and self.last_string == self.key)):
+                    self.array_depth = self.depth
+            elif c in b"]}":
+                if self.depth == self.array_depth:
+                    # End of the target array
+                    if self.item_start is not None:
+                        items.append(json_loads(bytes(buffer[self.item_start:i])))
+                    self.done = True
+                self.depth -= 1
+                if self.depth == self.array_depth and self.item_start is not None:
+                    items.append(json_loads(bytes(buffer[self.item_start:i + 1])))
+                    self.item_start = None
+            else:
+                if c == 0x22:
+                    self.in_string = True
+                    self.string_start = i + 1
+                if self.depth == self.array_depth and self.item_start is None:
+                    self.item_start = i
+            i += 1
+        
+        # Drop everything before the item (or key) still being read
+        keep = i
+        if self.item_start is not None:
+            keep = self.item_start
+        elif self.in_string:
+            keep = self.string_start
+        del buffer[:keep]
+        if self.item_start is not None:
+            self.item_start -= keep
+        self.string_start -= keep
+        self.pos = i - keep
+        return items
+
+class Transport(ABC):
+    """HTTP client backend behind make_request
+    
+    request() returns (status, data) where data depends on `body`: parsed
+    JSON (or {"text": ...}) for "json", the undecoded bytes for "raw", and an
+    empty dict for "none", which drains the body without keeping it. Load
+    generators only need status and latency, so "none" saves most of the
+    per-request CPU.
+    """
+    
+    @abstractmethod
+    async def request(self, method: str, url: str, headers: Dict[str, str],
+                      json: Any = None, params: Optional[Dict[str, Any]] = None,
+                      body: str = "json", trace: Optional[RequestTrace] = None) -> Tuple[int, Any]:
+        """Send one request and return (status, data)"""
+    
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, headers: Dict[str, str],
+                     params: Optional[Dict[str, Any]] = None):
+        """Yield (status, async iterator of body chunks)
+        
+        Backends without incremental reads deliver the body as one chunk.
+        """
+        status, data = await self.request(method, url, headers, params=params, body="raw")
+        
+        async def chunks():
+            yield data
+        
+        yield status, chunks()
+    
+    async def close(self):
+        pass
+
+class AiohttpTransport(Transport):
+    """Requests over the tester's shared aiohttp session (default)"""
+    
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
+    
+    async def request(self, method, url, headers, json=None, params=None, body="json", trace=None):
+        data = None if json is None else _encode_json(json)
+        async with self.session.request(method, url, headers=headers, data=data, params=params,
+                                        trace_request_ctx=trace) as response:
+            if trace:
+                trace.record_response(response.headers)
+            if body == "none":
+                async for _ in response.content.iter_any():
+                    pass
+                return response.status, {}
+            content = await response.read()
+            if body == "raw":
+                return response.status, content
+            return response.status, _decode_body(content, response.content_type)
+    
+    @asynccontextmanager
+    async def stream(self, method, url, headers, params=None):
+        async with self.session.request(method, url, headers=headers, params=params) as response:
+            yield response.status, response.content.iter_chunked(STREAM_CHUNK_SIZE)
+
+class HttpxTransport(Transport):
+    """Requests over an httpx AsyncClient (optional dependency)"""
+    
+    def __init__(self, limit: int, timeout: float, headers: Dict[str, str]):
+        if httpx is None:
+            raise ImportError("the httpx transport requires httpx (pip install httpx)")
+        self.client = httpx.AsyncClient(limits=httpx.Limits(max_connections=limit),
+                                        timeout=timeout, headers=headers)
+    
+    async def request(self, method, url, headers, json=None, params=None, body="json", trace=None):
+        content = None if json is None else _encode_json(json)
+        extensions = {}
+        if trace:
+            async def on_event(event: str, info: Dict[str, Any]):
+                if event in _HTTPX_PHASE_EVENTS:
+                    trace.mark(_HTTPX_PHASE_EVENTS[event])
+            extensions["trace"] = on_event
+        async with self.client.stream(method, url, headers=headers, content=content, params=params,
+                                      extensions=extensions) as response:
+            if trace:
+                trace.record_response(response.headers)
+            if body == "none":
+                async for _ in response.aiter_raw():
+                    pass
+                return response.status_code, {}
+            data = await response.aread()
+            if body == "raw":
+                return response.status_code, data
+            return response.status_code, _decode_body(data, response.headers.get("content-type", ""))
+    
+    @asynccontextmanager
+    async def stream(self, method, url, headers, params=None):
+        async with self.client.stream(method, url, headers=headers, params=params) as response:
+            yield response.status_code, response.aiter_bytes(STREAM_CHUNK_SIZE)
+    
+    async def close(self):
+        await self.client.aclose()
+
+class RawHTTPTransport(Transport):
+    """
+    Minimal HTTP/1.1 client on asyncio streams
+    
+    Idle keep-alive connections are pooled per origin. Only Content-Length,
+    chunked and read-until-close bodies are understood: no redirects,
+    proxies or content decoding (requests ask for identity encoding).
+    """
+    
+    def __init__(self, limit: int, timeout: float, headers: Dict[str, str]):
+        self.timeout = timeout
+        self.headers = headers
+        self._semaphore = asyncio.Semaphore(limit)
+        self._idle: Dict[Tuple[str, str, int], List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+    
+    async def request(self, method, url, headers, json=None, params=None, body="json", trace=None):
+        parts = urlparse(url)
+        origin = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        target = parts.path or "/"
+        query = "&".join(q for q in (parts.query, urlencode(params or {})) if q)
+        if query:
+            target += "?" + query
+        
+        content = b"" if json is None else _encode_json(json)
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {parts.netloc}",
+                 "Accept-Encoding: identity", f"Content-Length: {len(content)}"]
+        lines += [f"{name}: {value}" for name, value in {**self.headers, **headers}.items()]
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode() + content
+        
+        if trace:
+            trace.mark("queue_start")
+        async with self._semaphore:
+            if trace:
+                trace.mark("queue_end")
+            return await asyncio.wait_for(self._exchange(origin, method, payload, body, trace), self.timeout)
+    
+    async def _exchange(self, origin, method: str, payload: bytes, body_mode: str,
+                        trace: Optional[RequestTrace]) -> Tuple[int, Any]:
+        idle = self._idle.setdefault(origin, [])
+        while True:
+            reused = bool(idle)
+            if reused:
+                reader, writer = idle.pop()
+            else:
+                if trace:
+                    trace.mark("connect_start")
+                reader, writer = await asyncio.open_connection(origin[1], origin[2], ssl=origin[0] == "https")
+                if trace:
+                    trace.mark("connect_end")
+            try:
+                writer.write(payload)
+                await writer.drain()
+                if trace:
+                    trace.mark("headers_sent")
+                status_line = await reader.readuntil(b"\r\n")
+                break
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection; retry on a fresh one
+            except BaseException:
+                # Includes the cancellation of a timed-out request
+                writer.close()
+                raise
+        
+        try:
+            status, response_headers, body, keep_alive = await self._read_response(reader, method, status_line, trace)
+        except BaseException:
+            # A half-read response leaves the connection unusable
+            writer.close()
+            raise
+        
+        if keep_alive:
+            self._idle[origin].append((reader, writer))
+        else:
+            writer.close()
+        
+        if body_mode == "none":
+            return status, {}
+        if body_mode == "raw":
+            return status, body
+        return status, _decode_body(body, response_headers.get("content-type", ""))
+    
+    async def _read_response(self, reader: asyncio.StreamReader, method: str, status_line: bytes,
+                             trace: Optional[RequestTrace]) -> Tuple[int, Dict[str, str], bytes, bool]:
+        """Read headers and body after the status line: (status, headers, body, keep-alive)"""
+        status = int(status_line.split(b" ", 2)[1])
+        response_headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+        
+        if trace:
+            trace.mark("headers_received")
+            trace.record_response(response_headers)
+        keep_alive = response_headers.get("connection", "").lower() != "close"
+        if method == "HEAD" or status in (204, 304) or status < 200:
+            body = b""
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await self._skip_trailers(reader)
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in response_headers:
+            body = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            body = await reader.read()
+            keep_alive = False
+        return status, response_headers, body, keep_alive
+    
+    @staticmethod
+    async def _skip_trailers(reader: asyncio.StreamReader):
+        while await reader.readuntil(b"\r\n") != b"\r\n":
+            pass
+    
+    async def close(self):
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+TRANSPORTS = ("aiohttp", "httpx", "raw")
+
+# =============================================================================
+# BACKEND PROFILING
+# =============================================================================
+
+# V8 pseudo-frames that say nothing about which backend code is hot
+_PROFILE_PSEUDO_FRAMES = {"(root)", "(idle)", "(program)"}
+
+def summarize_cpu_profile(profile: Dict[str, Any], top: int = 10) -> List[Dict[str, Any]]:
+    """Aggregate a .cpuprofile into its functions with the most self time
+    
+    A sample's duration is the time delta to the next sample, as in Chrome
+    DevTools. Frames are grouped by function name, script and line.
+    """
+    nodes = {node["id"]: node for node in profile.get("nodes", [])}
+    samples = profile.get("samples", [])
+    deltas = profile.get("timeDeltas", [])
+    
+    self_time: Dict[int, float] = {}
+    if samples:
+        for index, node_id in enumerate(samples):
+            duration = deltas[index + 1] if index + 1 < len(deltas) else 0
+            self_time[node_id] = self_time.get(node_id, 0) + duration
+    else:
+        for node_id, node in nodes.items():
+            self_time[node_id] = node.get("hitCount", 0)
+    total = sum(self_time.values()) or 1
+    
+    functions: Dict[Tuple[str, str, int], float] = {}
+    for node_id, value in self_time.items():
+        frame = nodes.get(node_id, {}).get("callFrame", {})
+        name = frame.get("functionName") or "(anonymous)"
+        if name in _PROFILE_PSEUDO_FRAMES:
+            continue
+        key = (name, frame.get("url", ""), frame.get("lineNumber", -1) + 1)
+        functions[key] = functions.get(key, 0) + value
+    
+    hottest = sorted(functions.items(), key=lambda item: item[1], reverse=True)[:top]
+    return [
+        {
+            "function": name,
+            "url": url,
+            "line": line,
+            "self_ms": round(value / 1000, 3) if samples else None,
+            "self_pct": round(value / total * 100, 2)
+        }
+        for (name, url, line), value in hottest
+    ]
+
+class InspectorProfiler:
+    """
+    Drives the Profiler domain of a Node process started with --inspect
+    
+    The debugger websocket is looked up through the inspector's /json/list
+    endpoint, so only the host and port are needed.
+    """
+    
+    def __init__(self, host: str, port: int, interval_us: int = 100):
+        self.host = host
+        self.port = port
+        self.interval_us = interval_us
+        self._ws = None
+        self._next_id = 0
+    
+    async def start(self):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://{self.host}:{self.port}/json/list") as response:
+                targets = await response.json(content_type=None)
+        if not targets:
+            raise RuntimeError(f"No inspector targets on {self.host}:{self.port}")
+        
+        self._ws = await websockets.connect(targets[0]["webSocketDebuggerUrl"], max_size=None)
+        await self._call("Profiler.enable")
+        await self._call("Profiler.setSamplingInterval", {"interval": self.interval_us})
+        await self._call("Profiler.start")
+    
+    async def stop(self) -> Dict[str, Any]:
+        try:
+            result = await self._call("Profiler.stop")
+            return result["profile"]
+        finally:
+            await self._ws.close()
+            self._ws = None
+    
+    async def _call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        self._next_id += 1
+        await self._ws.send(json.dumps({"id": self._next_id, "method": method, "params": params or {}}))
+        while True:
+            message = json.loads(await self._ws.recv())
+            if message.get("id") == self._next_id:
+                if "error" in message:
+                    raise RuntimeError(f"{method}: {message['error'].get('message')}")
+                return message.get("result", {})
+
+class AdminEndpointProfiler:
+    """
+    Starts and stops profiling through a backend admin endpoint
+    
+    POST <endpoint>/start begins a profile and POST <endpoint>/stop returns
+    the .cpuprofile JSON (bare or under "profile"), for deployments where the
+    inspector port is not reachable.
+    """
+    
+    def __init__(self, tester: "ComprehensiveMEWAYZTester", endpoint: str):
+        self.tester = tester
+        self.endpoint = endpoint.rstrip("/")
+    
+    async def _post(self, action: str) -> Dict[str, Any]:
+        token = self.tester.admin_token or self.tester.auth_token
+        status, data = await self.tester.make_request("POST", f"{self.endpoint}/{action}", auth_token=token)
+        if status >= 400 or status == 0:
+            raise RuntimeError(f"{self.endpoint}/{action} returned {status}")
+        return data
+    
+    async def start(self):
+        await self._post("start")
+    
+    async def stop(self) -> Dict[str, Any]:
+        data = await self._post("stop")
+        return data.get("profile", data)
+
+# =============================================================================
+# WEBSOCKET CLIENTS
+# =============================================================================
+
+class WebSocketClient:
+    """
+    One load-test connection to the backend's /ws endpoint
+    
+    A background reader stamps every JSON message with perf_counter() on
+    arrival and queues it by its "type", so measured latencies do not include
+    the time a message waits until the test looks at it. When the server
+    closes the connection every waiter is woken with the close reason.
+    """
+    
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.inbox: Dict[Any, asyncio.Queue] = {}
+        self.closed: Optional[Exception] = None
+        self._reader = asyncio.create_task(self._read())
+    
+    @classmethod
+    async def connect(cls, url: str, timeout: float) -> Tuple["WebSocketClient", float]:
+        """Open a connection and wait for the server's welcome
+        
+        Returns the client and the establish latency in seconds, which covers
+        the TCP connect, the upgrade handshake and token verification.
+        """
+        start = time.perf_counter()
+        websocket = await websockets.connect(url, open_timeout=timeout, ping_interval=None)
+        client = cls(websocket)
+        try:
+            await client.expect("connection_established", timeout)
+        except BaseException:
+            await client.close()
+            raise
+        return client, time.perf_counter() - start
+    
+    def _queue(self, kind: Any) -> asyncio.Queue:
+        if kind not in self.inbox:
+            self.inbox[kind] = asyncio.Queue()
+        return self.inbox[kind]
+    
+    async def _read(self):
+        try:
+            async for raw in self.websocket:
+                received = time.perf_counter()
+                try:
+                    message = json_loads(raw)
+                except ValueError:
+                    continue
+                if isinstance(message, dict):
+                    self._queue(message.get("type")).put_nowait((received, message))
+            self.closed = ConnectionError("Connection closed by server")
+        except Exception as e:
+            self.closed = e
+        for queue in self.inbox.values():
+            queue.put_nowait((None, None))
+    
+    async def expect(self, kind: str, timeout: float, match=None) -> Tuple[float, Dict[str, Any]]:
+        """Wait for the next message of `kind` (for which `match(message)` holds)
+        
+        Returns its arrival time and the message. Messages of that kind that
+        do not match are discarded.
+        """
+        queue = self._queue(kind)
+        deadline = time.perf_counter() + timeout
+        while True:
+            if self.closed is not None and queue.empty():
+                raise ConnectionError(f"WebSocket closed: {self.closed}")
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise asyncio.TimeoutError(f"No {kind} message within {timeout}s")
+            try:
+                received, message = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                raise asyncio.TimeoutError(f"No {kind} message within {timeout}s") from None
+            if message is None:
+                continue
+            if match is None or match(message):
+                return received, message
+    
+    def pending(self, kind: str) -> int:
+        """Messages of `kind` that arrived but were not taken by expect() yet"""
+        return self._queue(kind).qsize()
+    
+    async def send(self, message: Dict[str, Any]):
+        await self.websocket.send(json.dumps(message))
+    
+    async def close(self):
+        self._reader.cancel()
+        try:
+            await self.websocket.close()
+        except Exception:
+            pass
+
+# =============================================================================
+# TEST DATA GENERATION
+# =============================================================================
+
+# Seeded record kinds in load order (orders reference seeded products and
+# customers), with the API endpoint and MongoDB collection each one is stored through
+SEED_KINDS = {
+    "products": {"endpoint": "/api/v1/products", "collection": "products"},
+    "customers": {"endpoint": "/api/v1/customers", "collection": "customers"},
+    "leads": {"endpoint": "/api/v1/leads", "collection": "leads"},
+    "orders": {"endpoint": "/api/v1/orders", "collection": "orders"},
+}
+
+# Seeded product and customer ids kept for orders to reference
+SEED_ID_POOL = 10000
+
+# Products need real Category ids, but the API has no category endpoint, so
+# seeded categories are written straight to this MongoDB collection
+SEED_CATEGORY_COLLECTION = "categories"
+
+class SeedDataGenerator:
+    """
+    Deterministic synthetic products, customers, leads and orders
+    
+    Every kind draws from its own random.Random seeded with (seed, kind), so
+    record i of a kind is the same on every run whatever else is generated.
+    Records are yielded lazily, so millions of them never sit in memory at
+    once. Payloads follow the backend's Mongoose models, including their
+    required references (category, creator/createdBy, order customer and
+    products), which the caller passes in. Unique fields (emails, SKUs,
+    slugs, order numbers) embed the seed, which means a batch has to be torn
+    down before the same seed is loaded again.
+    """
+    
+    FIRST_NAMES = ["Ada", "Ben", "Chloe", "Diego", "Elena", "Farah", "Gus", "Hana", "Ivan", "Jade",
+                   "Kofi", "Lena", "Mateo", "Nora", "Omar", "Priya", "Quinn", "Rosa", "Sami", "Tara"]
+    LAST_NAMES = ["Adams", "Brown", "Chen", "Diaz", "Evans", "Fischer", "Garcia", "Hughes", "Ito", "Jones",
+                  "Khan", "Lopez", "Moreau", "Nakamura", "Okafor", "Patel", "Rossi", "Silva", "Tanaka", "Weber"]
+    ADJECTIVES = ["Classic", "Compact", "Deluxe", "Eco", "Essential", "Premium", "Pro", "Smart", "Ultra", "Vintage"]
+    NOUNS = ["Backpack", "Course", "Headphones", "Lamp", "Mug", "Notebook", "Planner", "Poster", "Template", "Toolkit"]
+    CATEGORIES = ["digital", "apparel", "education", "home", "electronics", "stationery"]
+    COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Vandelay", "Stark", "Wayne", "Wonka", "Tyrell"]
+    CITIES = [("Austin", "TX", "73301"), ("Boston", "MA", "02108"), ("Chicago", "IL", "60601"),
+              ("Denver", "CO", "80202"), ("Miami", "FL", "33101"), ("Seattle", "WA", "98101")]
+    STREETS = ["Main St", "Oak Ave", "Pine Rd", "Maple Dr", "Cedar Ln", "Elm St"]
+    
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.batch = f"seed-{seed}"
+        self.order_prefix = f"SEED-{seed}-"
+    
+    def _rng(self, kind: str) -> random.Random:
+        return random.Random(f"{self.seed}:{kind}")
+    
+    def _person(self, rng: random.Random, index: int, kind: str) -> Tuple[str, str, str]:
+        first, last = rng.choice(self.FIRST_NAMES), rng.choice(self.LAST_NAMES)
+        email = f"{first}.{last}.{kind}{index}.s{self.seed}@loadtest.mewayz.com".lower()
+        return first, last, email
+    
+    def batch_filter(self, kind: str) -> Dict[str, str]:
+        """Query parameters that select this batch's records on the list endpoint of `kind`
+        
+        Customers and leads match the batch tag through the controllers'
+        field filter. Products only search their tags as a regex, hence the
+        anchors, and orders have no tags, so they match on the orderNumber
+        prefix with the gte/lt range operators.
+        """
+        if kind == "products":
+            return {"search": f"^{self.batch}$"}
+        if kind == "orders":
+            return {"orderNumber[gte]": self.order_prefix, "orderNumber[lt]": self.order_prefix[:-1] + "."}
+        return {"tags": self.batch}
+    
+    def categories(self) -> Iterator[Dict[str, Any]]:
+        """One category per CATEGORIES entry, for products to reference"""
+        for name in self.CATEGORIES:
+            yield {
+                "name": name.title(),
+                "slug": f"{name}-{self.batch}",
+                "description": f"Synthetic {name} category of {self.batch}"
+            }
+    
+    def products(self, count: int, category_ids: List[Any], creator: Any) -> Iterator[Dict[str, Any]]:
+        """Published products in `category_ids`, created by user `creator`"""
+        rng = self._rng("products")
+        for index in range(count):
+            yield {
+                "name": f"{rng.choice(self.ADJECTIVES)} {rng.choice(self.NOUNS)} {index}",
+                "description": f"Synthetic product {index} of {self.batch}",
+                "price": round(rng.uniform(5, 500), 2),
+                "sku": f"SEED-{self.seed}-P{index:08d}",
+                "category": rng.choice(category_ids),
+                "creator": creator,
+                "inventory": {"stock": rng.randint(0, 1000)},
+                "status": "published",
+                "tags": [self.batch],
+                "seo": {"slug": f"seed-{self.seed}-product-{index}"}
+            }
+    
+    def customers(self, count: int, created_by: Any) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("customers")
+        for index in range(count):
+            first, last, email = self._person(rng, index, "customer")
+            yield {
+                "name": f"{first} {last}",
+                "email": email,
+                "phone": f"+1{rng.randint(2000000000, 9999999999)}",
+                "status": rng.choice(["lead", "prospect", "customer", "inactive", "churned"]),
+                "source": rng.choice(["website", "referral", "social", "email", "event", "other"]),
+                "tags": [self.batch],
+                "createdBy": created_by
+            }
+    
+    def leads(self, count: int, created_by: Any) -> Iterator[Dict[str, Any]]:
+        rng = self._rng("leads")
+        for index in range(count):
+            first, last, email = self._person(rng, index, "lead")
+            yield {
+                "firstName": first,
+                "lastName": last,
+                "email": email,
+                "company": rng.choice(self.COMPANIES),
+                "status": rng.choice(["new", "contacted", "qualified", "proposal", "negotiation", "won", "lost"]),
+                "source": rng.choice(["website", "referral", "social", "email", "event", "cold_call", "other"]),
+                "priority": rng.choice(["low", "medium", "high", "urgent"]),
+                "estimatedValue": rng.randint(100, 50000),
+                "tags": [self.batch],
+                "createdBy": created_by
+            }
+    
+    def orders(self, count: int, product_ids: List[Any], customer_ids: List[Any]) -> Iterator[Dict[str, Any]]:
+        """Orders of 1-4 items drawn from `product_ids`, each placed by one of `customer_ids`"""
+        rng = self._rng("orders")
+        for index in range(count):
+            items = []
+            for _ in range(rng.randint(1, 4)):
+                quantity, price = rng.randint(1, 5), round(rng.uniform(5, 500), 2)
+                items.append({"product": rng.choice(product_ids), "quantity": quantity,
+                              "price": price, "total": round(quantity * price, 2)})
+            subtotal = round(sum(item["total"] for item in items), 2)
+            shipping = rng.choice([0.0, 4.99, 9.99])
+            total = round(subtotal + shipping, 2)
+            first, last, _ = self._person(rng, index, "order")
+            city, state, zip_code = rng.choice(self.CITIES)
+            address = {
+                "firstName": first,
+                "lastName": last,
+                "address1": f"{rng.randint(1, 9999)} {rng.choice(self.STREETS)}",
+                "city": city,
+                "state": state,
+                "zipCode": zip_code,
+                "country": "US",
+                "phone": f"+1{rng.randint(2000000000, 9999999999)}"
+            }
+            yield {
+                "orderNumber": f"{self.order_prefix}{index:08d}",
+                "customer": rng.choice(customer_ids),
+                "items": items,
+                "status": rng.choice(["pending", "confirmed", "processing", "shipped", "delivered", "cancelled"]),
+                "payment": {"method": rng.choice(["credit_card", "paypal", "stripe", "bank_transfer"]),
+                            "status": "pending", "amount": total, "currency": "USD"},
+                "totals": {"subtotal": subtotal, "tax": 0, "shipping": shipping, "discount": 0, "total": total},
+                "shipping": {"address": address, "method": "standard"},
+                "billing": {"address": dict(address), "sameAsShipping": True}
+            }
+
+# Client send-buffer levels (bytes queued at send time) that delivery latency
+# is grouped by in the WebSocket throughput report
+WS_BUFFER_LEVELS = [(0, "empty"), (4096, "<=4 KB"), (65536, "<=64 KB"), (None, ">64 KB")]
+
+def _ws_buffer_level(buffered: int) -> str:
+    for limit, label in WS_BUFFER_LEVELS:
+        if limit is None or buffered <= limit:
+            return label
+
+def _raise_open_file_limit(wanted: int):
+    """Raise the soft open file limit towards `wanted` so thousands of sockets fit"""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY or soft >= wanted:
+        return
+    target = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+    except (ValueError, OSError) as e:
+        logger.warning(f"⚠️ Could not raise the open file limit to {target}: {e}")
+    if target < wanted:
+        logger.warning(f"⚠️ Open file limit is {target}, below the {wanted} sockets requested")
 
 @dataclass
 class TestConfig:
@@ -66,10 +1241,470 @@ class TestConfig:
     websocket_url: str = "ws://localhost:5000"
     timeout: int = 30
     max_concurrent: int = 10
+    # Suite phases run_all_tests keeps in flight at once
+    phase_concurrency: int = 4
+    # Add the rate-limit burst (~200 requests) to run_all_tests
+    rate_limit_check: bool = False
+    # Connection pool of the shared session
+    connector_limit: int = 100
+    connector_limit_per_host: int = 30
+    # HTTP client backend used by make_request: aiohttp, httpx or raw
+    transport: str = "aiohttp"
+    performance_samples: int = 50
     test_user_email: str = "test@mewayz.com"
     test_user_password: str = "TestPassword123!"
     admin_email: str = "admin@mewayz.com"
     admin_password: str = "AdminPassword123!"
+    # Token a new tester starts with, so sharded load workers reuse one login
+    auth_token: Optional[str] = None
+    # Open-loop load generation (disabled while load_rps is 0)
+    load_rps: float = 0.0
+    load_duration: float = 30.0
+    load_endpoints: Optional[List[str]] = None
+    load_p99_threshold: float = 2.0
+    load_max_error_rate: float = 0.01
+    # Step/ramp load profile used for saturation detection (off unless saturation_ramp)
+    saturation_ramp: bool = False
+    ramp_mode: str = "concurrency"  # concurrency or rps
+    ramp_endpoints: List[str] = field(default_factory=lambda: ["/api/health"])
+    ramp_factor: float = 2.0
+    ramp_hold: float = 5.0
+    ramp_max_steps: int = 6
+    # Stream results to this NDJSON file instead of keeping them in memory
+    results_file: Optional[str] = None
+    # Failed load requests kept as full TestResults (the rest are only counted)
+    max_failed_samples: int = 100
+    # Soak / endurance mode (disabled while soak_duration is 0)
+    soak_duration: float = 0.0
+    soak_rps: float = 20.0
+    soak_window: float = 60.0
+    soak_drift_threshold: float = 0.25
+    backend_pid: Optional[int] = None
+    # Scenario / user-journey engine
+    scenario_file: Optional[str] = None
+    virtual_users: int = 10
+    scenario_duration: float = 60.0
+    # Access-log replay
+    replay_speed: float = 1.0
+    replay_concurrency: int = 100
+    replay_methods: List[str] = field(default_factory=lambda: ["GET", "HEAD"])
+    replay_top_routes: int = 25
+    # Asset weight tracking against a stored baseline
+    asset_baseline_file: str = "asset_baseline.json"
+    asset_js_growth_threshold: float = 0.10
+    update_asset_baseline: bool = False
+    asset_concurrency: int = 20
+    # Backend CPU profiling through the Node inspector (host:port) or an admin endpoint
+    profile_inspector: Optional[str] = None
+    profile_admin_endpoint: Optional[str] = None
+    profile_phases: bool = False
+    profile_dir: str = "profiles"
+    profile_top: int = 10
+    # Connection reuse benchmark
+    connection_benchmark_requests: int = 500
+    connection_benchmark_concurrency: int = 10
+    # WebSocket fan-out load: sockets held open, opened at ws_ramp_rate per second
+    ws_connections: int = 1000
+    ws_ramp_rate: float = 200.0
+    ws_ping_rounds: int = 5
+    ws_broadcasts: int = 20
+    # Stop opening sockets after this many failures
+    ws_connect_error_limit: int = 50
+    # WebSocket message throughput: ws_pairs sender/receiver rooms, every sender
+    # sending ws_burst_size messages ws_message_rate times per second
+    ws_pairs: int = 10
+    ws_message_rate: float = 20.0
+    ws_burst_size: int = 1
+    ws_throughput_duration: float = 10.0
+    ws_payload_bytes: int = 512
+    # Deterministic test-data seeding (records per kind) through the API or pymongo
+    seed_records: int = 10000
+    seed_value: int = 2025
+    seed_mode: str = "api"  # api or mongo
+    mongo_uri: str = "mongodb://localhost:27017/mewayz"
+    seed_batch_size: int = 1000  # documents per insert_many
+    seed_concurrency: int = 20  # API requests or insert_many batches in flight
+    seed_max_errors: int = 100
+    seed_page_size: int = 100
+    keep_seed: bool = False
+    seed_manifest_file: str = "seed_manifest.json"
+
+# Core endpoints exercised by the API phase and the load generators
+API_ENDPOINTS = [
+    # Analytics endpoints
+    ("Analytics Dashboard", "GET", "/api/v1/analytics/dashboard"),
+    ("Real-time Metrics", "GET", "/api/v1/analytics/real-time-metrics"),
+    ("User Activities", "GET", "/api/v1/analytics/user-activities"),
+    ("Sales Analytics", "GET", "/api/v1/analytics/sales"),
+    ("Customer Analytics", "GET", "/api/v1/analytics/customers"),
+    ("Product Analytics", "GET", "/api/v1/analytics/products"),
+    ("Order Analytics", "GET", "/api/v1/analytics/orders"),
+    ("Lead Analytics", "GET", "/api/v1/analytics/leads"),
+    
+    # User management
+    ("Get Users", "GET", "/api/v1/users"),
+    ("Get Current User", "GET", "/api/v1/auth/me"),
+    
+    # Product management
+    ("Get Products", "GET", "/api/v1/products"),
+    ("Get Customers", "GET", "/api/v1/customers"),
+    ("Get Orders", "GET", "/api/v1/orders"),
+    ("Get Leads", "GET", "/api/v1/leads"),
+    
+    # Course platform
+    ("Get Courses", "GET", "/api/v1/courses"),
+    ("Get Creators", "GET", "/api/v1/creators"),
+    
+    # E-commerce
+    ("Get Shop Items", "GET", "/api/v1/shop-items"),
+    
+    # Support system
+    ("Get Knowledge Base", "GET", "/api/v1/knowledge-base"),
+    ("Get Support Tickets", "GET", "/api/v1/support-tickets"),
+    
+    # Enterprise features
+    ("Cross-platform Management", "GET", "/api/v1/cross-platform/platforms"),
+    ("AI Content Suite", "GET", "/api/v1/ai-content"),
+    ("Business Intelligence", "GET", "/api/v1/business-intelligence"),
+    ("Design Studio", "GET", "/api/v1/design-studio"),
+    ("Creator Monetization", "GET", "/api/v1/creator-monetization"),
+    ("Financial Services", "GET", "/api/v1/financial-services"),
+    ("Global Expansion", "GET", "/api/v1/global-expansion"),
+    
+    # Organization management
+    ("Get Organizations", "GET", "/api/v1/organizations"),
+    
+    # Public endpoints
+    ("Get FAQs", "GET", "/api/v1/faqs"),
+    ("Get Pricing", "GET", "/api/v1/pricing"),
+    ("Public Health Check", "GET", "/api/health"),
+]
+
+# Key frontend routes to test
+FRONTEND_ROUTES = [
+    "/",
+    "/dashboard",
+    "/pricing",
+    "/features",
+    "/about",
+    "/contact",
+    "/blog",
+    "/knowledge-base",
+    "/auth/login",
+    "/auth/register",
+    "/admin",
+    "/settings",
+    "/products",
+    "/courses",
+    "/analytics",
+    "/ai-content-suite",
+    "/business-intelligence",
+    "/global-expansion",
+    "/enterprise-features"
+]
+
+# Suite phases that can be driven remotely, in run_all_tests order
+SUITE_PHASES = {
+    "authentication": "test_authentication_system",
+    "api_endpoints": "test_all_api_endpoints",
+    "crud": "test_crud_operations",
+    "websocket": "test_websocket_functionality",
+    "frontend": "test_frontend_pages",
+    "performance": "test_performance",
+    "security": "test_security_vulnerabilities",
+    "data_integrity": "test_data_integrity",
+    "rate_limit": "test_rate_limiting",
+    "load": "test_open_loop_load",
+    "soak": "test_soak",
+    "scenario": "test_scenario",
+    "assets": "test_asset_weight",
+    "connections": "test_connection_reuse",
+    "ws_fanout": "test_websocket_fanout",
+    "ws_throughput": "test_websocket_throughput",
+    "seed": "test_seeded_list_performance",
+}
+
+# Phases run by run_all_tests and the phases each one waits for. Phases read
+# the auth token (and CRUD its own test_data['product_id']) set up by their
+# dependencies; everything without a path between them runs concurrently.
+# Performance waits for the functional phases so its latencies are not
+# skewed by them.
+PHASE_DEPENDENCIES = {
+    "authentication": [],
+    "frontend": [],
+    "security": [],
+    "websocket": ["authentication"],
+    "api_endpoints": ["authentication"],
+    "crud": ["authentication"],
+    "data_integrity": ["authentication"],
+    "performance": ["api_endpoints", "crud", "websocket", "frontend", "security", "data_integrity"],
+}
+
+# Opt-in with rate_limit_check: the burst runs last so the 429s it provokes
+# cannot fail other phases.
+RATE_LIMIT_DEPENDENCIES = ["performance"]
+
+# Journey used when no scenario file is given. Strings are formatted with
+# the virtual user's variables ({vu}, {iteration} and anything extracted).
+DEFAULT_SCENARIO = {
+    "journeys": [
+        {
+            "name": "purchase",
+            "weight": 3,
+            "steps": [
+                {
+                    "name": "register",
+                    "method": "POST",
+                    "endpoint": "/api/v1/auth/register",
+                    "json": {
+                        "name": "Load User {vu}",
+                        "email": "loaduser{vu}@loadtest.mewayz.com",
+                        "password": "LoadTest123!",
+                        "confirmPassword": "LoadTest123!"
+                    },
+                    "expect": [201, 400, 409],
+                    "once": True
+                },
+                {
+                    "name": "login",
+                    "method": "POST",
+                    "endpoint": "/api/v1/auth/login",
+                    "json": {"email": "loaduser{vu}@loadtest.mewayz.com", "password": "LoadTest123!"},
+                    "extract": {"token": "token"},
+                    "think_time": [0.5, 1.5]
+                },
+                {
+                    "name": "list products",
+                    "method": "GET",
+                    "endpoint": "/api/v1/products",
+                    "params": {"limit": 20},
+                    "extract": {"product_id": "data.0._id"},
+                    "think_time": [1.0, 3.0]
+                },
+                {
+                    "name": "create order",
+                    "method": "POST",
+                    "endpoint": "/api/v1/orders",
+                    "json": {
+                        "items": [{"product": "{product_id}", "quantity": 1, "price": 99.99}],
+                        "totalAmount": 99.99,
+                        "status": "pending"
+                    },
+                    "expect": [201],
+                    "think_time": [1.0, 2.0]
+                }
+            ]
+        },
+        {
+            "name": "browse",
+            "weight": 7,
+            "steps": [
+                {"name": "pricing", "method": "GET", "endpoint": "/api/v1/pricing", "think_time": [0.5, 2.0]},
+                {"name": "faqs", "method": "GET", "endpoint": "/api/v1/faqs", "think_time": [0.5, 2.0]},
+                {"name": "products", "method": "GET", "endpoint": "/api/v1/products", "think_time": [1.0, 3.0]}
+            ]
+        }
+    ]
+}
+
+def load_scenario(path: str) -> Dict[str, Any]:
+    """Load a scenario definition from a JSON or YAML file"""
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise RuntimeError("PyYAML is required for YAML scenarios (pip install pyyaml)")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+class _ScenarioVars(dict):
+    """Format mapping that leaves unknown placeholders untouched"""
+    
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+def _render(template: Any, variables: Dict[str, Any]) -> Any:
+    """Substitute virtual-user variables into strings nested in a step"""
+    if isinstance(template, str):
+        return template.format_map(_ScenarioVars(variables))
+    if isinstance(template, dict):
+        return {key: _render(value, variables) for key, value in template.items()}
+    if isinstance(template, list):
+        return [_render(value, variables) for value in template]
+    return template
+
+# Nginx "combined" and Express/morgan "combined"/"common" access log lines
+ACCESS_LOG_PATTERN = re.compile(
+    r'^\S+ \S+ \S+ \[(?P<time>[^\]]+)\] "(?P<method>[A-Z]+) (?P<path>\S+)[^"]*" (?P<status>\d{3})'
+)
+ACCESS_LOG_TIME_FORMAT = "%d/%b/%Y:%H:%M:%S %z"
+_ROUTE_ID_PATTERN = re.compile(r"/(?:[0-9a-fA-F]{24}|[0-9a-fA-F-]{36}|\d+)(?=/|$)")
+
+def iter_access_log(path: str) -> Iterator[Tuple[float, str, str, int]]:
+    """Lazily yield (timestamp, method, path, status) from an access log
+    
+    Plain and gzip-compressed files are read line by line, so arbitrarily
+    large logs replay in constant memory. Lines that do not parse are skipped.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", errors="replace") as f:
+        for line in f:
+            match = ACCESS_LOG_PATTERN.match(line)
+            if not match:
+                continue
+            try:
+                timestamp = datetime.strptime(match.group("time"), ACCESS_LOG_TIME_FORMAT).timestamp()
+            except ValueError:
+                continue
+            yield timestamp, match.group("method"), match.group("path"), int(match.group("status"))
+
+def normalize_route(path: str) -> str:
+    """Collapse ids in a request path so results group by route"""
+    return _ROUTE_ID_PATTERN.sub("/:id", path.split("?", 1)[0])
+
+def _extract(data: Any, path: str) -> Any:
+    """Follow a dotted path such as 'data.0._id' through a JSON response"""
+    for part in path.split("."):
+        if isinstance(data, list) and part.isdigit() and int(part) < len(data):
+            data = data[int(part)]
+        elif isinstance(data, dict) and part in data:
+            data = data[part]
+        else:
+            return None
+    return data
+
+# Asset kinds tracked by the asset weight crawler, by file extension
+ASSET_KINDS = {
+    ".js": "js", ".mjs": "js",
+    ".css": "css",
+    ".woff": "font", ".woff2": "font", ".ttf": "font", ".otf": "font", ".eot": "font",
+    ".png": "image", ".jpg": "image", ".jpeg": "image", ".gif": "image", ".webp": "image",
+    ".avif": "image", ".svg": "image", ".ico": "image",
+}
+
+# Only advertise br when aiohttp has a decoder for it
+ASSET_ACCEPT_ENCODING = "gzip, deflate, br" if brotli else "gzip, deflate"
+
+class AssetCollector(HTMLParser):
+    """Collect (kind, url) pairs for the JS, CSS, font and image assets of a page"""
+    
+    def __init__(self, page_url: str):
+        super().__init__()
+        self.page_url = page_url
+        self.assets: Dict[str, str] = {}
+    
+    def add(self, url: Optional[str], kind: Optional[str] = None):
+        if not url or url.startswith(("data:", "blob:", "javascript:", "#")):
+            return
+        url = urljoin(self.page_url, url.strip())
+        if kind is None:
+            extension = os.path.splitext(urlparse(url).path)[1].lower()
+            kind = ASSET_KINDS.get(extension, "other")
+        self.assets.setdefault(url, kind)
+    
+    def handle_starttag(self, tag: str, attrs):
+        attrs = dict(attrs)
+        if tag == "script":
+            self.add(attrs.get("src"), "js")
+        elif tag == "link":
+            rel = (attrs.get("rel") or "").lower().split()
+            kind = {"script": "js", "style": "css", "font": "font", "image": "image"}.get(attrs.get("as", ""))
+            if "stylesheet" in rel:
+                self.add(attrs.get("href"), "css")
+            elif "modulepreload" in rel:
+                self.add(attrs.get("href"), "js")
+            elif {"preload", "prefetch", "icon", "apple-touch-icon"} & set(rel):
+                self.add(attrs.get("href"), kind)
+        elif tag in ("img", "source"):
+            self.add(attrs.get("src"), "image" if tag == "img" else None)
+            for candidate in (attrs.get("srcset") or "").split(","):
+                self.add(candidate.strip().split(" ")[0], "image" if tag == "img" else None)
+
+def parse_assets(html: str, page_url: str) -> Dict[str, str]:
+    """Map every asset URL referenced by a page to its kind"""
+    collector = AssetCollector(page_url)
+    collector.feed(html)
+    collector.close()
+    return collector.assets
+
+def transferred_bytes(response: aiohttp.ClientResponse, body: bytes) -> int:
+    """Bytes on the wire: Content-Length of a compressed response, or a gzip estimate when chunked"""
+    if not response.headers.get("Content-Encoding"):
+        return len(body)
+    if response.content_length is not None:
+        return response.content_length
+    return len(gzip.compress(body))
+
+def revisit_headers(headers) -> Optional[Dict[str, str]]:
+    """
+    Request headers a browser cache sends when revisiting a response
+    
+    None means the cached copy is still fresh (max-age > 0 or immutable,
+    without no-cache/no-store) and is used without a request. Otherwise the
+    ETag/Last-Modified validators are sent, except under no-store.
+    """
+    directives = {}
+    for directive in (headers.get("Cache-Control") or "").lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name] = value.strip('"')
+    if "no-store" in directives:
+        return {}
+    if "no-cache" not in directives:
+        try:
+            max_age = int(directives.get("max-age", "0"))
+        except ValueError:
+            max_age = 0
+        if max_age > 0 or "immutable" in directives:
+            return None
+    conditional = {}
+    if headers.get("ETag"):
+        conditional["If-None-Match"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        conditional["If-Modified-Since"] = headers["Last-Modified"]
+    return conditional
+
+# Weighted operations of the soak workload
+SOAK_WORKLOAD = [
+    ("list", 50),
+    ("read", 15),
+    ("auth", 10),
+    ("create", 10),
+    ("update", 8),
+    ("delete", 7),
+]
+
+SOAK_LIST_ENDPOINTS = [
+    "/api/v1/products",
+    "/api/v1/customers",
+    "/api/v1/orders",
+    "/api/v1/leads",
+]
+
+def _trend(values: List[float]) -> Tuple[float, float]:
+    """
+    Return (tau, growth) for a time series
+    
+    tau is the Kendall rank correlation against time (1.0 = strictly
+    increasing), growth is the relative increase of the last quarter's mean
+    over the first quarter's mean. Together they separate a steady leak from
+    noise or a one-off spike.
+    """
+    n = len(values)
+    if n < 2:
+        return 0.0, 0.0
+    concordant = discordant = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if values[j] > values[i]:
+                concordant += 1
+            elif values[j] < values[i]:
+                discordant += 1
+    tau = (concordant - discordant) / (n * (n - 1) / 2)
+    quarter = max(1, n // 4)
+    head = sum(values[:quarter]) / quarter
+    tail = sum(values[-quarter:]) / quarter
+    growth = (tail - head) / head if head > 0 else 0.0
+    return tau, growth
 
 class ComprehensiveMEWAYZTester:
     """
@@ -81,32 +1716,65 @@ class ComprehensiveMEWAYZTester:
     
     def __init__(self, config: TestConfig):
         self.config = config
-        self.results: List[TestResult] = []
+        self.results: ResultSink = (NDJSONResultSink(config.results_file, encode=result_to_dict,
+                                                     decode=result_from_dict)
+                                    if config.results_file else MemoryResultSink())
         self.session: Optional[aiohttp.ClientSession] = None
-        self.auth_token: Optional[str] = None
+        self.transport: Optional[Transport] = None
+        self.auth_token: Optional[str] = config.auth_token
         self.admin_token: Optional[str] = None
         self.test_data: Dict[str, Any] = {}
-        self.start_time = time.time()
+        self.samples = SampleStore()
+        self.failed_samples: List[TestResult] = []
+        self.report_sections: Dict[str, Any] = {}
+        self.profiler = None
+        self._profiling = False
+        if config.profile_inspector:
+            self.profiler = InspectorProfiler(*_parse_address(config.profile_inspector))
+        elif config.profile_admin_endpoint:
+            self.profiler = AdminEndpointProfiler(self, config.profile_admin_endpoint)
+        self.start_time = time.perf_counter()
         
     async def __aenter__(self):
         """Async context manager entry"""
-        connector = aiohttp.TCPConnector(limit=100, limit_per_host=30)
+        connector = aiohttp.TCPConnector(limit=self.config.connector_limit,
+                                         limit_per_host=self.config.connector_limit_per_host)
         timeout = aiohttp.ClientTimeout(total=self.config.timeout)
         self.session = aiohttp.ClientSession(
             connector=connector,
             timeout=timeout,
-            headers={'Content-Type': 'application/json'}
+            headers={'Content-Type': 'application/json'},
+            trace_configs=[create_phase_trace_config()]
         )
+        try:
+            self.transport = self._create_transport()
+        except Exception:
+            await self.session.close()
+            raise
         return self
     
+    def _create_transport(self) -> Transport:
+        """Build the make_request backend selected by config.transport"""
+        if self.config.transport == "aiohttp":
+            return AiohttpTransport(self.session)
+        headers = {'Content-Type': 'application/json'}
+        if self.config.transport == "httpx":
+            return HttpxTransport(self.config.connector_limit, self.config.timeout, headers)
+        if self.config.transport == "raw":
+            return RawHTTPTransport(self.config.connector_limit, self.config.timeout, headers)
+        raise ValueError(f"Unknown transport: {self.config.transport}")
+    
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
+        if self.transport:
+            await self.transport.close()
         if self.session:
             await self.session.close()
+        self.results.close()
 
     def record_result(self, result: TestResult):
         """Record a test result"""
-        self.results.append(result)
+        self.results.write(result)
         status_emoji = {
             'PASS': '✅',
             'FAIL': '❌', 
@@ -123,31 +1791,116 @@ class ComprehensiveMEWAYZTester:
                 logger.error(f"   └─ Error: {result.error}")
 
     async def make_request(self, method: str, endpoint: str, **kwargs) -> Tuple[int, Dict]:
-        """Make HTTP request with error handling"""
+        """Make HTTP request with error handling
+        
+        `auth_token` overrides the tester's token for this call (None sends
+        the request unauthenticated), which lets virtual users carry their
+        own sessions over the shared ClientSession. `body` selects how the
+        response is read: "json" (parsed), "raw" (bytes) or "none" (drained
+        and discarded) when only status and latency matter.
+        
+        Every request carries X-Request-ID and traceparent headers. Pass a
+        RequestTrace as `trace` to choose the ids and get back the measured
+        total and the backend's Server-Timing metrics.
+        """
         url = urljoin(self.config.base_url, endpoint)
-        headers = kwargs.pop('headers', {})
+        # Copied so a header dict the caller reuses never picks up our auth and trace ids
+        headers = dict(kwargs.pop('headers', None) or {})
+        auth_token = kwargs.pop('auth_token', self.auth_token)
+        trace = kwargs.pop('trace', None) or RequestTrace()
         
-        if self.auth_token and 'authorization' not in headers:
-            headers['Authorization'] = f'Bearer {self.auth_token}'
-            
+        if auth_token and not any(key.lower() == 'authorization' for key in headers):
+            headers['Authorization'] = f'Bearer {auth_token}'
+        headers.update(trace.headers())
+        
+        trace.mark("start")
         try:
-            async with self.session.request(method, url, headers=headers, **kwargs) as response:
-                try:
-                    data = await response.json()
-                except:
-                    data = {"text": await response.text()}
-                return response.status, data
+            return await self.transport.request(method, url, headers, trace=trace, **kwargs)
         except Exception as e:
             return 0, {"error": str(e)}
+        finally:
+            trace.mark("body_end")
+            trace.total = (trace.marks["body_end"] - trace.marks["start"]) / 1e9
+
+    @asynccontextmanager
+    async def cpu_profile(self, label: str, enabled: bool = True):
+        """Capture a backend CPU profile around the block
+        
+        Does nothing without a configured profiler, or when a profile is
+        already running (an enclosing phase profile wins over the endpoint
+        profiles inside it). Profiling failures are logged, never raised.
+        """
+        started = False
+        if enabled and self.profiler is not None and not self._profiling:
+            try:
+                await self.profiler.start()
+                started = self._profiling = True
+            except Exception as e:
+                logger.warning(f"⚠️ Could not start CPU profile for {label}: {e}")
+        try:
+            yield
+        finally:
+            if started:
+                self._profiling = False
+                await self._finish_profile(label)
+
+    async def _finish_profile(self, label: str):
+        """Stop the running profile, save it and summarize its hottest functions"""
+        try:
+            profile = await self.profiler.stop()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not stop CPU profile for {label}: {e}")
+            return
+        
+        os.makedirs(self.config.profile_dir, exist_ok=True)
+        filename = re.sub(r"[^A-Za-z0-9_.-]+", "_", label).strip("_") + ".cpuprofile"
+        path = os.path.join(self.config.profile_dir, filename)
+        with open(path, "w") as f:
+            json.dump(profile, f)
+        
+        hottest = summarize_cpu_profile(profile, self.config.profile_top)
+        self.report_sections.setdefault("cpu_profiles", {})[label] = {"file": path, "hottest": hottest}
+        logger.info(f"🔥 {label}: profile saved to {path}")
+
+    def _hottest_functions(self, label: str, count: int = 3) -> str:
+        """Short 'fn (12.3%)' list of a captured profile, for result details"""
+        profile = self.report_sections.get("cpu_profiles", {}).get(label)
+        if not profile:
+            return ""
+        return ", ".join(f"{h['function']} ({h['self_pct']:.1f}%)" for h in profile["hottest"][:count])
+
+    @asynccontextmanager
+    async def stream_list(self, endpoint: str, key: str = "data", params: Optional[Dict[str, Any]] = None):
+        """Stream the items of a list endpoint without parsing the whole payload
+        
+        Yields (status, items) where items is an async iterator over the
+        array under `key`. Breaking out of the iteration stops reading; a
+        fully read response without that array raises ValueError.
+        """
+        url = urljoin(self.config.base_url, endpoint)
+        headers = {'Authorization': f'Bearer {self.auth_token}'} if self.auth_token else {}
+        
+        async with self.transport.stream("GET", url, headers, params=params) as (status, chunks):
+            async def items():
+                parser = JSONArrayStream(key)
+                async for chunk in chunks:
+                    for item in parser.feed(chunk):
+                        yield item
+                    if parser.done:
+                        return
+                raise ValueError(f"Response has no '{key}' array")
+            
+            yield status, items()
 
     async def test_endpoint(self, name: str, method: str, endpoint: str, 
                            expected_status: int = 200, **kwargs) -> TestResult:
         """Test a single API endpoint"""
-        start_time = time.time()
+        start_time = time.perf_counter()
+        trace = RequestTrace()
         
         try:
-            status, data = await self.make_request(method, endpoint, **kwargs)
-            duration = time.time() - start_time
+            status, data = await self.make_request(method, endpoint, trace=trace, **kwargs)
+            duration = time.perf_counter() - start_time
             
             if status == expected_status:
                 return TestResult(
@@ -158,7 +1911,9 @@ class ComprehensiveMEWAYZTester:
                     details=f"{method} {endpoint} returned {status}",
                     endpoint=endpoint,
                     actual=status,
-                    expected=expected_status
+                    expected=expected_status,
+                    timing=trace.breakdown(),
+                    phases=trace.phases()
                 )
             else:
                 return TestResult(
@@ -166,15 +1921,17 @@ class ComprehensiveMEWAYZTester:
                     category="API", 
                     status="FAIL",
                     duration=duration,
-                    details=f"Expected {expected_status}, got {status}",
+                    details=f"Expected {expected_status}, got {status} (request {trace.request_id})",
                     endpoint=endpoint,
                     actual=status,
                     expected=expected_status,
-                    error=str(data) if status == 0 else None
+                    error=str(data) if status == 0 else None,
+                    timing=trace.breakdown(),
+                    phases=trace.phases()
                 )
                 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return TestResult(
                 test_name=name,
                 category="API",
@@ -216,10 +1973,10 @@ class ComprehensiveMEWAYZTester:
             "password": self.config.test_user_password
         }
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             status, data = await self.make_request("POST", "/api/v1/auth/login", json=login_data)
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             if status == 200 and data.get('token'):
                 self.auth_token = data['token']
@@ -241,7 +1998,7 @@ class ComprehensiveMEWAYZTester:
                     endpoint="/api/v1/auth/login"
                 )
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             result = TestResult(
                 test_name="User Login",
                 category="Authentication",
@@ -272,56 +2029,7 @@ class ComprehensiveMEWAYZTester:
         """🌐 Test all API endpoints comprehensively"""
         logger.info("🌐 Testing All API Endpoints...")
         
-        # Core endpoints
-        endpoints = [
-            # Analytics endpoints
-            ("Analytics Dashboard", "GET", "/api/v1/analytics/dashboard"),
-            ("Real-time Metrics", "GET", "/api/v1/analytics/real-time-metrics"),
-            ("User Activities", "GET", "/api/v1/analytics/user-activities"),
-            ("Sales Analytics", "GET", "/api/v1/analytics/sales"),
-            ("Customer Analytics", "GET", "/api/v1/analytics/customers"),
-            ("Product Analytics", "GET", "/api/v1/analytics/products"),
-            ("Order Analytics", "GET", "/api/v1/analytics/orders"),
-            ("Lead Analytics", "GET", "/api/v1/analytics/leads"),
-            
-            # User management
-            ("Get Users", "GET", "/api/v1/users"),
-            ("Get Current User", "GET", "/api/v1/auth/me"),
-            
-            # Product management
-            ("Get Products", "GET", "/api/v1/products"),
-            ("Get Customers", "GET", "/api/v1/customers"),
-            ("Get Orders", "GET", "/api/v1/orders"),
-            ("Get Leads", "GET", "/api/v1/leads"),
-            
-            # Course platform
-            ("Get Courses", "GET", "/api/v1/courses"),
-            ("Get Creators", "GET", "/api/v1/creators"),
-            
-            # E-commerce
-            ("Get Shop Items", "GET", "/api/v1/shop-items"),
-            
-            # Support system
-            ("Get Knowledge Base", "GET", "/api/v1/knowledge-base"),
-            ("Get Support Tickets", "GET", "/api/v1/support-tickets"),
-            
-            # Enterprise features
-            ("Cross-platform Management", "GET", "/api/v1/cross-platform/platforms"),
-            ("AI Content Suite", "GET", "/api/v1/ai-content"),
-            ("Business Intelligence", "GET", "/api/v1/business-intelligence"),
-            ("Design Studio", "GET", "/api/v1/design-studio"),
-            ("Creator Monetization", "GET", "/api/v1/creator-monetization"),
-            ("Financial Services", "GET", "/api/v1/financial-services"),
-            ("Global Expansion", "GET", "/api/v1/global-expansion"),
-            
-            # Organization management
-            ("Get Organizations", "GET", "/api/v1/organizations"),
-            
-            # Public endpoints
-            ("Get FAQs", "GET", "/api/v1/faqs"),
-            ("Get Pricing", "GET", "/api/v1/pricing"),
-            ("Public Health Check", "GET", "/api/health"),
-        ]
+        endpoints = API_ENDPOINTS
         
         # Test all endpoints concurrently
         tasks = []
@@ -469,64 +2177,485 @@ class ComprehensiveMEWAYZTester:
         """⚡ Test WebSocket real-time functionality"""
         logger.info("⚡ Testing WebSocket Functionality...")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        try:
+            async with websockets.connect(self._websocket_url()) as websocket:
+                # Test connection
+                duration = time.perf_counter() - start_time
+                self.record_result(TestResult(
+                    test_name="WebSocket Connection",
+                    category="Real-time",
+                    status="PASS",
+                    duration=duration,
+                    details="WebSocket connection established"
+                ))
+                
+                # Test sending message
+                test_message = {
+                    "type": "ping",
+                    "data": {"message": "test"}
+                }
+                
+                await websocket.send(json.dumps(test_message))
+                
+                # Test receiving message
+                try:
+                    response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
+                    response_data = json.loads(response)
+                    
+                    self.record_result(TestResult(
+                        test_name="WebSocket Message Exchange",
+                        category="Real-time",
+                        status="PASS",
+                        duration=time.perf_counter() - start_time,
+                        details=f"Message exchange successful: {response_data.get('type', 'unknown')}"
+                    ))
+                    
+                except asyncio.TimeoutError:
+                    self.record_result(TestResult(
+                        test_name="WebSocket Message Exchange",
+                        category="Real-time",
+                        status="FAIL",
+                        duration=time.perf_counter() - start_time,
+                        details="No response received within timeout"
+                    ))
+                    
+        except Exception as e:
+            duration = time.perf_counter() - start_time
+            self.record_result(TestResult(
+                test_name="WebSocket Connection",
+                category="Real-time",
+                status="ERROR",
+                duration=duration,
+                details=f"WebSocket test failed: {str(e)}",
+                error=str(e)
+            ))
+
+    def _websocket_url(self) -> str:
+        """The /ws endpoint, authenticated with the tester's token when there is one"""
+        ws_url = f"{self.config.websocket_url}/ws"
+        if self.auth_token:
+            ws_url += f"?token={self.auth_token}"
+        return ws_url
+
+    # =========================================================================
+    # WEBSOCKET FAN-OUT
+    # =========================================================================
+    
+    async def test_websocket_fanout(self):
+        """📡 Hold ws_connections authenticated sockets and measure their latencies
+        
+        Sockets are opened at ws_ramp_rate per second until ws_connections are
+        open or ws_connect_error_limit attempts have failed; the number held
+        when the first failure happened is the server's practical capacity.
+        Every open socket then sends ws_ping_rounds pings (round trip to pong),
+        and all of them join one room in which ws_broadcasts messages are sent
+        from rotating members. Broadcast latency is measured from send to
+        arrival at each other member (the server excludes the sender).
+        """
+        target = self.config.ws_connections
+        timeout = self.config.timeout
+        logger.info(f"📡 Opening {target} WebSocket connections at {self.config.ws_ramp_rate:.0f}/s...")
+        _raise_open_file_limit(target + 256)
+        
+        opened = await self._open_websockets(target)
+        clients = opened["clients"]
+        try:
+            connect_histogram = opened["histogram"]
+            first_error = opened["first_error"]
+            failed = sum(opened["errors"].values())
+            details = (f"{len(clients)}/{target} open at {self.config.ws_ramp_rate:.0f}/s, "
+                       f"connect p50: {connect_histogram.percentile(50):.3f}s, "
+                       f"p99: {connect_histogram.percentile(99):.3f}s")
+            if first_error:
+                details += (f", {failed} failed; first failure with {first_error['held']} open: "
+                            f"{first_error['error']}")
+            self.record_result(TestResult(
+                test_name="WebSocket Fan-out: Connections",
+                category="Real-time",
+                status="PASS" if clients and not failed else "FAIL",
+                duration=opened["elapsed"],
+                details=details,
+                histogram=connect_histogram
+            ))
+            
+            ping_start = time.perf_counter()
+            ping_histogram, ping_errors = await self._measure_ws_pings(clients, timeout)
+            attempts = ping_histogram.count + ping_errors
+            self.record_result(TestResult(
+                test_name="WebSocket Fan-out: Ping RTT",
+                category="Real-time",
+                status="PASS" if ping_histogram.count and not ping_errors else "FAIL",
+                duration=time.perf_counter() - ping_start,
+                details=(f"{ping_histogram.count}/{attempts} pongs, p50: {ping_histogram.percentile(50):.3f}s, "
+                         f"p99: {ping_histogram.percentile(99):.3f}s, max: {ping_histogram.max:.3f}s"),
+                histogram=ping_histogram
+            ))
+            
+            broadcast = await self._measure_ws_broadcasts(clients, timeout)
+            delivery_histogram = broadcast["histogram"]
+            complete_histogram = broadcast["complete"]
+            self.record_result(TestResult(
+                test_name="WebSocket Fan-out: Broadcast",
+                category="Real-time",
+                status="PASS" if broadcast["expected"] and not broadcast["missing"] else "FAIL",
+                duration=broadcast["elapsed"],
+                details=(f"{delivery_histogram.count}/{broadcast['expected']} deliveries to "
+                         f"{broadcast['members']} members, per-member p50: {delivery_histogram.percentile(50):.3f}s, "
+                         f"p99: {delivery_histogram.percentile(99):.3f}s, "
+                         f"full fan-out p99: {complete_histogram.percentile(99):.3f}s"),
+                histogram=delivery_histogram
+            ))
+            
+            self.report_sections["websocket_fanout"] = {
+                "target_connections": target,
+                "ramp_rate": self.config.ws_ramp_rate,
+                "connections_opened": len(clients),
+                "connect_errors": opened["errors"],
+                "held_at_first_error": first_error["held"] if first_error else None,
+                "first_error": first_error["error"] if first_error else None,
+                "closed_by_server": sum(1 for client in clients if client.closed is not None),
+                "connect_latency": connect_histogram.summary(),
+                "ping_rtt": ping_histogram.summary(),
+                "ping_errors": ping_errors,
+                "broadcast_members": broadcast["members"],
+                "broadcast_missing": broadcast["missing"],
+                "broadcast_latency": delivery_histogram.summary(),
+                "broadcast_complete": complete_histogram.summary()
+            }
+        finally:
+            await asyncio.gather(*[client.close() for client in clients], return_exceptions=True)
+
+    async def _open_websockets(self, target: int) -> Dict[str, Any]:
+        """Open up to `target` sockets at ws_ramp_rate per second"""
+        loop = asyncio.get_running_loop()
+        url = self._websocket_url()
+        histogram = LatencyHistogram()
+        clients: List[WebSocketClient] = []
+        errors: Dict[str, int] = {}
+        first_error: Optional[Dict[str, Any]] = None
+        
+        async def open_one():
+            nonlocal first_error
+            try:
+                client, latency = await WebSocketClient.connect(url, self.config.timeout)
+            except Exception as e:
+                kind = type(e).__name__
+                errors[kind] = errors.get(kind, 0) + 1
+                if first_error is None:
+                    first_error = {"held": len(clients), "error": f"{kind}: {e}"}
+                return
+            histogram.record(latency)
+            clients.append(client)
+        
+        start = loop.time()
+        tasks = []
+        for index in range(target):
+            if sum(errors.values()) >= self.config.ws_connect_error_limit:
+                logger.warning(f"⚠️ Stopped opening WebSockets after {sum(errors.values())} failures")
+                break
+            delay = start + index / self.config.ws_ramp_rate - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(open_one()))
+        await asyncio.gather(*tasks)
+        
+        return {
+            "clients": clients,
+            "histogram": histogram,
+            "errors": errors,
+            "first_error": first_error,
+            "elapsed": loop.time() - start
+        }
+
+    async def _measure_ws_pings(self, clients: List[WebSocketClient], timeout: float) -> Tuple[LatencyHistogram, int]:
+        """Ping every open socket ws_ping_rounds times; returns the RTT histogram and failures
+        
+        Each ping carries a seq id and a pong echoing it is matched exactly.
+        The backend's pong carries no id, but it answers a socket's pings in
+        order, so the pongs still owed for earlier timed-out pings are
+        skipped before a pong is attributed to the current ping.
+        """
+        histogram = LatencyHistogram()
+        errors = 0
+        owed: Dict[int, int] = {}  # id(client) -> pongs still due for timed-out pings
+        
+        async def ping(client: WebSocketClient, seq: int):
+            nonlocal errors
+            skip = owed.get(id(client), 0)
+            sent = time.perf_counter()
+            deadline = sent + timeout
+            try:
+                await client.send({"type": "ping", "seq": seq})
+                while True:
+                    received, message = await client.expect("pong", max(deadline - time.perf_counter(), 0))
+                    if message.get("seq") == seq:
+                        break
+                    if "seq" not in message:
+                        if not skip:
+                            break
+                        skip -= 1
+            except Exception:
+                owed[id(client)] = skip + 1
+                errors += 1
+                return
+            owed[id(client)] = 0
+            histogram.record(received - sent)
+        
+        for seq in range(self.config.ws_ping_rounds):
+            await asyncio.gather(*[ping(client, seq) for client in clients if client.closed is None])
+        return histogram, errors
+
+    async def _measure_ws_broadcasts(self, clients: List[WebSocketClient], timeout: float) -> Dict[str, Any]:
+        """Send ws_broadcasts room messages and time their delivery to every other member"""
+        room = f"loadtest_fanout_{random.randint(100000, 999999)}"
+        histogram = LatencyHistogram()
+        complete = LatencyHistogram()
+        start = time.perf_counter()
+        
+        async def join(client: WebSocketClient) -> bool:
+            try:
+                await client.send({"type": "join_room", "room": room})
+                await client.expect("room_joined", timeout, match=lambda m: m.get("room") == room)
+                return True
+            except Exception:
+                return False
+        
+        live = [client for client in clients if client.closed is None]
+        joined = await asyncio.gather(*[join(client) for client in live])
+        members = [client for client, ok in zip(live, joined) if ok]
+        expected = missing = 0
+        
+        for seq in range(self.config.ws_broadcasts if len(members) > 1 else 0):
+            sender = members[seq % len(members)]
+            receivers = [client for client in members if client is not sender]
+            is_current = lambda m, seq=seq: m.get("room") == room and (m.get("message") or {}).get("seq") == seq
+            waiters = [asyncio.create_task(client.expect("room_message", timeout, match=is_current))
+                       for client in receivers]
+            sent = time.perf_counter()
+            try:
+                await sender.send({"type": "send_message", "room": room, "message": {"seq": seq}})
+            except Exception:
+                for waiter in waiters:
+                    waiter.cancel()
+                await asyncio.gather(*waiters, return_exceptions=True)
+                continue
+            arrivals = await asyncio.gather(*waiters, return_exceptions=True)
+            latencies = [arrival[0] - sent for arrival in arrivals if not isinstance(arrival, BaseException)]
+            for latency in latencies:
+                histogram.record(latency)
+            expected += len(receivers)
+            missing += len(receivers) - len(latencies)
+            if len(latencies) == len(receivers):
+                complete.record(max(latencies))
+        
+        return {
+            "members": len(members),
+            "expected": expected,
+            "missing": missing,
+            "histogram": histogram,
+            "complete": complete,
+            "elapsed": time.perf_counter() - start
+        }
+
+    # =========================================================================
+    # WEBSOCKET THROUGHPUT
+    # =========================================================================
+    
+    async def test_websocket_throughput(self):
+        """📨 Push room messages at a fixed rate and measure delivery through /ws
+        
+        Each of ws_pairs rooms has one sending and one receiving socket. The
+        sender follows an open-loop schedule of ws_burst_size messages
+        ws_message_rate times per second for ws_throughput_duration seconds;
+        every message carries its sequence number and send timestamp, so the
+        receiver measures end-to-end latency and detects drops, reordering and
+        duplicates. Latency is also grouped by how many bytes were still
+        queued in the sender's socket buffer at send time, which shows what
+        send-queue buildup costs.
+        """
+        pairs = self.config.ws_pairs
+        rate = self.config.ws_message_rate * self.config.ws_burst_size
+        logger.info(f"📨 Sending {rate:.0f} msg/s on each of {pairs} WebSocket pairs "
+                    f"for {self.config.ws_throughput_duration:.0f}s...")
+        _raise_open_file_limit(2 * pairs + 256)
+        
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*[self._run_ws_pair(index) for index in range(pairs)],
+                                        return_exceptions=True)
+        elapsed = time.perf_counter() - start
+        stats = [outcome for outcome in outcomes if isinstance(outcome, dict)]
+        failures = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        
+        if not stats:
+            self.record_result(TestResult(
+                test_name="WebSocket Throughput: Delivery",
+                category="Real-time",
+                status="ERROR",
+                duration=elapsed,
+                details=f"No WebSocket pair could be set up: {failures[0] if failures else 'no pairs'}",
+                error=str(failures[0]) if failures else None
+            ))
+            return
+        
+        latency = LatencyHistogram()
+        send_lag = LatencyHistogram()
+        by_buffer: Dict[str, LatencyHistogram] = {}
+        totals = {"sent": 0, "delivered": 0, "dropped": 0, "reordered": 0, "duplicates": 0, "send_errors": 0}
+        max_buffered = 0
+        for pair in stats:
+            latency.merge(pair["latency"])
+            send_lag.merge(pair["send_lag"])
+            for level, histogram in pair["by_buffer"].items():
+                by_buffer.setdefault(level, LatencyHistogram()).merge(histogram)
+            for key in totals:
+                totals[key] += pair[key]
+            max_buffered = max(max_buffered, pair["max_buffered"])
         
+        target = rate * len(stats)
+        achieved = sum(pair["sent"] / pair["send_elapsed"] for pair in stats if pair["send_elapsed"] > 0)
+        healthy = not failures and not totals["dropped"] and not totals["reordered"] and not totals["send_errors"]
+        self.record_result(TestResult(
+            test_name="WebSocket Throughput: Delivery",
+            category="Real-time",
+            status="PASS" if healthy else "FAIL",
+            duration=elapsed,
+            details=(f"{totals['delivered']}/{totals['sent']} delivered over {len(stats)}/{pairs} pairs "
+                     f"({achieved:.0f}/{target:.0f} msg/s sent), p50: {latency.percentile(50):.3f}s, "
+                     f"p99: {latency.percentile(99):.3f}s, dropped {totals['dropped']}, "
+                     f"reordered {totals['reordered']}, duplicates {totals['duplicates']}"
+                     + (f", {len(failures)} pairs failed: {failures[0]}" if failures else "")),
+            histogram=latency
+        ))
+        
+        levels = [label for _, label in WS_BUFFER_LEVELS if label in by_buffer]
+        # Senders that fall well behind their schedule could not sustain the target rate
+        self.record_result(TestResult(
+            test_name="WebSocket Throughput: Send Queue",
+            category="Real-time",
+            status="PASS" if achieved >= 0.9 * target else "FAIL",
+            duration=elapsed,
+            details=(f"{achieved:.0f}/{target:.0f} msg/s sent, schedule lag p99: {send_lag.percentile(99):.3f}s, max queued {max_buffered} bytes; "
+                     + ", ".join(f"p99 {by_buffer[label].percentile(99):.3f}s when {label}" for label in levels)),
+            histogram=send_lag
+        ))
+        
+        self.report_sections["websocket_throughput"] = {
+            "pairs": len(stats),
+            "target_rate_per_pair": rate,
+            "achieved_rate": round(achieved, 1),
+            "payload_bytes": self.config.ws_payload_bytes,
+            **totals,
+            "max_buffered_bytes": max_buffered,
+            "latency": latency.summary(),
+            "schedule_lag": send_lag.summary(),
+            "latency_by_send_buffer": {label: by_buffer[label].summary() for label in levels}
+        }
+        logger.info(f"   {'Send buffer':<12} {'messages':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+        for label in levels:
+            histogram = by_buffer[label]
+            logger.info(f"   {label:<12} {histogram.count:>9} {histogram.percentile(50) * 1000:>9.2f} "
+                        f"{histogram.percentile(99) * 1000:>9.2f} {histogram.max * 1000:>9.2f}")
+
+    async def _run_ws_pair(self, index: int) -> Dict[str, Any]:
+        """Drive one sender/receiver room and return its delivery statistics"""
+        timeout = self.config.timeout
+        room = f"loadtest_throughput_{random.randint(100000, 999999)}_{index}"
+        url = self._websocket_url()
+        sender, _ = await WebSocketClient.connect(url, timeout)
         try:
-            ws_url = f"{self.config.websocket_url}/ws"
-            if self.auth_token:
-                ws_url += f"?token={self.auth_token}"
+            receiver, _ = await WebSocketClient.connect(url, timeout)
+        except BaseException:
+            await sender.close()
+            raise
+        
+        try:
+            in_room = lambda m: m.get("room") == room
+            for client in (sender, receiver):
+                await client.send({"type": "join_room", "room": room})
+                await client.expect("room_joined", timeout, match=in_room)
             
-            async with websockets.connect(ws_url) as websocket:
-                # Test connection
-                duration = time.time() - start_time
-                self.record_result(TestResult(
-                    test_name="WebSocket Connection",
-                    category="Real-time",
-                    status="PASS",
-                    duration=duration,
-                    details="WebSocket connection established"
-                ))
-                
-                # Test sending message
-                test_message = {
-                    "type": "ping",
-                    "data": {"message": "test"}
-                }
-                
-                await websocket.send(json.dumps(test_message))
-                
-                # Test receiving message
+            stats = {"sent": 0, "delivered": 0, "reordered": 0, "duplicates": 0, "send_errors": 0,
+                     "max_buffered": 0, "latency": LatencyHistogram(), "send_lag": LatencyHistogram(),
+                     "by_buffer": {}}
+            buffered_at: Dict[int, int] = {}
+            seen = set()
+            done = asyncio.Event()
+            start_time = time.perf_counter()
+            
+            async def send_messages():
+                transport = getattr(sender.websocket, "transport", None)
+                padding = "x" * self.config.ws_payload_bytes
+                interval = 1.0 / self.config.ws_message_rate
+                start = start_time
+                seq = tick = 0
                 try:
-                    response = await asyncio.wait_for(websocket.recv(), timeout=5.0)
-                    response_data = json.loads(response)
-                    
-                    self.record_result(TestResult(
-                        test_name="WebSocket Message Exchange",
-                        category="Real-time",
-                        status="PASS",
-                        duration=time.time() - start_time,
-                        details=f"Message exchange successful: {response_data.get('type', 'unknown')}"
-                    ))
-                    
-                except asyncio.TimeoutError:
-                    self.record_result(TestResult(
-                        test_name="WebSocket Message Exchange",
-                        category="Real-time",
-                        status="FAIL",
-                        duration=time.time() - start_time,
-                        details="No response received within timeout"
-                    ))
-                    
-        except Exception as e:
-            duration = time.time() - start_time
-            self.record_result(TestResult(
-                test_name="WebSocket Connection",
-                category="Real-time",
-                status="ERROR",
-                duration=duration,
-                details=f"WebSocket test failed: {str(e)}",
-                error=str(e)
-            ))
+                    while True:
+                        scheduled = start + tick * interval
+                        if scheduled - start >= self.config.ws_throughput_duration:
+                            break
+                        delay = scheduled - time.perf_counter()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                        stats["send_lag"].record(time.perf_counter() - scheduled)
+                        for _ in range(self.config.ws_burst_size):
+                            buffered = transport.get_write_buffer_size() if transport else 0
+                            buffered_at[seq] = buffered
+                            stats["max_buffered"] = max(stats["max_buffered"], buffered)
+                            message = {"seq": seq, "sent": time.perf_counter(), "pad": padding}
+                            try:
+                                await sender.send({"type": "send_message", "room": room, "message": message})
+                            except Exception:
+                                stats["send_errors"] += 1
+                                return
+                            stats["sent"] += 1
+                            seq += 1
+                        tick += 1
+                finally:
+                    stats["send_elapsed"] = time.perf_counter() - start
+                    done.set()
+            
+            async def receive_messages():
+                # After the sender stops, keep reading until everything arrived
+                # or nothing has arrived for a while; the rest counts as dropped
+                highest = -1
+                last_message = time.perf_counter()
+                while True:
+                    if done.is_set():
+                        if len(seen) >= stats["sent"]:
+                            return
+                        idle_since = max(last_message, start_time + stats["send_elapsed"])
+                        if (time.perf_counter() - idle_since > min(timeout, 5.0)
+                                and not receiver.pending("room_message")):
+                            return
+                    try:
+                        received, data = await receiver.expect("room_message", 0.25, match=in_room)
+                    except asyncio.TimeoutError:
+                        continue
+                    last_message = time.perf_counter()
+                    message = data.get("message") or {}
+                    seq = message.get("seq")
+                    if not isinstance(seq, int):
+                        continue
+                    if seq in seen:
+                        stats["duplicates"] += 1
+                        continue
+                    seen.add(seq)
+                    if seq < highest:
+                        stats["reordered"] += 1
+                    highest = max(highest, seq)
+                    delivery = received - message["sent"]
+                    stats["latency"].record(delivery)
+                    level = _ws_buffer_level(buffered_at.get(seq, 0))
+                    stats["by_buffer"].setdefault(level, LatencyHistogram()).record(delivery)
+            
+            await asyncio.gather(send_messages(), receive_messages())
+            stats["delivered"] = len(seen)
+            stats["dropped"] = stats["sent"] - len(seen)
+            return stats
+        finally:
+            await asyncio.gather(sender.close(), receiver.close(), return_exceptions=True)
 
     # =========================================================================
     # FRONTEND TESTING
@@ -536,33 +2665,12 @@ class ComprehensiveMEWAYZTester:
         """🎨 Test frontend page routing and rendering"""
         logger.info("🎨 Testing Frontend Pages...")
         
-        # Key frontend routes to test
-        frontend_routes = [
-            "/",
-            "/dashboard",
-            "/pricing", 
-            "/features",
-            "/about",
-            "/contact",
-            "/blog",
-            "/knowledge-base",
-            "/auth/login",
-            "/auth/register",
-            "/admin",
-            "/settings",
-            "/products",
-            "/courses",
-            "/analytics",
-            "/ai-content-suite",
-            "/business-intelligence",
-            "/global-expansion",
-            "/enterprise-features"
-        ]
-        
+        # Subresource fetches of the cold/warm revisits share one budget
+        semaphore = asyncio.Semaphore(self.config.asset_concurrency)
         tasks = []
-        for route in frontend_routes:
+        for route in FRONTEND_ROUTES:
             url = urljoin(self.config.frontend_url, route)
-            task = self._test_frontend_page(route, url)
+            task = self._test_frontend_page(route, url, semaphore)
             tasks.append(task)
         
         # Execute frontend tests
@@ -570,17 +2678,36 @@ class ComprehensiveMEWAYZTester:
         for result in results:
             if isinstance(result, TestResult):
                 self.record_result(result)
+        
+        self._report_page_cache()
 
-    async def _test_frontend_page(self, route: str, url: str) -> TestResult:
+    async def _test_frontend_page(self, route: str, url: str, semaphore: asyncio.Semaphore) -> TestResult:
         """Test individual frontend page"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            async with self.session.get(url) as response:
-                duration = time.time() - start_time
+            # Cold load: ask any intermediate cache for a fresh copy
+            async with self.session.get(url, headers={"Cache-Control": "no-cache", "Pragma": "no-cache"}) as response:
+                body = await response.read()
+                duration = time.perf_counter() - start_time
                 content = await response.text()
                 
                 if response.status == 200:
+                    try:
+                        await self._revalidate_page(route, url, content, response.headers, duration,
+                                                    transferred_bytes(response, body), semaphore)
+                    except Exception as e:
+                        # A failed revisit says nothing about whether the page itself loads
+                        logger.warning(f"⚠️ Warm revisit of {route} failed: {e}")
+                        self.record_result(TestResult(
+                            test_name=f"Frontend Cache: {route}",
+                            category="Frontend",
+                            status="ERROR",
+                            duration=0,
+                            details="Cold/warm revisit failed",
+                            error=f"{type(e).__name__}: {e}"
+                        ))
+                    
                     # Check for basic React/Next.js indicators
                     has_react = 'react' in content.lower() or '__NEXT_DATA__' in content
                     has_content = len(content) > 1000  # Reasonable content size
@@ -611,7 +2738,7 @@ class ComprehensiveMEWAYZTester:
                     )
                     
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             return TestResult(
                 test_name=f"Frontend Route: {route}",
                 category="Frontend",
@@ -621,104 +2748,1591 @@ class ComprehensiveMEWAYZTester:
                 error=str(e)
             )
 
+    async def _revalidate_page(self, route: str, url: str, content: str, headers, cold_duration: float,
+                               cold_bytes: int, semaphore: asyncio.Semaphore):
+        """
+        Cold load of a page's subresources, then a warm revisit of everything
+        
+        The subresources are those the asset crawler finds in the page. On
+        the warm pass every response is treated the way a browser cache
+        would (see revisit_headers): fresh responses cost nothing, stale
+        ones are revalidated with their validators, the rest re-downloaded.
+        """
+        assets = list(parse_assets(content, url))
+        cold: Dict[str, Any] = {}
+        
+        async def fetch_cold(asset_url: str):
+            async with semaphore:
+                try:
+                    status, transferred, _, asset_headers = await self._fetch_asset(
+                        asset_url, {"Cache-Control": "no-cache", "Pragma": "no-cache"})
+                except Exception:
+                    return
+                if status == 200:
+                    cold[asset_url] = (transferred, asset_headers)
+        
+        start_time = time.perf_counter()
+        await asyncio.gather(*(fetch_cold(asset_url) for asset_url in assets))
+        cold_duration += time.perf_counter() - start_time
+        cold_bytes += sum(transferred for transferred, _ in cold.values())
+        
+        # Warm revisit: (status, bytes) per response, status None when served from cache
+        async def fetch_warm(target: str, target_headers) -> Tuple[Optional[int], int]:
+            conditional = revisit_headers(target_headers)
+            if conditional is None:
+                return None, 0
+            async with semaphore:
+                status, transferred, _, _ = await self._fetch_asset(target, conditional)
+            return status, transferred
+        
+        start_time = time.perf_counter()
+        warm_status, warm_bytes = await fetch_warm(url, headers)
+        warm_assets = await asyncio.gather(*(fetch_warm(asset_url, asset_headers)
+                                             for asset_url, (_, asset_headers) in cold.items()))
+        warm_duration = time.perf_counter() - start_time
+        warm_bytes += sum(transferred for _, transferred in warm_assets)
+        statuses = [status for status, _ in warm_assets]
+        
+        self.report_sections.setdefault("page_cache", {})[route] = {
+            "cold_ms": round(cold_duration * 1000, 2),
+            "warm_ms": round(warm_duration * 1000, 2),
+            "delta_ms": round((cold_duration - warm_duration) * 1000, 2),
+            "cold_bytes": cold_bytes,
+            "warm_bytes": warm_bytes,
+            "warm_status": warm_status if warm_status is not None else "cache",
+            "subresources": len(assets),
+            "subresources_failed": len(assets) - len(cold),
+            "subresources_cached": statuses.count(None),
+            "subresources_revalidated": statuses.count(304),
+            "subresources_refetched": [asset_url for asset_url, status in zip(cold, statuses)
+                                       if status not in (None, 304)],
+            "validators": sorted(revisit_headers(headers) or {}),
+            "cache_control": headers.get("Cache-Control")
+        }
+
+    def _report_page_cache(self):
+        """Log warm vs cold page loads and flag routes that are re-downloaded"""
+        pages = self.report_sections.get("page_cache")
+        if not pages:
+            return
+        
+        logger.info("🗄️ Warm vs cold page loads:")
+        logger.info(f"   {'Route':<28} {'cold ms':>9} {'warm ms':>9} {'delta':>9} {'cold KB':>9} {'warm KB':>9} {'warm':>5} {'res':>4} {'304':>4} {'200':>4}  Cache-Control")
+        for route, page in sorted(pages.items(), key=lambda item: item[1]["warm_bytes"], reverse=True):
+            logger.info(
+                f"   {route[:28]:<28} {page['cold_ms']:>9.1f} {page['warm_ms']:>9.1f} {page['delta_ms']:>9.1f} "
+                f"{page['cold_bytes'] / 1024:>9.1f} {page['warm_bytes'] / 1024:>9.1f} {page['warm_status']:>5} "
+                f"{page['subresources']:>4} {page['subresources_revalidated']:>4} {len(page['subresources_refetched']):>4}  "
+                f"{page['cache_control'] or '-'}"
+            )
+        
+        refetched = [route for route, page in pages.items()
+                     if page["warm_status"] not in (304, "cache") or page["subresources_refetched"]]
+        cold_total = sum(page["cold_bytes"] for page in pages.values())
+        warm_total = sum(page["warm_bytes"] for page in pages.values())
+        self.record_result(TestResult(
+            test_name="Frontend Cache: Revalidation",
+            category="Frontend",
+            status="PASS" if not refetched else "FAIL",
+            duration=0,
+            details=f"{len(pages) - len(refetched)}/{len(pages)} routes served from cache or revalidated with 304, "
+                    f"warm revisit transferred {warm_total / 1024:.1f} KB of {cold_total / 1024:.1f} KB"
+                    + (f"; re-downloaded: {', '.join(sorted(refetched))}" if refetched else "")
+        ))
+
+    # =========================================================================
+    # PERFORMANCE TESTING
+    # =========================================================================
+    
+    async def test_performance(self):
+        """⚡ Test API performance and load handling"""
+        logger.info("⚡ Testing Performance...")
+        
+        # Test response times
+        performance_endpoints = [
+            "/api/health",
+            "/api/v1/analytics/dashboard",
+            "/api/v1/products",
+            "/api/v1/customers"
+        ]
+        
+        for endpoint in performance_endpoints:
+            await self._test_endpoint_performance(endpoint)
+        
+        # Step the load up until each endpoint saturates
+        if self.config.saturation_ramp:
+            await self.test_saturation()
+        
+        # Open-loop constant-arrival-rate load
+        if self.config.load_rps > 0:
+            await self.test_open_loop_load()
+
+    async def _test_endpoint_performance(self, endpoint: str):
+        """Test individual endpoint performance"""
+        histogram = LatencyHistogram()
+        traces = []
+        
+        loop = asyncio.get_running_loop()
+        async with self.cpu_profile(f"Performance: {endpoint}"):
+            for _ in range(self.config.performance_samples):
+                sent = loop.time()
+                trace = RequestTrace()
+                status, _ = await self.make_request("GET", endpoint, trace=trace)
+                duration = trace.total
+                traces.append(trace)
+                self.samples.append(sent, endpoint, status, duration)
+                
+                if status == 200:
+                    histogram.record(duration)
+        
+        if histogram.count:
+            avg_time = histogram.mean
+            p99_time = histogram.percentile(99)
+            summary = (f"Avg: {avg_time:.3f}s, p50: {histogram.percentile(50):.3f}s, "
+                       f"p99: {p99_time:.3f}s, Max: {histogram.max:.3f}s")
+            timing = mean_breakdown(traces)
+            if timing:
+                summary += f" ({format_breakdown(timing)})"
+            
+            # Performance criteria: average < 1s, p99 < 2s
+            if avg_time < 1.0 and p99_time < 2.0:
+                status = "PASS"
+                details = summary
+            else:
+                status = "FAIL"
+                details = f"Slow response - {summary}"
+                hottest = self._hottest_functions(f"Performance: {endpoint}")
+                if hottest:
+                    details += f" - hottest: {hottest}"
+                
+            self.record_result(TestResult(
+                test_name=f"Performance: {endpoint}",
+                category="Performance",
+                status=status,
+                duration=avg_time,
+                details=details,
+                endpoint=endpoint,
+                histogram=histogram,
+                timing=timing,
+                phases=mean_phases(traces)
+            ))
+
+    async def test_saturation(self, endpoints: Optional[List[str]] = None):
+        """📶 Step load up until each endpoint saturates
+        
+        Every step holds a load level (concurrent workers or open-loop RPS,
+        per ramp_mode) for ramp_hold seconds, starting at max_concurrent and
+        multiplying by ramp_factor. The ramp stops once the error rate or p99
+        crosses the load thresholds; the last step below them is the knee,
+        i.e. the maximum sustainable throughput for that endpoint.
+        
+        The API rate limiter must be disabled for the run, or the load
+        client's address allowlisted: the ramp stops at the first 429, or
+        once 4xx responses exceed load_max_error_rate, and the endpoint's
+        result is reported as ERROR because it measured the limiter (or a
+        broken request) rather than the endpoint's capacity.
+        """
+        endpoints = endpoints or self.config.ramp_endpoints
+        mode = self.config.ramp_mode
+        logger.info(f"📶 Saturation ramp ({mode}) on {len(endpoints)} endpoints...")
+        saturation = self.report_sections.setdefault("saturation", {})
+        
+        for endpoint in endpoints:
+            level = float(self.config.max_concurrent)
+            steps: List[Dict[str, Any]] = []
+            knee: Optional[Dict[str, Any]] = None
+            breached: Optional[Dict[str, Any]] = None
+            invalid: Optional[str] = None
+            
+            for _ in range(self.config.ramp_max_steps):
+                if mode == "rps":
+                    stats = await self._run_open_loop([endpoint], level, self.config.ramp_hold)
+                else:
+                    stats = await self._run_closed_loop(endpoint, int(level), self.config.ramp_hold)
+                
+                histogram = stats["histograms"].get(endpoint, LatencyHistogram())
+                errors = stats["errors"].get(endpoint, 0)
+                step = {
+                    "level": level,
+                    "requests": histogram.count,
+                    "throughput": (histogram.count - errors) / stats["elapsed"] if stats["elapsed"] > 0 else 0.0,
+                    "error_rate": errors / histogram.count if histogram.count else 1.0,
+                    "rate_limited": stats["rate_limited"].get(endpoint, 0),
+                    "client_errors": stats["client_errors"].get(endpoint, 0),
+                    "p50": histogram.percentile(50),
+                    "p99": histogram.percentile(99)
+                }
+                steps.append(step)
+                logger.info(f"   {endpoint} @ {level:g} {mode}: {step['throughput']:.1f} req/s, "
+                            f"errors {step['error_rate'] * 100:.2f}%, p99 {step['p99'] * 1000:.1f}ms")
+                
+                if step["rate_limited"]:
+                    invalid = f"{step['rate_limited']} rate limited (429) at {level:g} {mode}"
+                    break
+                if histogram.count and step["client_errors"] / histogram.count > self.config.load_max_error_rate:
+                    invalid = f"{step['client_errors']} 4xx responses at {level:g} {mode}"
+                    break
+                if step["error_rate"] > self.config.load_max_error_rate or step["p99"] > self.config.load_p99_threshold:
+                    breached = step
+                    break
+                knee = step
+                level *= self.config.ramp_factor
+            
+            saturation[endpoint] = {"mode": mode, "steps": steps, "knee": knee, "invalid": invalid}
+            
+            if invalid is not None:
+                status = "ERROR"
+                details = (f"Invalid ramp - {invalid}; disable the API rate limiter or allowlist "
+                           f"the load client and rerun")
+            elif knee is None:
+                status = "FAIL"
+                details = f"Saturated at the first step ({steps[0]['level']:g} {mode})"
+            elif breached is None:
+                status = "PASS"
+                details = (f"No saturation up to {knee['level']:g} {mode} - "
+                           f"{knee['throughput']:.1f} req/s, p99 {knee['p99']:.3f}s")
+            else:
+                status = "PASS"
+                details = (f"Knee at {knee['level']:g} {mode}: {knee['throughput']:.1f} req/s "
+                           f"(p99 {knee['p99']:.3f}s); breached at {breached['level']:g}")
+            
+            self.record_result(TestResult(
+                test_name=f"Saturation: {endpoint}",
+                category="Performance",
+                status=status,
+                duration=self.config.ramp_hold * len(steps),
+                details=details,
+                endpoint=endpoint,
+                actual=knee["throughput"] if knee and invalid is None else 0.0
+            ))
+
+    async def _run_closed_loop(self, endpoint: str, concurrency: int, duration: float) -> Dict[str, Any]:
+        """Keep `concurrency` requests outstanding for `duration` seconds"""
+        loop = asyncio.get_running_loop()
+        first_sample = len(self.samples)
+        start = loop.time()
+        deadline = start + duration
+        
+        async def worker():
+            while loop.time() < deadline:
+                sent = loop.time()
+                status, _ = await self.make_request("GET", endpoint, body="none")
+                self.samples.append(sent, endpoint, status, loop.time() - sent)
+        
+        await asyncio.gather(*[worker() for _ in range(concurrency)], return_exceptions=True)
+        
+        return {
+            "histograms": self.samples.histograms(first_sample),
+            "errors": self.samples.error_counts(first_sample),
+            "rate_limited": self.samples.rate_limited_counts(first_sample),
+            "client_errors": self.samples.client_error_counts(first_sample),
+            "failures": [],
+            "requests": len(self.samples) - first_sample,
+            "elapsed": loop.time() - start
+        }
+
+    async def test_open_loop_load(self, endpoints: Optional[List[str]] = None,
+                                  rps: Optional[float] = None,
+                                  duration: Optional[float] = None):
+        """📈 Open-loop load test at a constant arrival rate
+        
+        Requests are dispatched on a fixed schedule regardless of how long
+        earlier requests take, and latency is measured from the *scheduled*
+        send time. A backend that stalls therefore shows up in the tail
+        instead of silently lowering the offered load (coordinated omission).
+        """
+        endpoints = endpoints or self.config.load_endpoints or [e for _, _, e in API_ENDPOINTS]
+        rps = rps or self.config.load_rps
+        duration = duration or self.config.load_duration
+        logger.info(f"📈 Open-loop load: {rps:.1f} req/s for {duration:.0f}s across {len(endpoints)} endpoints...")
+        
+        stats = await self._run_open_loop(endpoints, rps, duration)
+        self._record_open_loop(stats, rps)
+
+    async def _run_open_loop(self, endpoints: List[str], rps: float, duration: float) -> Dict[str, Any]:
+        """Drive the open-loop schedule and return raw, mergeable statistics"""
+        loop = asyncio.get_running_loop()
+        first_sample = len(self.samples)
+        failures: List[TestResult] = []
+        in_flight = set()
+        
+        async def fire(endpoint: str, scheduled: float):
+            status, data = await self.make_request("GET", endpoint, body="none")
+            latency = loop.time() - scheduled
+            error = data.get("error") if status == 0 and isinstance(data, dict) else None
+            self.samples.append(scheduled, endpoint, status, latency, error)
+            
+            # Only failures are worth a full TestResult
+            if SampleStore.is_error(status) and len(failures) < self.config.max_failed_samples:
+                failures.append(TestResult(
+                    test_name=f"Load Request: {endpoint}",
+                    category="Load",
+                    status="ERROR" if status == 0 else "FAIL",
+                    duration=latency,
+                    details=f"GET {endpoint} returned {status}",
+                    endpoint=endpoint,
+                    actual=status,
+                    error=error
+                ))
+        
+        interval = 1.0 / rps
+        total_requests = int(rps * duration)
+        start = loop.time()
+        for i in range(total_requests):
+            scheduled = start + i * interval
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(fire(endpoints[i % len(endpoints)], scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        
+        return {
+            "histograms": self.samples.histograms(first_sample),
+            "errors": self.samples.error_counts(first_sample),
+            "rate_limited": self.samples.rate_limited_counts(first_sample),
+            "client_errors": self.samples.client_error_counts(first_sample),
+            "failures": failures,
+            "requests": total_requests,
+            "elapsed": loop.time() - start
+        }
+
+    def _record_open_loop(self, stats: Dict[str, Any], rps: float):
+        """Turn open-loop statistics into per-endpoint and summary results"""
+        room = self.config.max_failed_samples - len(self.failed_samples)
+        self.failed_samples.extend(stats["failures"][:max(0, room)])
+        
+        rate_limited = stats.get("rate_limited", {})
+        for endpoint, histogram in stats["histograms"].items():
+            if not histogram.count:
+                continue
+            error_rate = stats["errors"].get(endpoint, 0) / histogram.count
+            limited = rate_limited.get(endpoint, 0)
+            p99 = histogram.percentile(99)
+            details = (f"{histogram.count} reqs, errors {error_rate * 100:.2f}%, rate limited {limited} - "
+                       f"p50: {histogram.percentile(50):.3f}s, p90: {histogram.percentile(90):.3f}s, "
+                       f"p99: {p99:.3f}s, max: {histogram.max:.3f}s")
+            
+            # A rate-limited run measured the limiter, not the endpoint
+            if p99 < self.config.load_p99_threshold and error_rate <= self.config.load_max_error_rate and not limited:
+                status = "PASS"
+            else:
+                status = "FAIL"
+                
+            self.record_result(TestResult(
+                test_name=f"Open-Loop Load: {endpoint}",
+                category="Load",
+                status=status,
+                duration=p99,
+                details=details,
+                endpoint=endpoint,
+                expected=self.config.load_p99_threshold,
+                actual=p99,
+                histogram=histogram
+            ))
+        
+        total_requests = stats["requests"]
+        elapsed = stats["elapsed"]
+        achieved = total_requests / elapsed if elapsed > 0 else 0.0
+        total_limited = sum(rate_limited.values())
+        details = f"{total_requests} requests offered at {rps:.1f} req/s, completed at {achieved:.1f} req/s"
+        if total_limited:
+            details += f" - {total_limited} rate limited (429); disable the API rate limiter for load runs"
+        self.record_result(TestResult(
+            test_name="Open-Loop Load Test",
+            category="Load",
+            status=("FAIL" if total_limited else "PASS") if total_requests else "SKIP",
+            duration=elapsed,
+            details=details,
+            expected=rps,
+            actual=achieved
+        ))
+
+    async def run_sharded_load(self, workers: int):
+        """🧵 Shard the open-loop load phase across worker processes
+        
+        Each worker runs its own event loop and aiohttp connector with an
+        equal share of the RPS budget, starting at a different offset in the
+        endpoint list. Histograms and error counts are merged here so the
+        report reads as if a single generator had produced the load. Workers
+        reuse the token of a login made here, so protected endpoints are
+        loaded as an authenticated user rather than answering 401.
+        """
+        endpoints = self.config.load_endpoints or [e for _, _, e in API_ENDPOINTS]
+        rps = self.config.load_rps
+        if not self.auth_token:
+            await self.test_authentication_system()
+        worker_config = replace(self.config, auth_token=self.auth_token)
+        logger.info(f"🧵 Sharding {rps:.1f} req/s across {workers} worker processes...")
+        
+        loop = asyncio.get_running_loop()
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            shards = await asyncio.gather(*[
+                loop.run_in_executor(pool, _open_loop_worker, worker_config, endpoints, index, workers)
+                for index in range(workers)
+            ])
+        
+        self._record_open_loop(merge_open_loop_stats(shards), rps)
+
+    # =========================================================================
+    # SOAK TESTING
+    # =========================================================================
+    
+    def _find_backend_process(self):
+        """Locate the backend process by PID or by the port it listens on"""
+        if psutil is None:
+            return None
+        try:
+            if self.config.backend_pid:
+                return psutil.Process(self.config.backend_pid)
+            port = urlparse(self.config.base_url).port or 80
+            for conn in psutil.net_connections(kind="tcp"):
+                if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN and conn.pid:
+                    return psutil.Process(conn.pid)
+        except (psutil.Error, PermissionError) as e:
+            logger.warning(f"⚠️ Cannot inspect backend process: {str(e)}")
+        return None
+
+    async def _soak_operation(self, operation: str, rng: random.Random, created: deque) -> Tuple[str, int]:
+        """Execute one soak workload operation, returning (label, status)"""
+        if operation == "auth":
+            status, _ = await self.make_request("POST", "/api/v1/auth/login", json={
+                "email": self.config.test_user_email,
+                "password": self.config.test_user_password
+            })
+            return "POST /api/v1/auth/login", status
+        
+        if operation == "create" or (operation in ("read", "update", "delete") and not created):
+            status, data = await self.make_request("POST", "/api/v1/products", json={
+                "name": f"Soak Product {rng.randint(100000, 999999)}",
+                "description": "Soak test product",
+                "price": round(rng.uniform(5, 500), 2),
+                "category": "test",
+                "stockQuantity": rng.randint(1, 1000)
+            })
+            product = data.get("data") if isinstance(data, dict) else None
+            if status == 201 and isinstance(product, dict) and product.get("_id"):
+                created.append(product["_id"])
+            return "POST /api/v1/products", status
+        
+        if operation == "read":
+            status, _ = await self.make_request("GET", f"/api/v1/products/{rng.choice(created)}")
+            return "GET /api/v1/products/:id", status
+        
+        if operation == "update":
+            status, _ = await self.make_request("PUT", f"/api/v1/products/{rng.choice(created)}",
+                                                json={"price": round(rng.uniform(5, 500), 2)})
+            return "PUT /api/v1/products/:id", status
+        
+        if operation == "delete":
+            status, _ = await self.make_request("DELETE", f"/api/v1/products/{created.popleft()}")
+            return "DELETE /api/v1/products/:id", status
+        
+        endpoint = rng.choice(SOAK_LIST_ENDPOINTS)
+        status, _ = await self.make_request("GET", endpoint, params={"limit": 20})
+        return f"GET {endpoint}", status
+
+    async def test_soak(self, duration: Optional[float] = None):
+        """🕰️ Soak test: mixed workload for hours with windowed metrics and leak detection
+        
+        Operations are issued open-loop at soak_rps. Each operation counts
+        towards the soak_window its send was scheduled in, and a window is
+        logged together with the backend's RSS once all of its operations
+        have completed. Throughput divides by the window's actual length, so
+        a short final window is not under-reported. At the end both series
+        are checked for steady upward drift.
+        """
+        duration = duration or self.config.soak_duration
+        rps = self.config.soak_rps
+        window_length = self.config.soak_window
+        logger.info(f"🕰️ Soak test: {rps:.1f} ops/s for {duration / 60:.1f} minutes, "
+                    f"{window_length:.0f}s windows...")
+        
+        backend = self._find_backend_process()
+        if backend is None:
+            logger.warning("⚠️ Backend process not found - memory drift will not be checked")
+        
+        loop = asyncio.get_running_loop()
+        rng = random.Random(42)
+        operations = [name for name, _ in SOAK_WORKLOAD]
+        weights = [weight for _, weight in SOAK_WORKLOAD]
+        created: deque = deque(maxlen=1000)
+        overall = LatencyHistogram()
+        windows: List[Dict[str, Any]] = []
+        buckets: Dict[int, Dict[str, Any]] = {}
+        dispatched = 0  # windows before this index have had all their operations sent
+        in_flight = set()
+        
+        def bucket(index: int) -> Dict[str, Any]:
+            if index not in buckets:
+                buckets[index] = {"histogram": LatencyHistogram(), "requests": 0, "errors": 0, "pending": 0}
+            return buckets[index]
+        
+        async def fire(operation: str, scheduled: float, index: int):
+            error = None
+            try:
+                label, status = await self._soak_operation(operation, rng, created)
+            except Exception as e:
+                label, status, error = operation, 0, f"{type(e).__name__}: {e}"
+            latency = loop.time() - scheduled
+            self.samples.append(scheduled, label, status, latency, error)
+            overall.record(latency)
+            window = buckets[index]
+            window["histogram"].record(latency)
+            window["requests"] += 1
+            window["pending"] -= 1
+            if SampleStore.is_error(status):
+                window["errors"] += 1
+            close_finished_windows()
+        
+        def close_finished_windows():
+            while len(windows) < dispatched and bucket(len(windows))["pending"] == 0:
+                close_window(len(windows))
+        
+        def close_window(index: int):
+            window = buckets.pop(index)
+            histogram = window["histogram"]
+            length = min(window_length, duration - index * window_length)
+            rss_mb = None
+            if backend is not None:
+                try:
+                    rss_mb = backend.memory_info().rss / (1024 * 1024)
+                except psutil.Error:
+                    rss_mb = None
+            stats = {
+                "window": index + 1,
+                "elapsed": index * window_length + length,
+                "length": length,
+                "requests": window["requests"],
+                "throughput": window["requests"] / length,
+                "error_rate": window["errors"] / window["requests"] if window["requests"] else 0.0,
+                "p50": histogram.percentile(50),
+                "p99": histogram.percentile(99),
+                "max": histogram.max,
+                "backend_rss_mb": rss_mb
+            }
+            windows.append(stats)
+            rss_text = f", RSS {rss_mb:.1f} MB" if rss_mb is not None else ""
+            logger.info(f"🕰️ Window {index + 1}: {stats['throughput']:.1f} req/s, "
+                        f"errors {stats['error_rate'] * 100:.2f}%, p50 {stats['p50'] * 1000:.1f}ms, "
+                        f"p99 {stats['p99'] * 1000:.1f}ms{rss_text}")
+        
+        interval = 1.0 / rps
+        total = int(rps * duration)
+        start = loop.time()
+        for i in range(total):
+            offset = i * interval
+            index = int(offset // window_length)
+            if index > dispatched:
+                dispatched = index
+                close_finished_windows()
+            delay = start + offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            operation = rng.choices(operations, weights)[0]
+            bucket(index)["pending"] += 1
+            task = asyncio.create_task(fire(operation, start + offset, index))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        
+        if total:
+            dispatched = int((total - 1) * interval // window_length) + 1
+            close_finished_windows()
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        
+        # Remove whatever the workload left behind
+        for product_id in list(created):
+            await self.make_request("DELETE", f"/api/v1/products/{product_id}")
+        
+        self.report_sections["soak_windows"] = windows
+        total_errors = sum(w["error_rate"] * w["requests"] for w in windows)
+        error_rate = total_errors / overall.count if overall.count else 0.0
+        self.record_result(TestResult(
+            test_name="Soak: Overall",
+            category="Soak",
+            status="PASS" if error_rate <= self.config.load_max_error_rate else "FAIL",
+            duration=loop.time() - start,
+            details=f"{overall.count} ops in {len(windows)} windows, errors {error_rate * 100:.2f}%, "
+                    f"p99 {overall.percentile(99):.3f}s",
+            histogram=overall
+        ))
+        
+        self._record_drift("Soak: Latency Drift", [w["p99"] for w in windows], "p99")
+        self._record_drift("Soak: Memory Drift", [w["backend_rss_mb"] for w in windows
+                                                  if w["backend_rss_mb"] is not None], "backend RSS")
+
+    def _record_drift(self, name: str, series: List[float], label: str):
+        """Flag a monotonic upward trend in a per-window series"""
+        if len(series) < 5:
+            self.record_result(TestResult(
+                test_name=name,
+                category="Soak",
+                status="SKIP",
+                duration=0,
+                details=f"Not enough windows to judge {label} drift ({len(series)})"
+            ))
+            return
+        
+        tau, growth = _trend(series)
+        leaking = tau >= 0.6 and growth >= self.config.soak_drift_threshold
+        self.record_result(TestResult(
+            test_name=name,
+            category="Soak",
+            status="FAIL" if leaking else "PASS",
+            duration=0,
+            details=(f"{'Possible leak - ' if leaking else ''}{label} trend tau {tau:.2f}, "
+                     f"growth {growth * 100:+.1f}% over {len(series)} windows"),
+            expected=self.config.soak_drift_threshold,
+            actual=growth
+        ))
+
+    # =========================================================================
+    # SCENARIO TESTING
+    # =========================================================================
+    
+    async def test_scenario(self, scenario: Optional[Dict[str, Any]] = None):
+        """🧭 Run weighted user journeys with many virtual users
+        
+        Each virtual user repeatedly picks a journey by weight and walks its
+        steps in order, sleeping for the step's think time in between. Users
+        keep their own variables and auth token, and every step gets its own
+        latency histogram in the report.
+        """
+        if scenario is None:
+            scenario = load_scenario(self.config.scenario_file) if self.config.scenario_file else DEFAULT_SCENARIO
+        journeys = scenario["journeys"]
+        virtual_users = scenario.get("virtual_users", self.config.virtual_users)
+        duration = scenario.get("duration", self.config.scenario_duration)
+        logger.info(f"🧭 Scenario: {virtual_users} virtual users over {len(journeys)} journeys "
+                    f"for {duration:.0f}s...")
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + duration
+        weights = [journey.get("weight", 1) for journey in journeys]
+        step_histograms: Dict[str, LatencyHistogram] = {}
+        step_errors: Dict[str, int] = {}
+        completed: Dict[str, int] = {journey["name"]: 0 for journey in journeys}
+        
+        async def virtual_user(vu: int):
+            rng = random.Random(vu)
+            variables: Dict[str, Any] = {"vu": vu}
+            done_once = set()
+            iteration = 0
+            while loop.time() < deadline:
+                journey = rng.choices(journeys, weights)[0]
+                variables["iteration"] = iteration
+                for step in journey["steps"]:
+                    if loop.time() >= deadline:
+                        return
+                    key = f"{journey['name']} / {step['name']}"
+                    if step.get("once") and key in done_once:
+                        continue
+                    done_once.add(key)
+                    
+                    options = {name: _render(step[name], variables) for name in ("json", "params") if name in step}
+                    start_time = loop.time()
+                    status, data = await self.make_request(
+                        step.get("method", "GET"),
+                        _render(step["endpoint"], variables),
+                        auth_token=variables.get("token"),
+                        **options
+                    )
+                    if key not in step_histograms:
+                        step_histograms[key] = LatencyHistogram()
+                        step_errors[key] = 0
+                    step_histograms[key].record(loop.time() - start_time)
+                    if status not in step.get("expect", [200]):
+                        step_errors[key] += 1
+                    
+                    for name, path in step.get("extract", {}).items():
+                        value = _extract(data, path)
+                        if value is not None:
+                            variables[name] = value
+                    
+                    think_time = step.get("think_time", 0)
+                    if isinstance(think_time, list):
+                        think_time = rng.uniform(*think_time)
+                    if think_time:
+                        await asyncio.sleep(think_time)
+                else:
+                    completed[journey["name"]] += 1
+                iteration += 1
+        
+        outcomes = await asyncio.gather(*[virtual_user(vu) for vu in range(virtual_users)],
+                                        return_exceptions=True)
+        for vu, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                self.record_result(TestResult(
+                    test_name=f"Scenario VU {vu}",
+                    category="Scenario",
+                    status="ERROR",
+                    duration=0,
+                    details="Virtual user stopped early",
+                    error=f"{type(outcome).__name__}: {outcome}"
+                ))
+        
+        for key, histogram in step_histograms.items():
+            error_rate = step_errors[key] / histogram.count
+            self.record_result(TestResult(
+                test_name=f"Scenario Step: {key}",
+                category="Scenario",
+                status="PASS" if error_rate <= self.config.load_max_error_rate else "FAIL",
+                duration=histogram.mean,
+                details=(f"{histogram.count} calls, unexpected status {error_rate * 100:.2f}%, "
+                         f"p50 {histogram.percentile(50):.3f}s, p99 {histogram.percentile(99):.3f}s"),
+                histogram=histogram
+            ))
+        self.report_sections["scenario_journeys_completed"] = completed
+        logger.info(f"🧭 Journeys completed: {completed}")
+
+    # =========================================================================
+    # ACCESS LOG REPLAY
+    # =========================================================================
+    
+    async def test_log_replay(self, log_path: str, speed: Optional[float] = None, afap: bool = False):
+        """📼 Replay a production access log against the backend
+        
+        By default requests keep the log's inter-arrival times (divided by
+        `speed`) and latency is measured from each request's scheduled time.
+        With `afap` the log is replayed as fast as replay_concurrency allows.
+        Only replay_methods are sent, since logs carry no request bodies.
+        """
+        speed = speed or self.config.replay_speed
+        mode = "as fast as possible" if afap else f"at {speed:g}x speed"
+        logger.info(f"📼 Replaying {log_path} {mode}...")
+        
+        loop = asyncio.get_running_loop()
+        first_sample = len(self.samples)
+        mismatched = 0
+        skipped = 0
+        failures: List[BaseException] = []
+        in_flight = set()
+        
+        async def fire(method: str, path: str, logged_status: int, scheduled: float):
+            nonlocal mismatched
+            try:
+                status, _ = await self.make_request(method, path, body="none")
+                self.samples.append(scheduled, normalize_route(path), status, loop.time() - scheduled)
+            except Exception as e:
+                failures.append(e)
+                return
+            if status != logged_status:
+                mismatched += 1
+        
+        start = loop.time()
+        first_timestamp = None
+        for timestamp, method, path, logged_status in iter_access_log(log_path):
+            if method not in self.config.replay_methods:
+                skipped += 1
+                continue
+            
+            if afap:
+                # Do not read further ahead than the concurrency budget
+                while len(in_flight) >= self.config.replay_concurrency:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                task = asyncio.create_task(fire(method, path, logged_status, loop.time()))
+            else:
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                scheduled = start + (timestamp - first_timestamp) / speed
+                delay = scheduled - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                task = asyncio.create_task(fire(method, path, logged_status, scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        elapsed = loop.time() - start
+        
+        if failures:
+            self.record_result(TestResult(
+                test_name="Access Log Replay Errors",
+                category="Replay",
+                status="ERROR",
+                duration=elapsed,
+                details=f"{len(failures)} replayed requests could not be recorded",
+                error=f"{type(failures[0]).__name__}: {failures[0]}"
+            ))
+        
+        histograms = self.samples.histograms(first_sample)
+        errors = self.samples.error_counts(first_sample)
+        total = sum(h.count for h in histograms.values())
+        routes = sorted(histograms, key=lambda route: histograms[route].count, reverse=True)
+        
+        for route in routes[:self.config.replay_top_routes]:
+            histogram = histograms[route]
+            error_rate = errors.get(route, 0) / histogram.count
+            p99 = histogram.percentile(99)
+            self.record_result(TestResult(
+                test_name=f"Replay: {route}",
+                category="Replay",
+                status="PASS" if p99 < self.config.load_p99_threshold
+                and error_rate <= self.config.load_max_error_rate else "FAIL",
+                duration=p99,
+                details=(f"{histogram.count} reqs, errors {error_rate * 100:.2f}% - "
+                         f"p50: {histogram.percentile(50):.3f}s, p99: {p99:.3f}s"),
+                endpoint=route,
+                histogram=histogram
+            ))
+        
+        overall = LatencyHistogram()
+        for histogram in histograms.values():
+            overall.merge(histogram)
+        self.record_result(TestResult(
+            test_name="Access Log Replay",
+            category="Replay",
+            status="ERROR" if failures else "PASS" if total else "SKIP",
+            duration=elapsed,
+            details=(f"{total} requests over {len(routes)} routes in {elapsed:.1f}s "
+                     f"({total / elapsed if elapsed > 0 else 0:.1f} req/s), {mismatched} status mismatches "
+                     f"vs. log, {skipped} non-replayable lines skipped, {len(failures)} errors"),
+            histogram=overall
+        ))
+
+    # =========================================================================
+    # ASSET WEIGHT TRACKING
+    # =========================================================================
+    
+    async def test_asset_weight(self):
+        """📦 Weigh every route's JS/CSS/font/image assets against a baseline
+        
+        Assets are fetched once each, concurrently, with compression enabled.
+        The compressed size is the transferred Content-Length when the server
+        compressed the response, or a gzip estimate when it was chunked. The
+        uncompressed size is the decoded body. A route fails when any of its
+        assets fails to load or its total compressed JS grows by more than
+        asset_js_growth_threshold over the baseline file, which is (re)written
+        when missing or when update_asset_baseline is set - but only from a
+        run in which every page and asset loaded.
+        """
+        logger.info("📦 Tracking frontend asset weight...")
+        
+        semaphore = asyncio.Semaphore(self.config.asset_concurrency)
+        sizes: Dict[str, Any] = {}
+        failures: Dict[str, str] = {}
+        
+        async def fetch_page(route: str) -> Optional[Dict[str, str]]:
+            url = urljoin(self.config.frontend_url, route)
+            async with semaphore:
+                try:
+                    async with self.session.get(url) as response:
+                        if response.status != 200:
+                            failures[route] = f"HTTP {response.status}"
+                            return None
+                        return parse_assets(await response.text(), url)
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not fetch {route}: {e}")
+                    failures[route] = f"{type(e).__name__}: {e}"
+                    return None
+        
+        async def fetch_asset(url: str):
+            async with semaphore:
+                try:
+                    status, compressed, uncompressed, _ = await self._fetch_asset(url)
+                except Exception as e:
+                    sizes[url] = None
+                    failures[url] = f"{type(e).__name__}: {e}"
+                    return
+                if status != 200:
+                    sizes[url] = None
+                    failures[url] = f"HTTP {status}"
+                    return
+                sizes[url] = (compressed, uncompressed)
+        
+        pages = dict(zip(FRONTEND_ROUTES, await asyncio.gather(*(fetch_page(r) for r in FRONTEND_ROUTES))))
+        unique_assets = {url for assets in pages.values() if assets for url in assets}
+        await asyncio.gather(*(fetch_asset(url) for url in unique_assets))
+        
+        weights: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for route, assets in pages.items():
+            if assets is None:
+                self.record_result(TestResult(
+                    test_name=f"Asset Weight: {route}",
+                    category="Assets",
+                    status="ERROR",
+                    duration=0,
+                    details="Page could not be loaded, assets not weighed",
+                    endpoint=route,
+                    error=failures.get(route)
+                ))
+                continue
+            totals = {}
+            for url, kind in assets.items():
+                total = totals.setdefault(kind, {"count": 0, "compressed": 0, "uncompressed": 0, "missing": 0})
+                total["count"] += 1
+                if sizes.get(url) is None:
+                    total["missing"] += 1
+                    continue
+                total["compressed"] += sizes[url][0]
+                total["uncompressed"] += sizes[url][1]
+            weights[route] = totals
+        self.report_sections["asset_weight"] = weights
+        
+        baseline_path = self.config.asset_baseline_file
+        baseline = None
+        if os.path.exists(baseline_path) and not self.config.update_asset_baseline:
+            with open(baseline_path) as f:
+                baseline = json.load(f)
+        
+        for route, totals in weights.items():
+            js = totals.get("js", {}).get("compressed", 0)
+            total_compressed = sum(t["compressed"] for t in totals.values())
+            total_uncompressed = sum(t["uncompressed"] for t in totals.values())
+            missing = sum(t["missing"] for t in totals.values())
+            details = (f"JS {js / 1024:.1f} KB, total {total_compressed / 1024:.1f} KB compressed / "
+                       f"{total_uncompressed / 1024:.1f} KB uncompressed over "
+                       f"{sum(t['count'] for t in totals.values())} assets")
+            failed = [url for url in pages[route] if sizes.get(url) is None]
+            if missing:
+                details += f", {missing} failed to load"
+            
+            status = "FAIL" if missing else "PASS"
+            baseline_js = (baseline or {}).get(route, {}).get("js", {}).get("compressed")
+            if baseline_js:
+                growth = (js - baseline_js) / baseline_js
+                details += f" (JS {growth * 100:+.1f}% vs. baseline)"
+                if growth > self.config.asset_js_growth_threshold:
+                    status = "FAIL"
+            
+            self.record_result(TestResult(
+                test_name=f"Asset Weight: {route}",
+                category="Assets",
+                status=status,
+                duration=0,
+                details=details,
+                endpoint=route,
+                error=f"{failed[0]}: {failures.get(failed[0], 'not fetched')}" if failed else None
+            ))
+        
+        if baseline is None and weights and failures:
+            logger.warning(f"⚠️ Asset baseline not written: {len(failures)} pages or assets failed to load")
+        elif baseline is None and weights:
+            with open(baseline_path, "w") as f:
+                json.dump(weights, f, indent=2, sort_keys=True)
+            logger.info(f"📦 Asset baseline written to {baseline_path}")
+
+    async def _fetch_asset(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, int, int, Any]:
+        """GET an asset with compression enabled: (status, transferred bytes, decoded bytes, headers)"""
+        headers = {"Accept-Encoding": ASSET_ACCEPT_ENCODING, **(headers or {})}
+        async with self.session.get(url, headers=headers) as response:
+            body = await response.read()
+            return response.status, transferred_bytes(response, body), len(body), response.headers
+
     # =========================================================================
-    # PERFORMANCE TESTING
+    # CONNECTION REUSE BENCHMARK
     # =========================================================================
     
-    async def test_performance(self):
-        """⚡ Test API performance and load handling"""
-        logger.info("⚡ Testing Performance...")
+    async def test_connection_reuse(self, endpoints: Optional[List[str]] = None):
+        """🔌 Compare new-connection-per-request, keep-alive pooling and HTTP/2
         
-        # Test response times
-        performance_endpoints = [
-            "/api/health",
-            "/api/v1/analytics/dashboard",
-            "/api/v1/products",
-            "/api/v1/customers"
+        Each client sends the same connection_benchmark_requests GETs with the
+        same concurrency. Connection setup (TCP connect plus TLS for https) is
+        timed with client tracing, so the report shows how many connections
+        each mode opened, what they cost and the resulting throughput.
+        """
+        endpoints = endpoints or self.config.load_endpoints or [e for _, method, e in API_ENDPOINTS if method == "GET"]
+        logger.info(f"🔌 Benchmarking connection reuse over {len(endpoints)} endpoints...")
+        
+        modes = [
+            ("New Connection per Request", lambda: self._benchmark_aiohttp(endpoints, force_close=True)),
+            ("Keep-Alive Pool", lambda: self._benchmark_aiohttp(endpoints, force_close=False)),
+            ("HTTP/2 Multiplexing", lambda: self._benchmark_http2(endpoints)),
         ]
         
-        for endpoint in performance_endpoints:
-            await self._test_endpoint_performance(endpoint)
+        summary = {}
+        for name, run in modes:
+            try:
+                stats = await run()
+            except ImportError as e:
+                self.record_result(TestResult(
+                    test_name=f"Connections: {name}",
+                    category="Connections",
+                    status="SKIP",
+                    duration=0,
+                    details=f"Client backend unavailable: {e}"
+                ))
+                continue
+            
+            histogram = stats["histogram"]
+            connects = stats["connects"]
+            throughput = histogram.count / stats["elapsed"] if stats["elapsed"] > 0 else 0.0
+            error_rate = stats["errors"] / histogram.count if histogram.count else 1.0
+            setup_ms = sum(connects) / len(connects) * 1000 if connects else 0.0
+            summary[name] = {
+                "requests": histogram.count,
+                "errors": stats["errors"],
+                "throughput_rps": round(throughput, 1),
+                "connections_opened": len(connects),
+                "mean_connect_ms": round(setup_ms, 3),
+                "total_connect_ms": round(sum(connects) * 1000, 3),
+                "protocol": stats["protocol"],
+                "latency": histogram.summary()
+            }
+            
+            if stats["protocol"] not in (None, "HTTP/2"):
+                status = "SKIP"
+            else:
+                status = "PASS" if error_rate <= self.config.load_max_error_rate else "FAIL"
+            self.record_result(TestResult(
+                test_name=f"Connections: {name}",
+                category="Connections",
+                status=status,
+                duration=stats["elapsed"],
+                details=(f"{throughput:.1f} req/s, {len(connects)} connections (mean setup {setup_ms:.2f}ms), "
+                         f"errors {error_rate * 100:.2f}%, p50: {histogram.percentile(50):.3f}s, "
+                         f"p99: {histogram.percentile(99):.3f}s"
+                         + (f" - server negotiated {stats['protocol']}" if status == "SKIP" else "")),
+                histogram=histogram
+            ))
         
-        # Test concurrent load
-        await self._test_concurrent_load()
+        self.report_sections["connection_reuse"] = summary
+        if summary:
+            logger.info(f"   {'Mode':<28} {'req/s':>9} {'conns':>7} {'setup ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+            for name, mode in summary.items():
+                logger.info(f"   {name:<28} {mode['throughput_rps']:>9.1f} {mode['connections_opened']:>7} "
+                            f"{mode['mean_connect_ms']:>9.2f} {mode['latency']['p50'] * 1000:>9.2f} "
+                            f"{mode['latency']['p99'] * 1000:>9.2f}")
 
-    async def _test_endpoint_performance(self, endpoint: str):
-        """Test individual endpoint performance"""
-        times = []
+    async def _drive_benchmark(self, send, endpoints: List[str]) -> Dict[str, Any]:
+        """Send connection_benchmark_requests through `send(url)` with fixed concurrency"""
+        loop = asyncio.get_running_loop()
+        histogram = LatencyHistogram()
+        urls = [urljoin(self.config.base_url, endpoint) for endpoint in endpoints]
+        remaining = self.config.connection_benchmark_requests
+        errors = 0
         
-        for _ in range(5):  # Test 5 times for average
-            start_time = time.time()
-            status, _ = await self.make_request("GET", endpoint)
-            duration = time.time() - start_time
-            
-            if status == 200:
-                times.append(duration)
+        async def worker():
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                url = urls[remaining % len(urls)]
+                sent = loop.time()
+                try:
+                    status = await send(url)
+                except Exception:
+                    status = 0
+                histogram.record(loop.time() - sent)
+                if SampleStore.is_error(status):
+                    errors += 1
+        
+        start = loop.time()
+        await asyncio.gather(*[worker() for _ in range(self.config.connection_benchmark_concurrency)])
+        return {"histogram": histogram, "errors": errors, "elapsed": loop.time() - start}
+
+    def _benchmark_headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.auth_token}"} if self.auth_token else {}
+
+    async def _benchmark_aiohttp(self, endpoints: List[str], force_close: bool) -> Dict[str, Any]:
+        """Benchmark a dedicated aiohttp session, optionally closing every connection"""
+        loop = asyncio.get_running_loop()
+        connects: List[float] = []
+        
+        async def on_create_start(session, context, params):
+            context.connect_start = loop.time()
+        
+        async def on_create_end(session, context, params):
+            connects.append(loop.time() - context.connect_start)
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(on_create_start)
+        trace_config.on_connection_create_end.append(on_create_end)
+        connector = aiohttp.TCPConnector(force_close=force_close,
+                                         limit=self.config.connection_benchmark_concurrency)
+        headers = self._benchmark_headers()
         
-        if times:
-            avg_time = sum(times) / len(times)
-            max_time = max(times)
+        async with aiohttp.ClientSession(connector=connector, trace_configs=[trace_config],
+                                         timeout=aiohttp.ClientTimeout(total=self.config.timeout)) as session:
+            async def send(url: str) -> int:
+                async with session.get(url, headers=headers) as response:
+                    await response.read()
+                    return response.status
             
-            # Performance criteria: average < 1s, max < 2s
-            if avg_time < 1.0 and max_time < 2.0:
-                status = "PASS"
-                details = f"Avg: {avg_time:.3f}s, Max: {max_time:.3f}s"
-            else:
-                status = "FAIL"
-                details = f"Slow response - Avg: {avg_time:.3f}s, Max: {max_time:.3f}s"
+            stats = await self._drive_benchmark(send, endpoints)
+        stats.update(connects=connects, protocol=None)
+        return stats
+
+    async def _benchmark_http2(self, endpoints: List[str]) -> Dict[str, Any]:
+        """Benchmark an httpx client with HTTP/2 enabled
+        
+        HTTP/2 is negotiated through TLS ALPN, so against a plain-http
+        backend the client falls back to HTTP/1.1 and the mode is skipped.
+        """
+        if httpx is None:
+            raise ImportError("httpx is not installed (pip install 'httpx[http2]')")
+        
+        loop = asyncio.get_running_loop()
+        connects: List[float] = []
+        protocols = set()
+        headers = self._benchmark_headers()
+        limits = httpx.Limits(max_connections=self.config.connection_benchmark_concurrency)
+        
+        async with httpx.AsyncClient(http2=True, limits=limits, timeout=self.config.timeout) as client:
+            async def send(url: str) -> int:
+                setup = {}
+                
+                async def trace(event: str, info: Dict[str, Any]):
+                    if event == "connection.connect_tcp.started":
+                        setup["start"] = loop.time()
+                    elif event in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                        setup["end"] = loop.time()
                 
+                response = await client.get(url, headers=headers, extensions={"trace": trace})
+                protocols.add(response.http_version)
+                if "start" in setup and "end" in setup:
+                    connects.append(setup["end"] - setup["start"])
+                return response.status_code
+            
+            stats = await self._drive_benchmark(send, endpoints)
+        stats.update(connects=connects, protocol="HTTP/2" if protocols == {"HTTP/2"} else "/".join(sorted(protocols)) or None)
+        return stats
+
+    # =========================================================================
+    # TEST DATA SEEDING
+    # =========================================================================
+    
+    async def test_seeded_list_performance(self):
+        """🌱 Seed production-sized collections, benchmark the list endpoints, clean up
+        
+        seed_records products, customers, leads and orders from
+        SeedDataGenerator are loaded through the API or straight into MongoDB
+        (seed_mode) on behalf of the logged-in user, then every list endpoint
+        is timed on its first and last page. The phase fails without
+        benchmarking when any kind falls short of seed_records. The batch is
+        removed afterwards unless keep_seed is set, in which case its
+        manifest is written for --teardown-seed.
+        """
+        if self.config.seed_mode == "mongo" and pymongo is None:
             self.record_result(TestResult(
-                test_name=f"Performance: {endpoint}",
-                category="Performance",
-                status=status,
-                duration=avg_time,
-                details=details,
-                endpoint=endpoint
+                test_name="Seed: Test Data",
+                category="Database",
+                status="SKIP",
+                duration=0,
+                details="Skipped - seed_mode 'mongo' requires pymongo"
             ))
+            return
+        
+        if not self.auth_token:
+            await self.test_authentication_system()
+        generator = SeedDataGenerator(self.config.seed_value)
+        manifest = {"batch": generator.batch, "seed": self.config.seed_value,
+                    "mode": self.config.seed_mode, "counts": {}}
+        try:
+            if await self.seed_test_data(generator, manifest):
+                await self._benchmark_seeded_lists(manifest)
+            else:
+                self.record_result(TestResult(
+                    test_name="Seed: Test Data",
+                    category="Database",
+                    status="FAIL",
+                    duration=0,
+                    details=(f"Seeded fewer than {self.config.seed_records} records of some kind "
+                             f"({manifest['counts'] or 'none'}) - list benchmarks skipped")
+                ))
+        finally:
+            self.report_sections["seed"] = dict(manifest)
+            if self.config.keep_seed:
+                self._write_seed_manifest(manifest)
+                logger.info(f"🌱 Kept {generator.batch}; manifest written to {self.config.seed_manifest_file}")
+            elif manifest.get("started"):
+                try:
+                    await self.teardown_seed_data(manifest)
+                except Exception as e:
+                    # Never mask the exception seeding may have raised
+                    self._write_seed_manifest(manifest)
+                    self.record_result(TestResult(
+                        test_name="Seed: Teardown",
+                        category="Database",
+                        status="ERROR",
+                        duration=0,
+                        details=(f"Teardown of {generator.batch} failed; remove it with "
+                                 f"--teardown-seed {self.config.seed_manifest_file}"),
+                        error=str(e)
+                    ))
+    
+    def _write_seed_manifest(self, manifest: Dict[str, Any]):
+        with open(self.config.seed_manifest_file, "w") as f:
+            json.dump(manifest, f)
+
+    def _seed_database(self):
+        """Open the MongoDB database seed_mode 'mongo' writes to"""
+        if pymongo is None:
+            raise ImportError("seed_mode 'mongo' requires pymongo")
+        client = pymongo.MongoClient(self.config.mongo_uri, serverSelectionTimeoutMS=5000)
+        return client, client.get_default_database(default="mewayz")
 
-    async def _test_concurrent_load(self):
-        """Test concurrent request handling"""
-        start_time = time.time()
+    async def seed_test_data(self, generator: SeedDataGenerator, manifest: Dict[str, Any]) -> bool:
+        """Load every SEED_KINDS kind, recording counts in `manifest` as it goes
         
-        # Create 20 concurrent requests
-        tasks = []
-        for _ in range(20):
-            task = self.make_request("GET", "/api/health")
-            tasks.append(task)
+        API seeding logs in as admin_email first, because only an admin can
+        delete the seeded customers, leads and orders again; without that
+        login nothing is created. Returns whether every kind reached seed_records.
+        """
+        count = self.config.seed_records
+        logger.info(f"🌱 Seeding {count} records per kind as {generator.batch} via {self.config.seed_mode}...")
+        user_id = await self._seed_user_id()
+        if user_id is None:
+            self.record_result(TestResult(
+                test_name="Seed: Owner",
+                category="Database",
+                status="FAIL",
+                duration=0,
+                details="Could not resolve the logged-in user from /api/v1/auth/me; seeded records need an owner",
+                endpoint="/api/v1/auth/me"
+            ))
+            return False
+        if self.config.seed_mode == "api" and not await self._admin_login():
+            self.record_result(TestResult(
+                test_name="Seed: Admin",
+                category="Database",
+                status="FAIL",
+                duration=0,
+                details=(f"Could not log in as {self.config.admin_email}; removing seeded customers, "
+                         "leads and orders needs an admin, so nothing was seeded"),
+                endpoint="/api/v1/auth/login"
+            ))
+            return False
         
+        client = database = None
+        if self.config.seed_mode == "mongo":
+            client, database = self._seed_database()
+        
+        manifest["started"] = True
         try:
-            results = await asyncio.gather(*tasks)
-            duration = time.time() - start_time
-            
-            successful = sum(1 for status, _ in results if status == 200)
+            category_ids = await self._seed_categories(generator, database, manifest)
+            if not category_ids:
+                self.record_result(TestResult(
+                    test_name="Seed: categories",
+                    category="Database",
+                    status="FAIL",
+                    duration=0,
+                    details="No Category ids to put products in: none found on existing products, "
+                            "and creating them needs pymongo and mongo_uri"
+                ))
+                return False
+            # Documents inserted with pymongo bypass Mongoose casting, so references must be ObjectIds
+            owner = ObjectId(user_id) if database is not None else user_id
             
-            if successful >= 18:  # Allow 2 failures out of 20
+            complete = True
+            references: Dict[str, List[Any]] = {}
+            for kind, spec in SEED_KINDS.items():
+                if kind == "products":
+                    records = generator.products(count, category_ids, owner)
+                elif kind == "orders":
+                    if not references.get("products") or not references.get("customers"):
+                        self.record_result(TestResult(
+                            test_name="Seed: orders",
+                            category="Database",
+                            status="FAIL",
+                            duration=0,
+                            details="Skipped - no seeded products or customers to order"
+                        ))
+                        complete = False
+                        continue
+                    records = generator.orders(count, references["products"], references["customers"])
+                else:
+                    records = getattr(generator, kind)(count, owner)
+                
+                start_time = time.perf_counter()
+                if database is not None:
+                    loaded, errors, ids = await self._seed_into_mongo(database[spec["collection"]], records,
+                                                                      generator.batch, manifest["counts"], kind)
+                else:
+                    loaded, errors, ids = await self._seed_via_api(spec["endpoint"], records,
+                                                                   manifest["counts"], kind)
+                duration = time.perf_counter() - start_time
+                references[kind] = ids
+                complete = complete and loaded >= count
+                
+                rate = loaded / duration if duration > 0 else 0.0
                 self.record_result(TestResult(
-                    test_name="Concurrent Load Test",
-                    category="Performance",
-                    status="PASS",
+                    test_name=f"Seed: {kind}",
+                    category="Database",
+                    status="PASS" if loaded == count else "FAIL",
                     duration=duration,
-                    details=f"{successful}/20 requests successful in {duration:.3f}s"
+                    details=f"{loaded}/{count} loaded ({rate:.0f} records/s), {errors} failed",
+                    endpoint=spec["endpoint"]
                 ))
+            return complete
+        finally:
+            if client is not None:
+                client.close()
+
+    async def _seed_user_id(self) -> Optional[str]:
+        """Id of the logged-in user, recorded as creator/createdBy of every seeded record"""
+        status, data = await self.make_request("GET", "/api/v1/auth/me")
+        body = data.get("data") if status == 200 and isinstance(data, dict) else None
+        user = body.get("user", body) if isinstance(body, dict) else None
+        return (user.get("id") or user.get("_id")) if isinstance(user, dict) else None
+
+    async def _admin_login(self) -> Optional[str]:
+        """Log in as admin_email once, keeping the token in admin_token"""
+        if not self.admin_token:
+            status, data = await self.make_request("POST", "/api/v1/auth/login", auth_token=None, json={
+                "email": self.config.admin_email,
+                "password": self.config.admin_password
+            })
+            if status == 200 and isinstance(data, dict) and data.get("token"):
+                self.admin_token = data["token"]
+        return self.admin_token
+
+    async def _seed_categories(self, generator: SeedDataGenerator, database,
+                               manifest: Dict[str, Any]) -> List[Any]:
+        """Category ids for seeded products
+        
+        In seed_mode 'mongo' the generator's categories are inserted into
+        SEED_CATEGORY_COLLECTION with the batch tag. The API has no category
+        endpoint, so API seeding reuses the categories of existing products
+        and only falls back to creating them in MongoDB when there are none.
+        """
+        if database is not None:
+            return await self._insert_seed_categories(generator, database)
+        
+        status, data = await self.make_request("GET", "/api/v1/products", params={"limit": 100})
+        products = data.get("data") if status == 200 and isinstance(data, dict) else None
+        category_ids: List[Any] = []
+        for product in products if isinstance(products, list) else []:
+            category = product.get("category") if isinstance(product, dict) else None
+            category_id = category.get("_id") if isinstance(category, dict) else category
+            if isinstance(category_id, str) and category_id not in category_ids:
+                category_ids.append(category_id)
+        if category_ids or pymongo is None:
+            return category_ids
+        
+        client, database = self._seed_database()
+        try:
+            category_ids = [str(category_id) for category_id in
+                            await self._insert_seed_categories(generator, database)]
+        finally:
+            client.close()
+        # Teardown has to remove these from MongoDB even though the rest went through the API
+        manifest["mongo_categories"] = True
+        return category_ids
+
+    async def _insert_seed_categories(self, generator: SeedDataGenerator, database) -> List[Any]:
+        now = datetime.now(timezone.utc)
+        documents = [dict(category, seedBatch=generator.batch, createdAt=now, updatedAt=now)
+                     for category in generator.categories()]
+        await asyncio.to_thread(database[SEED_CATEGORY_COLLECTION].insert_many, documents)
+        return [document["_id"] for document in documents]
+
+    async def _seed_via_api(self, endpoint: str, records: Iterator[Dict[str, Any]],
+                            counts: Dict[str, int], kind: str) -> Tuple[int, int, List[str]]:
+        """POST records with seed_concurrency requests in flight
+        
+        The API has no bulk endpoint, so every record is its own request.
+        Loading stops once seed_max_errors creates have failed. Returns the
+        number loaded, the number that failed and up to SEED_ID_POOL created ids.
+        """
+        loaded = errors = 0
+        ids: List[str] = []
+        in_flight = set()
+        
+        async def create(record: Dict[str, Any]):
+            nonlocal loaded, errors
+            status, data = await self.make_request("POST", endpoint, json=record)
+            created = data.get("data") if isinstance(data.get("data"), dict) else data
+            if status in (200, 201) and created.get("_id"):
+                loaded += 1
+                counts[kind] = loaded
+                if len(ids) < SEED_ID_POOL:
+                    ids.append(created["_id"])
             else:
+                errors += 1
+        
+        for record in records:
+            if errors >= self.config.seed_max_errors:
+                logger.warning(f"⚠️ Stopped seeding {endpoint} after {errors} failed creates")
+                break
+            while len(in_flight) >= self.config.seed_concurrency:
+                await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            task = asyncio.create_task(create(record))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        return loaded, errors, ids
+
+    async def _seed_into_mongo(self, collection, records: Iterator[Dict[str, Any]], batch: str,
+                               counts: Dict[str, int], kind: str) -> Tuple[int, int, List[Any]]:
+        """insert_many records in seed_batch_size chunks, seed_concurrency chunks at a time
+        
+        Documents are tagged with seedBatch for teardown. Returns the number
+        loaded, the number that failed and up to SEED_ID_POOL inserted ids.
+        """
+        loaded = errors = 0
+        ids: List[Any] = []
+        in_flight = set()
+        
+        async def insert(chunk: List[Dict[str, Any]]):
+            nonlocal loaded, errors
+            try:
+                await asyncio.to_thread(collection.insert_many, chunk, ordered=False)
+                inserted = len(chunk)
+            except pymongo.errors.BulkWriteError as e:
+                inserted = e.details.get("nInserted", 0)
+                errors += len(chunk) - inserted
+            except Exception as e:
+                logger.warning(f"⚠️ insert_many into {collection.name} failed: {e}")
+                inserted = 0
+                errors += len(chunk)
+            loaded += inserted
+            counts[kind] = loaded
+            if inserted == len(chunk) and len(ids) < SEED_ID_POOL:
+                # pymongo assigns _id to the documents before sending them
+                ids.extend(document["_id"] for document in chunk[:SEED_ID_POOL - len(ids)])
+        
+        while errors < self.config.seed_max_errors:
+            now = datetime.now(timezone.utc)
+            chunk = [dict(record, seedBatch=batch, createdAt=now, updatedAt=now)
+                     for record in islice(records, self.config.seed_batch_size)]
+            if not chunk:
+                break
+            while len(in_flight) >= self.config.seed_concurrency:
+                await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            task = asyncio.create_task(insert(chunk))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        return loaded, errors, ids
+
+    async def _benchmark_seeded_lists(self, manifest: Dict[str, Any]):
+        """Time every seeded list endpoint on its first and last page"""
+        limit = self.config.seed_page_size
+        benchmarks = {}
+        for kind, spec in SEED_KINDS.items():
+            seeded = manifest["counts"].get(kind, 0)
+            if not seeded:
+                continue
+            last_page = max(1, math.ceil(seeded / limit))
+            for label, page in (("first page", 1), ("last page", last_page)):
+                histogram = LatencyHistogram()
+                failures = 0
+                start_time = time.perf_counter()
+                for _ in range(self.config.performance_samples):
+                    sent = time.perf_counter()
+                    status, _ = await self.make_request("GET", spec["endpoint"],
+                                                        params={"page": page, "limit": limit}, body="none")
+                    histogram.record(time.perf_counter() - sent)
+                    if status != 200:
+                        failures += 1
+                
+                p99 = histogram.percentile(99)
+                benchmarks[f"{kind} {label}"] = {"page": page, "limit": limit, "failures": failures,
+                                                  **histogram.summary()}
+                self.record_result(TestResult(
+                    test_name=f"Seeded List: {kind} {label}",
+                    category="Performance",
+                    status="PASS" if not failures and p99 <= self.config.load_p99_threshold else "FAIL",
+                    duration=time.perf_counter() - start_time,
+                    details=(f"page {page} (limit {limit}) over {seeded} seeded, p50: {histogram.percentile(50):.3f}s, "
+                             f"p99: {p99:.3f}s, {failures}/{histogram.count} failed"),
+                    endpoint=spec["endpoint"],
+                    histogram=histogram
+                ))
+        manifest["list_benchmarks"] = benchmarks
+
+    async def teardown_seed_data(self, manifest: Dict[str, Any]):
+        """Remove a seeded batch by its marker, never by stored per-record ids
+        
+        MongoDB documents are deleted by their seedBatch tag. Through the API
+        every list endpoint is filtered down to the batch (SeedDataGenerator.
+        batch_filter) and the records it returns are deleted with the admin
+        token; without an admin login nothing is deleted at all.
+        """
+        logger.info(f"🧹 Removing seeded batch {manifest['batch']}...")
+        start_time = time.perf_counter()
+        removed: Dict[str, int] = {}
+        failed = 0
+        
+        token = None
+        if manifest["mode"] != "mongo":
+            # Deleting customers, leads and orders needs an admin or moderator
+            token = await self._admin_login()
+            if token is None:
                 self.record_result(TestResult(
-                    test_name="Concurrent Load Test",
-                    category="Performance", 
+                    test_name="Seed: Teardown",
+                    category="Database",
                     status="FAIL",
-                    duration=duration,
-                    details=f"Only {successful}/20 requests successful"
+                    duration=time.perf_counter() - start_time,
+                    details=(f"Could not log in as {self.config.admin_email}; nothing of {manifest['batch']} "
+                             "was removed"),
+                    endpoint="/api/v1/auth/login"
                 ))
-                
-        except Exception as e:
-            duration = time.time() - start_time
-            self.record_result(TestResult(
-                test_name="Concurrent Load Test",
-                category="Performance",
-                status="ERROR",
-                duration=duration,
-                details=f"Load test failed: {str(e)}",
-                error=str(e)
-            ))
+                return
+        
+        if manifest["mode"] == "mongo" or manifest.get("mongo_categories"):
+            collections = {"categories": SEED_CATEGORY_COLLECTION}
+            if manifest["mode"] == "mongo":
+                collections.update((kind, spec["collection"]) for kind, spec in SEED_KINDS.items())
+            client, database = self._seed_database()
+            try:
+                for kind, collection in collections.items():
+                    result = await asyncio.to_thread(database[collection].delete_many,
+                                                     {"seedBatch": manifest["batch"]})
+                    removed[kind] = result.deleted_count
+            finally:
+                client.close()
+        if token is not None:
+            generator = SeedDataGenerator(manifest["seed"])
+            # Orders go first so no order is left pointing at a deleted product
+            for kind in reversed(list(SEED_KINDS)):
+                deleted, errors = await self._delete_seed_batch(SEED_KINDS[kind]["endpoint"],
+                                                                generator.batch_filter(kind), token)
+                removed[kind] = deleted
+                failed += errors
+        
+        self.record_result(TestResult(
+            test_name="Seed: Teardown",
+            category="Database",
+            status="PASS" if not failed else "FAIL",
+            duration=time.perf_counter() - start_time,
+            details=(f"Removed {sum(removed.values())} records of {manifest['batch']} "
+                     f"({', '.join(f'{kind} {count}' for kind, count in removed.items()) or 'none'})"
+                     + (f", {failed} deletes failed" if failed else ""))
+        ))
+
+    async def _delete_seed_batch(self, endpoint: str, params: Dict[str, str], token: str) -> Tuple[int, int]:
+        """Delete everything the list filter `params` selects, one page at a time
+        
+        Deleted records drop out of the filter, so the first page is read
+        again until it comes back empty. A page with a failed delete (or a
+        failed listing) ends the loop, as it would be listed again forever.
+        Returns the number deleted and the number that failed.
+        """
+        deleted = failed = 0
+        semaphore = asyncio.Semaphore(self.config.seed_concurrency)
+        
+        async def delete(record_id: str) -> bool:
+            async with semaphore:
+                status, _ = await self.make_request("DELETE", f"{endpoint}/{record_id}", auth_token=token,
+                                                    body="none")
+            return status in (200, 204)
+        
+        while True:
+            status, data = await self.make_request("GET", endpoint, auth_token=token, params={
+                **params, "page": 1, "limit": self.config.seed_page_size, "select": "_id"})
+            records = data.get("data") if status == 200 and isinstance(data, dict) else None
+            if not isinstance(records, list):
+                logger.warning(f"⚠️ Listing seeded records of {endpoint} returned {status}")
+                return deleted, failed + 1
+            ids = [record["_id"] for record in records if isinstance(record, dict) and record.get("_id")]
+            if not ids:
+                return deleted, failed
+            outcomes = await asyncio.gather(*[delete(record_id) for record_id in ids])
+            deleted += sum(outcomes)
+            failed += len(outcomes) - sum(outcomes)
+            if not all(outcomes):
+                return deleted, failed
 
     # =========================================================================
     # SECURITY TESTING
@@ -736,9 +4350,6 @@ class ComprehensiveMEWAYZTester:
         
         # Test authentication bypass attempts
         await self._test_auth_bypass()
-        
-        # Test rate limiting
-        await self._test_rate_limiting()
 
     async def _test_sql_injection(self):
         """Test SQL injection protection"""
@@ -786,45 +4397,41 @@ class ComprehensiveMEWAYZTester:
 
     async def _test_auth_bypass(self):
         """Test authentication bypass attempts"""
-        # Test accessing protected endpoint without auth
-        old_token = self.auth_token
-        self.auth_token = None
-        
+        # Test accessing protected endpoint without auth. The token is
+        # overridden per request so concurrent phases keep the real one.
         result = await self.test_endpoint(
             "Unauthenticated Access Test",
             "GET",
             "/api/v1/analytics/dashboard",
-            expected_status=401  # Should be unauthorized
+            expected_status=401,  # Should be unauthorized
+            auth_token=None
         )
         self.record_result(result)
         
         # Test with invalid token
-        self.auth_token = "invalid_token_12345"
-        
         result = await self.test_endpoint(
             "Invalid Token Test",
             "GET", 
             "/api/v1/analytics/dashboard",
-            expected_status=401
+            expected_status=401,
+            auth_token="invalid_token_12345"
         )
         self.record_result(result)
-        
-        # Restore valid token
-        self.auth_token = old_token
 
-    async def _test_rate_limiting(self):
-        """Test rate limiting functionality"""
-        start_time = time.time()
+    async def test_rate_limiting(self):
+        """🚦 Test rate limiting functionality"""
+        logger.info("🚦 Testing Rate Limiting...")
+        start_time = time.perf_counter()
         
         # Make rapid requests to trigger rate limiting
         tasks = []
         for _ in range(200):  # Rapid fire requests
-            task = self.make_request("GET", "/api/health")
+            task = self.make_request("GET", "/api/health", body="none")
             tasks.append(task)
         
         try:
             results = await asyncio.gather(*tasks)
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             # Check if any requests were rate limited (429 status)
             rate_limited = sum(1 for status, _ in results if status == 429)
@@ -847,7 +4454,7 @@ class ComprehensiveMEWAYZTester:
                 ))
                 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.record_result(TestResult(
                 test_name="Rate Limiting Test",
                 category="Security",
@@ -870,6 +4477,10 @@ class ComprehensiveMEWAYZTester:
         
         # Test data consistency
         await self._test_data_consistency()
+        
+        # Validate every item of the large listings
+        for endpoint in ("/api/v1/products", "/api/v1/customers", "/api/v1/orders"):
+            await self._test_list_payload(endpoint)
 
     async def _test_invalid_data_handling(self):
         """Test handling of invalid data"""
@@ -927,12 +4538,18 @@ class ComprehensiveMEWAYZTester:
             # Verify it appears in listing
             await asyncio.sleep(0.5)  # Brief delay for database consistency
             
-            status, data = await self.make_request("GET", "/api/v1/products")
+            found = False
+            try:
+                async with self.stream_list("/api/v1/products") as (status, products):
+                    if status == 200:
+                        async for product in products:
+                            if isinstance(product, dict) and product.get('name') == product_data['name']:
+                                found = True
+                                break
+            except Exception:
+                status = 0
             
-            if status == 200 and data.get('data'):
-                products = data['data']
-                found = any(p.get('name') == product_data['name'] for p in products)
-                
+            if status == 200:
                 if found:
                     self.record_result(TestResult(
                         test_name="Data Consistency - Read",
@@ -950,6 +4567,55 @@ class ComprehensiveMEWAYZTester:
                         details="Created product not found in listing"
                     ))
 
+    async def _test_list_payload(self, endpoint: str):
+        """Stream a listing and check every item has a unique _id"""
+        start_time = time.perf_counter()
+        count = 0
+        missing_ids = 0
+        seen = set()
+        duplicates = 0
+        
+        try:
+            async with self.stream_list(endpoint) as (status, items):
+                if status == 200:
+                    async for item in items:
+                        count += 1
+                        item_id = item.get("_id") if isinstance(item, dict) else None
+                        if item_id is None:
+                            missing_ids += 1
+                        elif item_id in seen:
+                            duplicates += 1
+                        else:
+                            seen.add(item_id)
+        except Exception as e:
+            self.record_result(TestResult(
+                test_name=f"List Payload: {endpoint}",
+                category="Database",
+                status="ERROR",
+                duration=time.perf_counter() - start_time,
+                details=f"Streaming validation failed: {str(e)}",
+                endpoint=endpoint,
+                error=str(e)
+            ))
+            return
+        
+        duration = time.perf_counter() - start_time
+        if status != 200:
+            status_text, details = "FAIL", f"HTTP {status}"
+        elif missing_ids or duplicates:
+            status_text = "FAIL"
+            details = f"{count} items, {missing_ids} without _id, {duplicates} duplicate ids"
+        else:
+            status_text, details = "PASS", f"{count} items with unique ids"
+        self.record_result(TestResult(
+            test_name=f"List Payload: {endpoint}",
+            category="Database",
+            status=status_text,
+            duration=duration,
+            details=details,
+            endpoint=endpoint
+        ))
+
     # =========================================================================
     # MAIN TEST EXECUTION
     # =========================================================================
@@ -962,30 +4628,10 @@ class ComprehensiveMEWAYZTester:
         logger.info("=" * 80)
         
         try:
-            # Phase 1: Authentication
-            await self.test_authentication_system()
-            
-            # Phase 2: API Endpoints  
-            await self.test_all_api_endpoints()
-            
-            # Phase 3: CRUD Operations
-            await self.test_crud_operations()
-            
-            # Phase 4: WebSocket functionality
-            await self.test_websocket_functionality()
-            
-            # Phase 5: Frontend Pages
-            await self.test_frontend_pages()
-            
-            # Phase 6: Performance
-            await self.test_performance()
-            
-            # Phase 7: Security
-            await self.test_security_vulnerabilities()
-            
-            # Phase 8: Data Integrity
-            await self.test_data_integrity()
-            
+            dependencies = dict(PHASE_DEPENDENCIES)
+            if self.config.rate_limit_check:
+                dependencies["rate_limit"] = RATE_LIMIT_DEPENDENCIES
+            await self._run_phase_graph(dependencies)
         except KeyboardInterrupt:
             logger.warning("🛑 Testing interrupted by user")
         except Exception as e:
@@ -995,25 +4641,96 @@ class ComprehensiveMEWAYZTester:
         finally:
             await self.generate_report()
 
-    async def generate_report(self):
-        """📊 Generate comprehensive test report"""
-        total_time = time.time() - self.start_time
+    async def _run_phase_graph(self, dependencies: Dict[str, List[str]]):
+        """Run phases as soon as their dependencies finish, at most phase_concurrency at once
         
-        # Calculate statistics
-        total_tests = len(self.results)
-        passed = len([r for r in self.results if r.status == "PASS"])
-        failed = len([r for r in self.results if r.status == "FAIL"])
-        errors = len([r for r in self.results if r.status == "ERROR"])
-        skipped = len([r for r in self.results if r.status == "SKIP"])
+        A phase that raises is recorded as an ERROR; its dependents still run
+        and skip on their own when a fixture (such as the auth token) is missing.
+        """
+        unknown = {dep for deps in dependencies.values() for dep in deps} - set(dependencies)
+        if unknown:
+            raise ValueError(f"Unknown phase dependencies: {sorted(unknown)}")
         
-        pass_rate = (passed / total_tests * 100) if total_tests > 0 else 0
+        # Backend profiles cover the whole process, so profiled phases run alone
+        limit = 1 if self.config.profile_phases else max(1, self.config.phase_concurrency)
+        semaphore = asyncio.Semaphore(limit)
+        tasks: Dict[str, asyncio.Task] = {}
+        visiting = set()
+        
+        async def run(phase: str):
+            await asyncio.gather(*[tasks[dep] for dep in dependencies[phase]])
+            async with semaphore:
+                start_time = time.perf_counter()
+                try:
+                    await self._run_phase(phase)
+                except Exception as e:
+                    logger.error(f"💥 Phase {phase} failed: {str(e)}")
+                    self.record_result(TestResult(
+                        test_name=f"Phase: {phase}",
+                        category="Suite",
+                        status="ERROR",
+                        duration=time.perf_counter() - start_time,
+                        details=f"Phase raised: {str(e)}",
+                        error=traceback.format_exc()
+                    ))
+                else:
+                    logger.info(f"🏁 Phase {phase} finished in {time.perf_counter() - start_time:.2f}s")
         
-        # Group by category
+        def schedule(phase: str):
+            # Create dependency tasks first so every task only awaits existing ones
+            if phase in tasks:
+                return
+            if phase in visiting:
+                raise ValueError(f"Phase dependency cycle through {phase}")
+            visiting.add(phase)
+            for dep in dependencies[phase]:
+                schedule(dep)
+            tasks[phase] = asyncio.create_task(run(phase))
+        
+        try:
+            for phase in dependencies:
+                schedule(phase)
+        except ValueError:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def _run_phase(self, phase: str):
+        """Run one SUITE_PHASES entry, profiling the backend for it when profile_phases is set"""
+        async with self.cpu_profile(f"Phase: {phase}", enabled=self.config.profile_phases):
+            await getattr(self, SUITE_PHASES[phase])()
+
+    async def generate_report(self):
+        """📊 Generate comprehensive test report"""
+        total_time = time.perf_counter() - self.start_time
+        
+        # Calculate statistics in a single pass over the sink
+        counts = {"PASS": 0, "FAIL": 0, "ERROR": 0, "SKIP": 0}
         categories = {}
+        histogram_results = []
+        timed_results = []
         for result in self.results:
+            counts[result.status] = counts.get(result.status, 0) + 1
             if result.category not in categories:
                 categories[result.category] = {"pass": 0, "fail": 0, "error": 0, "skip": 0}
             categories[result.category][result.status.lower()] += 1
+            if result.histogram and result.histogram.count:
+                histogram_results.append(result)
+            if result.timing or result.phases:
+                timed_results.append(result)
+        
+        total_tests = sum(counts.values())
+        passed = counts["PASS"]
+        failed = counts["FAIL"]
+        errors = counts["ERROR"]
+        skipped = counts["SKIP"]
+        
+        pass_rate = (passed / total_tests * 100) if total_tests > 0 else 0
         
         # Generate report
         logger.info("=" * 80)
@@ -1037,11 +4754,63 @@ class ComprehensiveMEWAYZTester:
         
         logger.info("")
         
+        # Latency percentiles
+        if histogram_results:
+            logger.info("⏱️ Latency Percentiles (ms):")
+            logger.info(f"   {'Test':<48} {'count':>8} {'p50':>9} {'p90':>9} {'p99':>9} {'p99.9':>9} {'max':>9}")
+            for result in histogram_results:
+                h = result.histogram
+                logger.info(
+                    f"   {result.test_name[:48]:<48} {h.count:>8} "
+                    f"{h.percentile(50) * 1000:>9.2f} {h.percentile(90) * 1000:>9.2f} "
+                    f"{h.percentile(99) * 1000:>9.2f} {h.percentile(99.9) * 1000:>9.2f} {h.max * 1000:>9.2f}"
+                )
+            logger.info("")
+        
+        # Per-hop latency breakdown from Server-Timing
+        server_timed = [result for result in timed_results if result.timing]
+        if server_timed:
+            logger.info("🧩 Latency Breakdown (ms, from Server-Timing):")
+            logger.info(f"   {'Test':<48} {'network':>9} {'app':>9} {'mongo':>9} {'redis':>9}")
+            for result in server_timed:
+                t = result.timing
+                logger.info(f"   {result.test_name[:48]:<48} {t['network'] * 1000:>9.2f} {t['app'] * 1000:>9.2f} "
+                            f"{t['mongo'] * 1000:>9.2f} {t['redis'] * 1000:>9.2f}")
+            logger.info("")
+        
+        # Client-side request phases
+        phased = [result for result in timed_results if result.phases]
+        if phased:
+            logger.info("⏲️ Request Phases (ms, connect includes TLS):")
+            logger.info(f"   {'Test':<48} " + " ".join(f"{name:>8}" for name in REQUEST_PHASES))
+            for result in phased:
+                logger.info(f"   {result.test_name[:48]:<48} "
+                            + " ".join(f"{result.phases[name] * 1000:>8.3f}" for name in REQUEST_PHASES))
+            logger.info("")
+        
+        # Raw request samples
+        if len(self.samples):
+            logger.info(f"🧮 Request samples: {len(self.samples)} recorded in {self.samples.nbytes / 1024:.1f} KiB, "
+                        f"{len(self.failed_samples)} failed requests kept in detail")
+            logger.info("")
+        
+        # Backend CPU profiles
+        profiles = self.report_sections.get("cpu_profiles")
+        if profiles:
+            logger.info("🔥 Hottest backend functions (self time):")
+            for label, profile in profiles.items():
+                logger.info(f"   {label} ({profile['file']})")
+                for hot in profile["hottest"][:5]:
+                    location = f"{hot['url']}:{hot['line']}" if hot["url"] else "native"
+                    logger.info(f"      {hot['self_pct']:>6.2f}%  {hot['function']}  {location}")
+            logger.info("")
+        
         # Failed tests details
-        failed_tests = [r for r in self.results if r.status in ["FAIL", "ERROR"]]
-        if failed_tests:
+        if failed or errors:
             logger.info("❌ Failed Tests:")
-            for test in failed_tests:
+            for test in self.results:
+                if test.status not in ["FAIL", "ERROR"]:
+                    continue
                 logger.info(f"   • {test.test_name}: {test.details}")
                 if test.error:
                     logger.info(f"     Error: {test.error}")
@@ -1059,7 +4828,7 @@ class ComprehensiveMEWAYZTester:
         
         logger.info("=" * 80)
         
-        # Save detailed JSON report
+        # Save detailed JSON report, streaming the results array
         report_data = {
             "summary": {
                 "total_tests": total_tests,
@@ -1069,17 +4838,235 @@ class ComprehensiveMEWAYZTester:
                 "skipped": skipped,
                 "pass_rate": pass_rate,
                 "execution_time": total_time,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now().isoformat(),
+                "samples_recorded": len(self.samples)
             },
             "categories": categories,
-            "results": [asdict(r) for r in self.results]
+            "failed_samples": [result_to_dict(r) for r in self.failed_samples],
+            **self.report_sections
         }
         
         with open("comprehensive_test_report.json", "w") as f:
-            json.dump(report_data, f, indent=2)
+            f.write(json.dumps(report_data, indent=2)[:-2] + ',\n  "results": [')
+            for index, result in enumerate(self.results):
+                f.write(("," if index else "") + "\n    " + json.dumps(result_to_dict(result)))
+            f.write("\n  ]\n}\n")
         
         logger.info("💾 Detailed report saved to: comprehensive_test_report.json")
 
+def merge_open_loop_stats(shards: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine raw open-loop statistics from several generators"""
+    merged = {"histograms": {}, "errors": {}, "rate_limited": {}, "client_errors": {}, "failures": [],
+              "requests": 0, "elapsed": 0.0}
+    for shard in shards:
+        for endpoint, histogram in shard["histograms"].items():
+            merged["histograms"].setdefault(endpoint, LatencyHistogram()).merge(histogram)
+        for endpoint, count in shard["errors"].items():
+            merged["errors"][endpoint] = merged["errors"].get(endpoint, 0) + count
+        for endpoint, count in shard.get("rate_limited", {}).items():
+            merged["rate_limited"][endpoint] = merged["rate_limited"].get(endpoint, 0) + count
+        for endpoint, count in shard.get("client_errors", {}).items():
+            merged["client_errors"][endpoint] = merged["client_errors"].get(endpoint, 0) + count
+        merged["failures"].extend(shard["failures"])
+        merged["requests"] += shard["requests"]
+        merged["elapsed"] = max(merged["elapsed"], shard["elapsed"])
+    return merged
+
+def _shard_endpoints(endpoints: List[str], index: int) -> List[str]:
+    """Rotate the endpoint list so shards do not all start on the same endpoint"""
+    offset = index % len(endpoints)
+    return endpoints[offset:] + endpoints[:offset]
+
+def _open_loop_worker(config: TestConfig, endpoints: List[str], index: int, workers: int) -> Dict[str, Any]:
+    """Worker process entry point for run_sharded_load"""
+    shard_endpoints = _shard_endpoints(endpoints, index)
+    
+    async def run():
+        async with ComprehensiveMEWAYZTester(config) as tester:
+            return await tester._run_open_loop(shard_endpoints, config.load_rps / workers, config.load_duration)
+    
+    return asyncio.run(run())
+
+# =============================================================================
+# DISTRIBUTED EXECUTION
+# =============================================================================
+#
+# Control channel: one newline-delimited JSON message per line over plain TCP.
+#
+#   coordinator -> agent   {"type": "configure", "config": {...}, "shard": i, "shards": n}
+#   agent -> coordinator   {"type": "ready", "agent": "host:pid"}
+#   coordinator -> agent   {"type": "run", "phase": "<SUITE_PHASES key>"}
+#   agent -> coordinator   {"type": "result", "result": {...}}     (streamed)
+#   agent -> coordinator   {"type": "load_stats", "stats": {...}}  (load phase)
+#   agent -> coordinator   {"type": "phase_done", "phase": "..."}
+#   coordinator -> agent   {"type": "shutdown"}
+#
+# The coordinator only sends the next "run" once every agent has reported
+# "phase_done", so all agents move through the phases in lockstep.
+
+async def _send_message(writer: asyncio.StreamWriter, message: Dict[str, Any]):
+    writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+
+async def _read_message(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    line = await reader.readline()
+    return json.loads(line) if line else None
+
+def _stats_to_dict(stats: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(stats, histograms={e: h.to_dict() for e, h in stats["histograms"].items()},
+                failures=[result_to_dict(r) for r in stats["failures"]])
+
+def _stats_from_dict(data: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(data, histograms={e: LatencyHistogram.from_dict(h) for e, h in data["histograms"].items()},
+                failures=[result_from_dict(r) for r in data["failures"]])
+
+class _AgentTester(ComprehensiveMEWAYZTester):
+    """Tester that streams every recorded result to the coordinator"""
+    
+    def __init__(self, config: TestConfig, writer: asyncio.StreamWriter, agent_id: str):
+        super().__init__(config)
+        self.writer = writer
+        self.agent_id = agent_id
+    
+    def record_result(self, result: TestResult):
+        super().record_result(result)
+        result.test_name = f"{result.test_name} @ {self.agent_id}"
+        self.writer.write(json.dumps({"type": "result", "result": result_to_dict(result)}).encode() + b"\n")
+
+async def _serve_coordinator(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Handle one coordinator session on an agent"""
+    agent_id = f"{socket.gethostname()}:{os.getpid()}"
+    message = await _read_message(reader)
+    if not message or message.get("type") != "configure":
+        writer.close()
+        return
+    
+    config = TestConfig(**message["config"])
+    shard, shards = message["shard"], message["shards"]
+    
+    # Results stream back to the coordinator rather than to a local file
+    config.results_file = None
+    
+    # Every agent generates its share of the load budget
+    config.load_endpoints = _shard_endpoints(config.load_endpoints or [e for _, _, e in API_ENDPOINTS], shard)
+    config.load_rps = config.load_rps / shards
+    logger.info(f"🛰️ Agent {agent_id} configured as shard {shard + 1}/{shards} against {config.base_url}")
+    
+    try:
+        async with _AgentTester(config, writer, agent_id) as tester:
+            await _send_message(writer, {"type": "ready", "agent": agent_id})
+            
+            while True:
+                message = await _read_message(reader)
+                if not message or message.get("type") == "shutdown":
+                    break
+                if message.get("type") != "run":
+                    continue
+                
+                phase = message["phase"]
+                if phase == "load":
+                    stats = await tester._run_open_loop(config.load_endpoints, config.load_rps,
+                                                        config.load_duration)
+                    await _send_message(writer, {"type": "load_stats", "stats": _stats_to_dict(stats)})
+                elif phase in SUITE_PHASES:
+                    try:
+                        await getattr(tester, SUITE_PHASES[phase])()
+                    except Exception as e:
+                        tester.record_result(TestResult(
+                            test_name=f"Phase: {phase}",
+                            category="Distributed",
+                            status="ERROR",
+                            duration=0,
+                            details=f"Phase failed on agent: {str(e)}",
+                            error=str(e)
+                        ))
+                
+                await _send_message(writer, {"type": "phase_done", "phase": phase})
+    finally:
+        writer.close()
+        logger.info(f"🛰️ Agent {agent_id} session finished")
+
+async def run_agent(host: str, port: int):
+    """🛰️ Serve coordinator sessions until interrupted"""
+    server = await asyncio.start_server(_serve_coordinator, host, port)
+    logger.info(f"🛰️ Load agent listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+class LoadCoordinator:
+    """
+    🛰️ Drives several remote agents through the suite phases in lockstep
+    
+    Results streamed back by the agents are recorded on a local tester so the
+    usual generate_report output covers the whole fleet. Open-loop load
+    statistics are merged the same way as the multi-process driver.
+    """
+    
+    def __init__(self, config: TestConfig, agents: List[Tuple[str, int]]):
+        self.config = config
+        self.agents = agents
+        self.tester = ComprehensiveMEWAYZTester(config)
+        self.connections: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+    
+    async def connect(self):
+        for index, (host, port) in enumerate(self.agents):
+            reader, writer = await asyncio.open_connection(host, port)
+            await _send_message(writer, {
+                "type": "configure",
+                "config": asdict(self.config),
+                "shard": index,
+                "shards": len(self.agents)
+            })
+            message = await _read_message(reader)
+            if not message or message.get("type") != "ready":
+                raise ConnectionError(f"Agent {host}:{port} did not become ready")
+            logger.info(f"🔗 Agent {message['agent']} ready ({host}:{port})")
+            self.connections.append((reader, writer))
+    
+    async def _collect_phase(self, reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+        """Record streamed results until the agent reports the phase done"""
+        stats = None
+        while True:
+            message = await _read_message(reader)
+            if message is None:
+                raise ConnectionError("Agent disconnected mid-phase")
+            if message["type"] == "result":
+                self.tester.record_result(result_from_dict(message["result"]))
+            elif message["type"] == "load_stats":
+                stats = _stats_from_dict(message["stats"])
+            elif message["type"] == "phase_done":
+                return stats
+    
+    async def run_phase(self, phase: str):
+        logger.info(f"🛰️ Running phase '{phase}' on {len(self.connections)} agents...")
+        for _, writer in self.connections:
+            await _send_message(writer, {"type": "run", "phase": phase})
+        shards = await asyncio.gather(*[self._collect_phase(reader) for reader, _ in self.connections])
+        
+        if phase == "load":
+            self.tester._record_open_loop(merge_open_loop_stats([s for s in shards if s]), self.config.load_rps)
+    
+    async def run(self, phases: List[str]):
+        try:
+            await self.connect()
+            for phase in phases:
+                await self.run_phase(phase)
+        except Exception as e:
+            logger.error(f"💥 Distributed run failed: {str(e)}")
+            logger.error(traceback.format_exc())
+        finally:
+            for _, writer in self.connections:
+                try:
+                    await _send_message(writer, {"type": "shutdown"})
+                    writer.close()
+                except ConnectionError:
+                    pass
+            await self.tester.generate_report()
+
+def _parse_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
 # ============================================================================= 
 # MAIN EXECUTION
 # =============================================================================
@@ -1089,10 +5076,151 @@ async def main():
     config = TestConfig()
     
     # Allow command line configuration
-    if len(sys.argv) > 1:
-        config.base_url = sys.argv[1]
-    if len(sys.argv) > 2:
-        config.frontend_url = sys.argv[2]
+    parser = argparse.ArgumentParser(description="MEWAYZ comprehensive testing suite")
+    parser.add_argument("base_url", nargs="?", default=config.base_url)
+    parser.add_argument("frontend_url", nargs="?", default=config.frontend_url)
+    parser.add_argument("--rps", type=float, default=config.load_rps,
+                        help="Target request rate for the open-loop load phase (0 disables it)")
+    parser.add_argument("--duration", type=float, default=config.load_duration,
+                        help="Duration of the open-loop load phase in seconds")
+    parser.add_argument("--endpoints", nargs="+", default=None,
+                        help="Endpoints to load (defaults to every API endpoint)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Shard the open-loop load phase across N processes (requires --rps)")
+    parser.add_argument("--saturation", action="store_true",
+                        help="Step load up against the ramp endpoints until they saturate (performance phase)")
+    parser.add_argument("--ramp-mode", choices=["concurrency", "rps"], default=config.ramp_mode,
+                        help="Whether the saturation ramp steps concurrency or request rate "
+                             "(run with the API rate limiter disabled; a 429 invalidates the ramp)")
+    parser.add_argument("--ramp-endpoints", nargs="+", default=config.ramp_endpoints,
+                        help="Endpoints the saturation ramp is run against")
+    parser.add_argument("--soak-duration", type=float, default=config.soak_duration,
+                        help="Run the soak workload for this many seconds instead of the full suite")
+    parser.add_argument("--soak-rps", type=float, default=config.soak_rps,
+                        help="Operation rate of the soak workload")
+    parser.add_argument("--soak-window", type=float, default=config.soak_window,
+                        help="Length of soak metric windows in seconds")
+    parser.add_argument("--backend-pid", type=int, default=None,
+                        help="PID of the backend process to sample RSS from during soak")
+    parser.add_argument("--scenario", nargs="?", const="", default=None, metavar="FILE",
+                        help="Run user journeys from a JSON/YAML scenario (built-in journeys without FILE)")
+    parser.add_argument("--virtual-users", type=int, default=config.virtual_users,
+                        help="Number of concurrent virtual users in scenario mode")
+    parser.add_argument("--scenario-duration", type=float, default=config.scenario_duration,
+                        help="How long virtual users run their journeys, in seconds")
+    parser.add_argument("--replay", metavar="LOG", default=None,
+                        help="Replay an Nginx/Express access log (plain or .gz) against the backend")
+    parser.add_argument("--replay-speed", type=float, default=config.replay_speed,
+                        help="Speed-up factor applied to the log's inter-arrival times")
+    parser.add_argument("--replay-afap", action="store_true",
+                        help="Replay as fast as possible instead of preserving timing")
+    parser.add_argument("--assets", action="store_true",
+                        help="Crawl frontend routes and compare asset weight against the baseline")
+    parser.add_argument("--asset-baseline", default=config.asset_baseline_file,
+                        help="JSON file holding per-route asset weights to compare against")
+    parser.add_argument("--asset-threshold", type=float, default=config.asset_js_growth_threshold,
+                        help="Allowed growth of a route's compressed JS over the baseline (0.1 = 10%%)")
+    parser.add_argument("--update-asset-baseline", action="store_true",
+                        help="Overwrite the asset baseline with this run's weights")
+    parser.add_argument("--connection-benchmark", action="store_true",
+                        help="Compare new-connection, keep-alive and HTTP/2 clients on the same endpoints")
+    parser.add_argument("--ws-fanout", type=int, metavar="N", default=0,
+                        help="Hold N concurrent WebSocket connections and measure ping and broadcast latency")
+    parser.add_argument("--ws-ramp-rate", type=float, default=config.ws_ramp_rate,
+                        help="WebSocket connections opened per second in fan-out mode")
+    parser.add_argument("--ws-throughput", action="store_true",
+                        help="Push room messages through WebSocket pairs and report delivery latency and loss")
+    parser.add_argument("--ws-pairs", type=int, default=config.ws_pairs,
+                        help="Sender/receiver WebSocket pairs in throughput mode")
+    parser.add_argument("--ws-rate", type=float, default=config.ws_message_rate,
+                        help="Message bursts sent per second by every throughput sender")
+    parser.add_argument("--ws-burst", type=int, default=config.ws_burst_size,
+                        help="Messages sent back to back in every throughput burst")
+    parser.add_argument("--ws-duration", type=float, default=config.ws_throughput_duration,
+                        help="Seconds every throughput sender keeps sending")
+    parser.add_argument("--seed", type=int, metavar="N", default=0,
+                        help="Seed N products, customers, leads and orders, benchmark the list endpoints, then remove them")
+    parser.add_argument("--seed-mode", choices=["api", "mongo"], default=config.seed_mode,
+                        help="Load seeded records through the API or straight into MongoDB with insert_many")
+    parser.add_argument("--seed-value", type=int, default=config.seed_value,
+                        help="Random seed of the generated records")
+    parser.add_argument("--mongo-uri", default=config.mongo_uri,
+                        help="MongoDB connection string for --seed-mode mongo")
+    parser.add_argument("--keep-seed", action="store_true",
+                        help="Keep the seeded records and write a manifest for --teardown-seed")
+    parser.add_argument("--teardown-seed", metavar="MANIFEST", default=None,
+                        help="Remove the records of a batch kept with --keep-seed")
+    parser.add_argument("--transport", choices=TRANSPORTS, default=config.transport,
+                        help="HTTP client backend for API requests (raw is a minimal asyncio HTTP/1.1 client)")
+    parser.add_argument("--connector-limit", type=int, default=config.connector_limit,
+                        help="Maximum open connections of the shared session")
+    parser.add_argument("--connector-limit-per-host", type=int, default=config.connector_limit_per_host,
+                        help="Maximum open connections per host of the shared session")
+    parser.add_argument("--profile-inspector", metavar="HOST:PORT", default=None,
+                        help="Capture backend CPU profiles through the Node inspector (node --inspect)")
+    parser.add_argument("--profile-admin", metavar="ENDPOINT", default=None,
+                        help="Capture backend CPU profiles through ENDPOINT/start and ENDPOINT/stop")
+    parser.add_argument("--profile-phases", action="store_true",
+                        help="Profile each suite phase instead of each performance endpoint")
+    parser.add_argument("--phase-concurrency", type=int, default=config.phase_concurrency,
+                        help="Suite phases run concurrently once their dependencies finish")
+    parser.add_argument("--rate-limit-check", action="store_true",
+                        help="Also send a burst of requests and check the API rate limiter answers 429")
+    parser.add_argument("--results-file", default=None,
+                        help="Stream results to this NDJSON file instead of holding them in memory")
+    parser.add_argument("--agent", metavar="HOST:PORT", default=None,
+                        help="Run as a load agent listening for a coordinator")
+    parser.add_argument("--coordinator", metavar="HOST:PORT", nargs="+", default=None,
+                        help="Coordinate the given agents instead of testing locally")
+    parser.add_argument("--phases", nargs="+",
+                        default=[p for p in SUITE_PHASES if p not in ("rate_limit", "load", "soak", "scenario", "assets", "connections", "ws_fanout", "ws_throughput", "seed")],
+                        choices=list(SUITE_PHASES),
+                        help="Phases the coordinator runs on every agent, in order")
+    args = parser.parse_args()
+    if args.workers > 1 and args.rps <= 0:
+        parser.error("--workers requires --rps")
+    
+    config.base_url = args.base_url
+    config.frontend_url = args.frontend_url
+    config.load_rps = args.rps
+    config.load_duration = args.duration
+    config.load_endpoints = args.endpoints
+    config.results_file = args.results_file
+    config.saturation_ramp = args.saturation
+    config.ramp_mode = args.ramp_mode
+    config.ramp_endpoints = args.ramp_endpoints
+    config.soak_duration = args.soak_duration
+    config.soak_rps = args.soak_rps
+    config.soak_window = args.soak_window
+    config.backend_pid = args.backend_pid
+    config.scenario_file = args.scenario or None
+    config.virtual_users = args.virtual_users
+    config.scenario_duration = args.scenario_duration
+    config.replay_speed = args.replay_speed
+    config.asset_baseline_file = args.asset_baseline
+    config.asset_js_growth_threshold = args.asset_threshold
+    config.update_asset_baseline = args.update_asset_baseline
+    config.transport = args.transport
+    config.profile_inspector = args.profile_inspector
+    config.profile_admin_endpoint = args.profile_admin
+    config.profile_phases = args.profile_phases
+    config.connector_limit = args.connector_limit
+    config.connector_limit_per_host = args.connector_limit_per_host
+    config.phase_concurrency = args.phase_concurrency
+    config.rate_limit_check = args.rate_limit_check
+    config.ws_ramp_rate = args.ws_ramp_rate
+    if args.ws_fanout:
+        config.ws_connections = args.ws_fanout
+    config.ws_pairs = args.ws_pairs
+    config.ws_message_rate = args.ws_rate
+    config.ws_burst_size = args.ws_burst
+    config.ws_throughput_duration = args.ws_duration
+    config.seed_mode = args.seed_mode
+    config.seed_value = args.seed_value
+    config.mongo_uri = args.mongo_uri
+    config.keep_seed = args.keep_seed
+    if args.seed:
+        config.seed_records = args.seed
     
     print("🧪 MEWAYZ COMPREHENSIVE TESTING SUITE 2025")
     print("=" * 60)
@@ -1100,8 +5228,55 @@ async def main():
     print("Testing every API, frontend route, and functionality")
     print("=" * 60)
     
+    if args.agent:
+        await run_agent(*_parse_address(args.agent))
+        return
+    if args.coordinator:
+        coordinator = LoadCoordinator(config, [_parse_address(a) for a in args.coordinator])
+        await coordinator.run(args.phases)
+        return
+    
     async with ComprehensiveMEWAYZTester(config) as tester:
-        await tester.run_all_tests()
+        if args.workers > 1:
+            await tester.run_sharded_load(args.workers)
+            await tester.generate_report()
+        elif config.soak_duration > 0:
+            await tester.test_authentication_system()
+            await tester.test_soak()
+            await tester.generate_report()
+        elif args.scenario is not None:
+            await tester.test_scenario()
+            await tester.generate_report()
+        elif args.replay:
+            await tester.test_log_replay(args.replay, afap=args.replay_afap)
+            await tester.generate_report()
+        elif args.assets or args.update_asset_baseline:
+            await tester.test_asset_weight()
+            await tester.generate_report()
+        elif args.connection_benchmark:
+            await tester.test_authentication_system()
+            await tester.test_connection_reuse()
+            await tester.generate_report()
+        elif args.ws_fanout:
+            await tester.test_authentication_system()
+            await tester.test_websocket_fanout()
+            await tester.generate_report()
+        elif args.ws_throughput:
+            await tester.test_authentication_system()
+            await tester.test_websocket_throughput()
+            await tester.generate_report()
+        elif args.seed:
+            await tester.test_authentication_system()
+            await tester.test_seeded_list_performance()
+            await tester.generate_report()
+        elif args.teardown_seed:
+            with open(args.teardown_seed) as f:
+                manifest = json.load(f)
+            await tester.test_authentication_system()
+            await tester.teardown_seed_data(manifest)
+            await tester.generate_report()
+        else:
+            await tester.run_all_tests()
 
 def signal_handler(signum, frame):
     """Handle interrupt signals gracefully"""
@@ -8,21 +8,48 @@ import requests
 import json
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from suite_helpers import NDJSONResultSink, timed_request
+
+# True once the load event handlers have returned. readyState is already
+# complete while they run, when loadEventEnd is still 0.
+LOAD_ENDED_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+return (nav ? nav.loadEventEnd : performance.timing.loadEventEnd) > 0;
+"""
+
+# Load time and bytes transferred (document + subresources) for the current page
+PAGE_LOAD_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+return {
+    load: nav ? nav.loadEventEnd : performance.timing.loadEventEnd - performance.timing.navigationStart,
+    bytes: (nav ? nav.transferSize : 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0)
+};
+"""
 
 class MEWAYZTestSuite:
-    def __init__(self, base_url="http://localhost:3000", api_url="http://localhost:5000"):
+    def __init__(self, base_url="http://localhost:3000", api_url="http://localhost:5000", results_file=None,
+                 http_workers=10):
         self.base_url = base_url
         self.api_url = api_url
+        self.http_workers = max(1, http_workers)
+        # One connection pool shared by the threads of the endpoint sweep
         self.session = requests.Session()
-        self.test_results = []
+        adapter = HTTPAdapter(pool_connections=self.http_workers, pool_maxsize=self.http_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.test_results = NDJSONResultSink(results_file) if results_file else []
         self.driver = None
+        self.page_cache = {}
         
     def setup_driver(self):
         """Setup Chrome WebDriver for frontend testing"""
@@ -165,20 +192,44 @@ class MEWAYZTestSuite:
         
         for page in pages:
             try:
-                self.driver.get(f"{self.base_url}{page}")
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
+                cold = self.load_page(page, cold=True)
+                warm = self.load_page(page)
+                self.page_cache[page] = {
+                    "cold_ms": cold["load"],
+                    "warm_ms": warm["load"],
+                    "delta_ms": cold["load"] - warm["load"],
+                    "cold_bytes": cold["bytes"],
+                    "warm_bytes": warm["bytes"]
+                }
                 
                 title = self.driver.title
                 if title and title != "404":
-                    self.log_test(f"Frontend Page - {page}", "PASS", f"Title: {title}")
+                    self.log_test(f"Frontend Page - {page}", "PASS",
+                                  f"Title: {title} (cold {cold['load']:.0f}ms/{cold['bytes'] / 1024:.1f}KB, "
+                                  f"warm {warm['load']:.0f}ms/{warm['bytes'] / 1024:.1f}KB)")
                 else:
                     self.log_test(f"Frontend Page - {page}", "FAIL", "Page not found or empty")
                     
             except Exception as e:
                 self.log_test(f"Frontend Page - {page}", "FAIL", f"Error: {e}")
 
+    def load_page(self, page, cold=False):
+        """Load a page and return its load time and transferred bytes
+        
+        A cold load first drops the browser cache, Cache Storage and service
+        workers so every asset is fetched again. The timings are read once the
+        load event has finished; TimeoutException if it has not within 10s.
+        """
+        if cold:
+            self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            self.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": self.base_url,
+                "storageTypes": "service_workers,cache_storage"
+            })
+        self.driver.get(f"{self.base_url}{page}")
+        WebDriverWait(self.driver, 10).until(lambda d: d.execute_script(LOAD_ENDED_SCRIPT))
+        return self.driver.execute_script(PAGE_LOAD_SCRIPT)
+
     def test_button_clicks(self):
         """Test button clicks on key pages"""
         try:
@@ -236,15 +287,19 @@ class MEWAYZTestSuite:
             "/api/v1/orders"
         ]
         
-        for endpoint in endpoints:
+        def check(endpoint):
             try:
-                response = self.session.get(f"{self.api_url}{endpoint}")
+                response = self.session.get(f"{self.api_url}{endpoint}", timeout=10)
                 if response.status_code in [200, 401, 403]:  # Acceptable responses
-                    self.log_test(f"API Endpoint - {endpoint}", "PASS", f"Status: {response.status_code}")
-                else:
-                    self.log_test(f"API Endpoint - {endpoint}", "FAIL", f"Status: {response.status_code}")
+                    return "PASS", f"Status: {response.status_code}"
+                return "FAIL", f"Status: {response.status_code}"
             except Exception as e:
-                self.log_test(f"API Endpoint - {endpoint}", "FAIL", f"Error: {e}")
+                return "FAIL", f"Error: {e}"
+        
+        # Requests run concurrently; results are logged in endpoint order
+        with ThreadPoolExecutor(max_workers=self.http_workers) as executor:
+            for endpoint, (status, details) in zip(endpoints, executor.map(check, endpoints)):
+                self.log_test(f"API Endpoint - {endpoint}", status, details)
 
     def test_database_connections(self):
         """Test database connections"""
@@ -273,21 +328,21 @@ class MEWAYZTestSuite:
     def test_performance(self):
         """Test performance metrics"""
         try:
-            start_time = time.time()
-            response = self.session.get(f"{self.base_url}")
-            load_time = time.time() - start_time
+            response, phases = timed_request("GET", f"{self.base_url}", session=self.session)
+            load_time = phases["total"]
+            breakdown = f"ttfb {phases['ttfb'] * 1000:.1f}ms, body {phases['body'] * 1000:.1f}ms"
             
             if load_time < 5.0:  # Acceptable load time
-                self.log_test("Performance - Page Load", "PASS", f"Load time: {load_time:.2f}s")
+                self.log_test("Performance - Page Load", "PASS", f"Load time: {load_time:.2f}s ({breakdown})")
             else:
-                self.log_test("Performance - Page Load", "FAIL", f"Slow load time: {load_time:.2f}s")
+                self.log_test("Performance - Page Load", "FAIL", f"Slow load time: {load_time:.2f}s ({breakdown})")
         except Exception as e:
             self.log_test("Performance - Page Load", "FAIL", f"Error: {e}")
 
     def generate_report(self):
         """Generate comprehensive test report"""
         total_tests = len(self.test_results)
-        passed_tests = len([r for r in self.test_results if r["status"] == "PASS"])
+        passed_tests = sum(1 for r in self.test_results if r["status"] == "PASS")
         failed_tests = total_tests - passed_tests
         
         report = {
@@ -298,12 +353,22 @@ class MEWAYZTestSuite:
                 "success_rate": (passed_tests / total_tests * 100) if total_tests > 0 else 0
             },
             "results": self.test_results,
+            "page_cache": self.page_cache,
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
         }
         
         # Save report to file
         with open("test_report.json", "w") as f:
-            json.dump(report, f, indent=2)
+            if isinstance(self.test_results, list):
+                json.dump(report, f, indent=2)
+            else:
+                # Stream results from the sink instead of loading them all
+                f.write('{\n  "summary": ' + json.dumps(report["summary"], indent=2).replace("\n", "\n  "))
+                f.write(',\n  "page_cache": ' + json.dumps(self.page_cache))
+                f.write(',\n  "timestamp": ' + json.dumps(report["timestamp"]) + ',\n  "results": [')
+                for index, result in enumerate(self.test_results):
+                    f.write(("," if index else "") + "\n    " + json.dumps(result))
+                f.write("\n  ]\n}\n")
         
         # Print summary
         print("\n" + "="*60)
@@ -315,6 +380,13 @@ class MEWAYZTestSuite:
         print(f"Success Rate: {report['summary']['success_rate']:.1f}%")
         print("="*60)
         
+        if self.page_cache:
+            print("\nCOLD VS WARM PAGE LOADS:")
+            print(f"{'Page':<34} {'cold ms':>8} {'warm ms':>8} {'cold KB':>8} {'warm KB':>8}")
+            for page, cache in self.page_cache.items():
+                print(f"{page[:34]:<34} {cache['cold_ms']:>8.0f} {cache['warm_ms']:>8.0f} "
+                      f"{cache['cold_bytes'] / 1024:>8.1f} {cache['warm_bytes'] / 1024:>8.1f}")
+        
         if failed_tests > 0:
             print("\nFAILED TESTS:")
             for result in self.test_results:
@@ -361,6 +433,8 @@ class MEWAYZTestSuite:
         
         # Generate report
         self.generate_report()
+        if isinstance(self.test_results, NDJSONResultSink):
+            self.test_results.close()
 
 def main():
     """Main function"""
@@ -372,9 +446,10 @@ def main():
         base_url = sys.argv[1]
     if len(sys.argv) > 2:
         api_url = sys.argv[2]
+    results_file = sys.argv[3] if len(sys.argv) > 3 else None
     
     # Run test suite
-    test_suite = MEWAYZTestSuite(base_url, api_url)
+    test_suite = MEWAYZTestSuite(base_url, api_url, results_file)
     test_suite.run_all_tests()
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+MEWAYZ testing suites - shared helpers
+Utilities used by more than one of the testing scripts next to this file
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+
+import requests
+
+def timed_request(method, url, session=None, **kwargs):
+    """Send a request and split its latency into ttfb and body phases
+
+    response.elapsed runs from sending the request until the response
+    headers are parsed; the rest of the perf_counter_ns total is the body
+    download plus client overhead.
+    """
+    start = time.perf_counter_ns()
+    response = (session or requests).request(method, url, **kwargs)
+    total = (time.perf_counter_ns() - start) / 1e9
+    ttfb = response.elapsed.total_seconds()
+    return response, {"ttfb": ttfb, "body": max(total - ttfb, 0.0), "total": total}
+
+class ResultSink(ABC):
+    """Destination for recorded results, iterable in the order written"""
+
+    @abstractmethod
+    def write(self, record):
+        """Store one result"""
+
+    @abstractmethod
+    def __iter__(self):
+        """Yield every result written so far"""
+
+    def close(self):
+        pass
+
+class NDJSONResultSink(ResultSink):
+    """
+    Streams result records to a newline-delimited JSON file
+
+    Lines are buffered and flushed every `flush_every` records, so memory
+    stays bounded no matter how long a run is. Iterating re-reads the file
+    one line at a time. `encode` and `decode` convert records to and from
+    JSON-serializable values when they are not plain dicts. Writing after
+    close() raises ValueError instead of dropping the record.
+    """
+
+    def __init__(self, path, flush_every=1000, encode=None, decode=None):
+        self.path = path
+        self.flush_every = flush_every
+        self.encode = encode
+        self.decode = decode
+        self.count = 0
+        self._buffer = []
+        self._file = None
+
+    def write(self, record):
+        if self._file is not None and self._file.closed:
+            raise ValueError(f"write to closed result sink {self.path}")
+        self._buffer.append(json.dumps(self.encode(record) if self.encode else record))
+        self.count += 1
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    # The requests-based suites use the sink in place of a result list
+    append = write
+
+    def flush(self):
+        if self._file is None:
+            self._file = open(self.path, "w")
+        if self._file.closed:
+            return
+        if self._buffer:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+        self._file.flush()
+
+    def __iter__(self):
+        self.flush()
+        with open(self.path) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield self.decode(record) if self.decode else record
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self.flush()
+        self._file.close()
@@ -0,0 +1,203 @@
+"""Unit tests for the pure helpers of COMPREHENSIVE_TESTING_SUITE_2025"""
+
+import json
+import random
+
+import pytest
+
+import COMPREHENSIVE_TESTING_SUITE_2025 as suite
+from COMPREHENSIVE_TESTING_SUITE_2025 import (JSONArrayStream, LatencyHistogram, SampleStore, SeedDataGenerator,
+                                             parse_server_timing, revisit_headers)
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_bucket_precision(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.02)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.02)
+        assert histogram.percentile(100) == pytest.approx(1.0, rel=0.02)
+        assert histogram.mean == pytest.approx(0.5005, rel=0.001)
+        assert histogram.max == pytest.approx(1.0)
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(99) == 0.0
+        assert histogram.mean == 0.0
+        assert histogram.max == 0.0
+
+    def test_merge_equals_recording_into_one(self):
+        rng = random.Random(1)
+        values = [rng.expovariate(20) for _ in range(2000)]
+        whole, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for i, value in enumerate(values):
+            whole.record(value)
+            (first if i % 2 else second).record(value)
+        merged = first.merge(second)
+        assert merged.counts == whole.counts
+        assert merged.count == whole.count
+        assert (merged.min_us, merged.max_us) == (whole.min_us, whole.max_us)
+        for pct in (50, 90, 99, 99.9):
+            assert merged.percentile(pct) == whole.percentile(pct)
+
+    def test_merge_rejects_different_precision(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram(7).merge(LatencyHistogram(5))
+
+    def test_dict_round_trip(self):
+        histogram = LatencyHistogram()
+        for value in (0.001, 0.02, 0.3):
+            histogram.record(value)
+        restored = LatencyHistogram.from_dict(json.loads(json.dumps(histogram.to_dict())))
+        assert restored.summary() == histogram.summary()
+
+
+class TestJSONArrayStream:
+    DOCUMENT = {"success": True, "count": 3, "meta": {"data": "not this"},
+                "data": [{"_id": "a", "name": "x, [y]"}, {"_id": "b", "tags": ["}", "\\"]}, 7, "s\"q"],
+                "after": [1, 2]}
+
+    def feed_in_chunks(self, payload: bytes, sizes) -> list:
+        stream, items, pos = JSONArrayStream(), [], 0
+        for size in sizes:
+            items.extend(stream.feed(payload[pos:pos + size]))
+            pos += size
+        items.extend(stream.feed(payload[pos:]))
+        assert stream.done
+        return items
+
+    def test_whole_document(self):
+        payload = json.dumps(self.DOCUMENT).encode()
+        assert self.feed_in_chunks(payload, []) == self.DOCUMENT["data"]
+
+    def test_every_chunk_boundary(self):
+        payload = json.dumps(self.DOCUMENT).encode()
+        for cut in range(1, len(payload)):
+            assert self.feed_in_chunks(payload, [cut]) == self.DOCUMENT["data"], cut
+
+    def test_single_byte_chunks(self):
+        payload = json.dumps(self.DOCUMENT).encode()
+        assert self.feed_in_chunks(payload, [1] * len(payload)) == self.DOCUMENT["data"]
+
+    def test_top_level_array(self):
+        payload = json.dumps([{"a": 1}, [2, 3], "x"]).encode()
+        assert self.feed_in_chunks(payload, [3, 5]) == [{"a": 1}, [2, 3], "x"]
+
+    def test_missing_array_is_not_done(self):
+        stream = JSONArrayStream()
+        assert stream.feed(b'{"success": false, "error": "nope"}') == []
+        assert not stream.done
+
+
+class TestSampleStore:
+    @pytest.mark.parametrize("status", [200, 201, 204, 301, 304])
+    def test_success_statuses(self, status):
+        assert not SampleStore.is_error(status)
+
+    @pytest.mark.parametrize("status", [0, 400, 401, 403, 404, 429, 500, 503])
+    def test_error_statuses(self, status):
+        assert SampleStore.is_error(status)
+
+    def test_more_than_65535_distinct_endpoints(self):
+        samples = SampleStore()
+        for i in range(70000):
+            samples.append(float(i), f"/p/{i}", 200, 0.001, error=f"e{i}" if i >= 69990 else None)
+        last = list(samples)[-1]
+        assert last[1] == "/p/69999"
+        assert last[4] == "e69999"
+        assert len(samples.histograms()) == 70000
+
+    def test_rate_limited_requests_are_errors_and_counted(self):
+        samples = SampleStore()
+        for i in range(10):
+            samples.append(float(i), "/api/v1/products", 200 if i < 4 else 429, 0.01)
+        samples.append(10.0, "/api/health", 200, 0.01)
+        assert samples.error_counts() == {"/api/v1/products": 6, "/api/health": 0}
+        assert samples.rate_limited_counts() == {"/api/v1/products": 6, "/api/health": 0}
+        assert samples.rate_limited_counts(start=8) == {"/api/v1/products": 2, "/api/health": 0}
+
+    def test_merged_shards_keep_rate_limited_counts(self):
+        shard = {"histograms": {}, "errors": {"/a": 3}, "rate_limited": {"/a": 2},
+                 "failures": [], "requests": 5, "elapsed": 1.0}
+        merged = suite.merge_open_loop_stats([shard, dict(shard, elapsed=2.0)])
+        assert merged["errors"] == {"/a": 6}
+        assert merged["rate_limited"] == {"/a": 4}
+        assert merged["elapsed"] == 2.0
+
+
+class TestServerTiming:
+    def test_durations_by_metric(self):
+        assert parse_server_timing('db;dur=12.5, cache;desc="hit";dur=1, total;dur=20') == {
+            "db": 12.5, "cache": 1.0, "total": 20.0}
+
+    def test_repeated_metrics_add_up_and_missing_dur_is_zero(self):
+        assert parse_server_timing("DB;dur=2, db;dur=3, miss, ,") == {"db": 5.0, "miss": 0.0}
+
+    def test_breakdown_splits_network_and_app(self):
+        trace = suite.RequestTrace(total=0.05)
+        trace.record_response({"Server-Timing": "mongo;dur=10, redis;dur=5, total;dur=30"})
+        breakdown = trace.breakdown()
+        assert breakdown["network"] == pytest.approx(0.02)
+        assert breakdown["app"] + breakdown["mongo"] + breakdown["redis"] == pytest.approx(0.03)
+
+
+class TestRevisitHeaders:
+    def test_fresh_response_is_served_from_cache(self):
+        assert revisit_headers({"Cache-Control": "public, max-age=31536000", "ETag": '"a"'}) is None
+        assert revisit_headers({"Cache-Control": "immutable"}) is None
+
+    def test_stale_response_sends_validators(self):
+        headers = {"Cache-Control": "max-age=0", "ETag": '"a"', "Last-Modified": "Wed, 01 Oct 2025 00:00:00 GMT"}
+        assert revisit_headers(headers) == {"If-None-Match": '"a"',
+                                            "If-Modified-Since": "Wed, 01 Oct 2025 00:00:00 GMT"}
+
+    def test_no_cache_always_revalidates(self):
+        assert revisit_headers({"Cache-Control": "no-cache, max-age=600", "ETag": '"a"'}) == {"If-None-Match": '"a"'}
+
+    def test_no_store_refetches(self):
+        assert revisit_headers({"Cache-Control": "no-store", "ETag": '"a"'}) == {}
+
+    def test_missing_cache_control(self):
+        assert revisit_headers({}) == {}
+        assert revisit_headers({"Cache-Control": "max-age=abc", "ETag": '"a"'}) == {"If-None-Match": '"a"'}
+
+
+class TestSeedDataGenerator:
+    ADDRESS_FIELDS = ("firstName", "lastName", "address1", "city", "state", "zipCode", "country", "phone")
+
+    def test_records_are_deterministic(self):
+        first, second = SeedDataGenerator(7), SeedDataGenerator(7)
+        assert list(first.products(5, ["c1", "c2"], "u1")) == list(second.products(5, ["c1", "c2"], "u1"))
+        assert list(first.orders(5, ["p1"], ["k1"])) == list(second.orders(5, ["p1"], ["k1"]))
+
+    def test_payloads_carry_required_references(self):
+        generator = SeedDataGenerator(7)
+        for product in generator.products(20, ["c1", "c2"], "u1"):
+            assert product["category"] in ("c1", "c2")
+            assert product["creator"] == "u1"
+            assert product["sku"] and product["seo"]["slug"]
+        assert all(c["createdBy"] == "u1" for c in generator.customers(5, "u1"))
+        assert all(lead["createdBy"] == "u1" for lead in generator.leads(5, "u1"))
+
+    def test_orders_follow_the_order_model(self):
+        for order in SeedDataGenerator(7).orders(50, ["p1", "p2"], ["k1", "k2"]):
+            assert "totalAmount" not in order
+            assert order["customer"] in ("k1", "k2")
+            assert all(item["product"] in ("p1", "p2") and item["quantity"] >= 1 for item in order["items"])
+            totals = order["totals"]
+            assert totals["total"] == pytest.approx(totals["subtotal"] + totals["shipping"])
+            assert order["payment"]["method"] and order["payment"]["amount"] == totals["total"]
+            for part in ("shipping", "billing"):
+                assert all(order[part]["address"][field] for field in self.ADDRESS_FIELDS)
+
+    def test_batch_filter_selects_only_this_batch(self):
+        generator, other = SeedDataGenerator(7), SeedDataGenerator(70)
+        orders = generator.batch_filter("orders")
+        for order in generator.orders(20, ["p1"], ["k1"]):
+            assert orders["orderNumber[gte]"] <= order["orderNumber"] < orders["orderNumber[lt]"]
+        for order in other.orders(20, ["p1"], ["k1"]):
+            assert not orders["orderNumber[gte]"] <= order["orderNumber"] < orders["orderNumber[lt]"]
+        assert generator.batch_filter("customers") == {"tags": generator.batch}
+        assert generator.batch_filter("products") == {"search": f"^{generator.batch}$"}
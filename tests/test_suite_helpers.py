@@ -0,0 +1,89 @@
+"""Unit tests for suite_helpers, shared by the testing suites"""
+
+from datetime import timedelta
+
+import pytest
+
+from suite_helpers import NDJSONResultSink, ResultSink, timed_request
+
+
+class FakeResponse:
+    def __init__(self, elapsed):
+        self.elapsed = timedelta(seconds=elapsed)
+
+
+class FakeSession:
+    def __init__(self, elapsed):
+        self.elapsed = elapsed
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return FakeResponse(self.elapsed)
+
+
+class TestTimedRequest:
+    def test_splits_ttfb_and_body(self):
+        session = FakeSession(elapsed=0.0)
+        response, phases = timed_request("GET", "http://example.test/api", session=session, timeout=5)
+        assert isinstance(response, FakeResponse)
+        assert session.calls == [("GET", "http://example.test/api", {"timeout": 5})]
+        assert phases["ttfb"] == 0.0
+        assert phases["body"] == pytest.approx(phases["total"])
+        assert phases["total"] >= 0.0
+
+    def test_body_never_negative(self):
+        # response.elapsed can exceed the wall-clock total measured around the call
+        _, phases = timed_request("GET", "http://example.test/", session=FakeSession(elapsed=60.0))
+        assert phases["ttfb"] == 60.0
+        assert phases["body"] == 0.0
+
+
+class TestNDJSONResultSink:
+    def test_round_trip_and_len(self, tmp_path):
+        sink = NDJSONResultSink(str(tmp_path / "results.ndjson"), flush_every=2)
+        for i in range(5):
+            sink.append({"i": i})
+        assert len(sink) == 5
+        assert list(sink) == [{"i": i} for i in range(5)]
+        sink.close()
+        assert (tmp_path / "results.ndjson").read_text().count("\n") == 5
+
+    def test_buffers_until_flush_every(self, tmp_path):
+        path = tmp_path / "results.ndjson"
+        sink = NDJSONResultSink(str(path), flush_every=3)
+        sink.write({"i": 0})
+        sink.write({"i": 1})
+        assert not path.exists()
+        sink.write({"i": 2})
+        assert path.read_text().count("\n") == 3
+        sink.close()
+
+    def test_encode_and_decode(self, tmp_path):
+        sink = NDJSONResultSink(str(tmp_path / "results.ndjson"),
+                                encode=lambda pair: {"a": pair[0], "b": pair[1]},
+                                decode=lambda data: (data["a"], data["b"]))
+        sink.write((1, "x"))
+        assert list(sink) == [(1, "x")]
+        sink.close()
+
+    def test_close_without_records_creates_empty_file(self, tmp_path):
+        path = tmp_path / "results.ndjson"
+        sink = NDJSONResultSink(str(path))
+        sink.close()
+        sink.close()
+        assert path.read_text() == ""
+        assert list(sink) == []
+
+    def test_write_after_close_raises(self, tmp_path):
+        sink = NDJSONResultSink(str(tmp_path / "results.ndjson"))
+        sink.write({"i": 0})
+        sink.close()
+        with pytest.raises(ValueError):
+            sink.write({"i": 1})
+        assert list(sink) == [{"i": 0}]
+
+    def test_implements_result_sink(self, tmp_path):
+        assert isinstance(NDJSONResultSink(str(tmp_path / "results.ndjson")), ResultSink)
+        with pytest.raises(TypeError):
+            ResultSink()